@@ -1,3 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import timeit
+
+from http_lazy_headers import fields
+from http_lazy_headers import negotiation
+from http_lazy_headers.shared import bases
+from http_lazy_headers.shared.utils import checkers
+from http_lazy_headers.shared.utils import parsers
+
+
+_NUMBER = 100000
+_REPEAT = 5
+
+_INPUTS = (
+    ('short', 'gzip'),
+    ('medium', 'x-some-custom-token'),
+    ('long', 'x-some-custom-token-' * 10))
+
+
+def _best_of(func):
+    return min(timeit.repeat(
+        func, number=_NUMBER, repeat=_REPEAT))
+
+
+def _report(name, baseline, current):
+    print('{:<32}{:>10.4f}{:>10.4f}{:>9.2f}x'.format(
+        name, baseline, current, baseline / current))
+
+
+def _set_is_token(txt):
+    # Former ``checkers.is_token``
+    if not txt:
+        return False
+
+    if isinstance(txt, bytes):
+        return set(txt).issubset(_TOKEN_CODES)
+
+    return set(txt).issubset(checkers._TOKEN_CHARS)
+
+
+_TOKEN_CODES = frozenset(
+    ord(c)
+    for c in checkers._TOKEN_CHARS)
+
+_VALUE_CHARS = frozenset(
+    chr(cp)
+    for cp in (0x09, *range(0x20, 0x7F)))
+
+
+def _set_is_value(txt):
+    # Former ``bases.is_value``
+    return set(txt).issubset(_VALUE_CHARS)
+
+
+def bench_checkers():
+    """
+    Compare the translation tables validators\
+    against the ``set(txt).issubset`` they replace
+    """
+    print('{:<32}{:>10}{:>10}{:>10}'.format(
+        'checkers.is_token', 'set', 'table', 'speedup'))
+
+    for size, txt in _INPUTS:
+        b_txt = txt.encode('ascii')
+
+        _report(
+            '{} str ({} chars)'.format(size, len(txt)),
+            _best_of(lambda: _set_is_token(txt)),
+            _best_of(lambda: checkers.is_token(txt)))
+        _report(
+            '{} bytes ({} chars)'.format(size, len(txt)),
+            _best_of(lambda: _set_is_token(b_txt)),
+            _best_of(lambda: checkers.is_token(b_txt)))
+
+
+def bench_is_value():
+    print('{:<32}{:>10}{:>10}{:>10}'.format(
+        'bases.is_value', 'set', 'table', 'speedup'))
+
+    for size, txt in (
+            ('short', 'text/html'),
+            ('long', 'text/html,application/xhtml+xml,'
+                     'application/xml;q=0.9,*/*;q=0.8')):
+        _report(
+            '{} str ({} chars)'.format(size, len(txt)),
+            _best_of(lambda: _set_is_value(txt)),
+            _best_of(lambda: bases.is_value(txt)))
+
+
+def _loop_from_raw(raw_values, max_values, separator=','):
+    # Former ``parsers.from_raw``, a char by char loop
+    values = []
+    part = []
+    escape = False
+    quote_or_comment = False
+    quote_or_comment_char = ''
+
+    for char in raw_values:
+        if escape:
+            part.append(char)
+            escape = False
+            continue
+
+        if quote_or_comment:
+            if char == '\\':
+                escape = True
+            elif char == quote_or_comment_char:
+                quote_or_comment = False
+
+            part.append(char)
+            continue
+
+        if char in '"(':
+            quote_or_comment = True
+            quote_or_comment_char = '"' if char == '"' else ')'
+
+        if char == separator:
+            values.append(''.join(part).strip())
+            part = []
+
+            if len(values) >= max_values:
+                raise ValueError('Too many values')
+
+            continue
+
+        part.append(char)
+
+    values.append(''.join(part).strip())
+    return values
+
+
+def bench_from_raw():
+    print('{:<32}{:>10}{:>10}{:>10}'.format(
+        'parsers.from_raw', 'loop', 'scan', 'speedup'))
+
+    for name, txt, separator in (
+            ('plain', 'gzip, deflate, br', ','),
+            ('accept', 'text/html,application/xhtml+xml,'
+                       'application/xml;q=0.9,*/*;q=0.8', ','),
+            ('quoted', 'foo="a, b", bar, baz="x\\"y"', ','),
+            ('user-agent', 'Mozilla/5.0 (X11; Linux x86_64) '
+                           'AppleWebKit/537.36 (KHTML, like Gecko) '
+                           'Chrome/120.0 Safari/537.36', ' ')):
+        _report(
+            '{} ({} chars)'.format(name, len(txt)),
+            _best_of(lambda: _loop_from_raw(txt, 100, separator)),
+            _best_of(lambda: list(parsers.from_raw(txt, 100, separator))))
+
+
+def bench_negotiation():
+    print('{:<32}{:>10}{:>10}{:>10}'.format(
+        'negotiation', 'parse', 'memo', 'speedup'))
+
+    negotiator = negotiation.MediaTypeNegotiator([
+        'application/json',
+        'text/html',
+        'application/xml'])
+    txt = ('text/html,application/xhtml+xml,'
+           'application/xml;q=0.9,*/*;q=0.8')
+    _report(
+        'accept ({} chars)'.format(len(txt)),
+        _best_of(lambda: negotiator.best(
+            fields.Accept(raw_values_collection=[txt]).values())),
+        _best_of(lambda: negotiator.negotiate(txt)))
+
 
 if __name__ == '__main__':
-    pass
+    bench_checkers()
+    print()
+    bench_is_value()
+    print()
+    bench_from_raw()
+    print()
+    bench_negotiation()
@@ -2,6 +2,8 @@
 
 from .fields import *
 from .shared.parameters import ParamsCI
+from .shared.parse_cache import ParseCache
+from .shared.parse_cache import parse_cache
 from .shared.values.attributes import Attributes
 from .shared.values.cache import CacheOptions
 from .shared.values.charsets import Charsets
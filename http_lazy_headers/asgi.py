@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from . import parser
+
+
+def from_asgi(headers, schema=None):
+    """
+    Convert ASGI raw headers\
+    into lazy ``Headers``.
+
+    Usage::
+
+        from_asgi([
+            (b'content-length', b'100'),
+            (b'accept', b'text/html')])
+        # Headers((
+        #    ('Content-Length', '100'),
+        #    ('Accept', 'text/html')))
+
+    :param headers: Iterable of ``bytes``\
+    ``(name, value)``
+    :param schema: ``HeaderSchema`` or ``None``
+    :return: ``Headers`` collection
+    """
+    return parser.to_headers(headers, schema=schema)
+
+
+def from_scope(scope, schema=None):
+    """
+    Create lazy ``Headers`` out of\
+    the request headers in an ASGI\
+    HTTP connection scope
+
+    :param scope: ASGI scope
+    :param schema: ``HeaderSchema`` or ``None``
+    :return: ``Headers`` collection
+    """
+    return from_asgi(scope['headers'], schema=schema)
+
+
+def to_asgi(headers):
+    """
+    Convert ``Headers`` into ASGI\
+    compatible headers.
+
+    Usage::
+
+        to_asgi(
+            Headers([
+                ContentLength((100, )),
+                Accept(('text/html', ))]))
+        # [(b'content-length', b'100'), ...]
+
+    :param headers: ``Headers`` collection
+    :return: Headers list
+    """
+    return [
+        (header.name.encode('ascii'),
+         header.values_str().encode('latin1'))
+        for header in headers]
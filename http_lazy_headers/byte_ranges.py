@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+import binascii
+import os
+
+from . import exceptions
+from . import fields
+from . import preconditions
+from .fields import content_range
+from .settings import settings
+from .shared.values import media_types
+from .shared.values import ranges as ranges_options
+
+
+_B_CLRF = b'\r\n'
+
+
+def _resolve_one(start, end, length):
+    """
+    Return the ``(start, end)`` positions\
+    of a range within the length,\
+    or ``None`` if not satisfiable
+    """
+    if start is None:  # Suffix
+        if not end or not length:
+            return None
+
+        return max(0, length - end), length - 1
+
+    if start >= length:
+        return None
+
+    if end is None or end >= length:
+        end = length - 1
+
+    return start, end
+
+
+def resolve(
+        range_,
+        length,
+        if_range=None,
+        etag=None,
+        last_modified=None):
+    """
+    Resolve the ``Range`` header against\
+    the length of the representation,\
+    see RFC 7233.
+
+    The satisfiable ranges are sorted\
+    and the ones overlapping or adjacent\
+    are coalesced. The ``Range`` is\
+    ignored when it's invalid, not\
+    in bytes, has more than ``RANGES_MAX``\
+    ranges or more than ``RANGE_OVERLAPS_MAX``\
+    overlapping ranges, or when the\
+    ``If-Range`` does not match.
+
+    Usage::
+
+        resolve(headers.get(Range), 1000)
+        # ((0, 499), (900, 999))
+
+    :param range_: ``Range`` header or ``None``
+    :param length: Length of the representation
+    :param if_range: ``IfRange`` header or ``None``
+    :param etag: ``(etag, is_weak)`` of the\
+    representation or ``None``
+    :param last_modified: Last modification\
+    date of the representation or ``None``
+    :return: ``None`` to serve the full\
+    representation, an empty tuple when\
+    none is satisfiable (416) or a tuple\
+    of inclusive ``(start, end)`` positions
+    """
+    if range_ is None:
+        return None
+
+    try:
+        unit, sub_ranges = range_.values()[0]
+
+        if (if_range is not None and
+                not preconditions.if_range_matches(
+                    if_range, etag, last_modified)):
+            return None
+    except exceptions.HeaderError:
+        return None
+
+    if (unit != ranges_options.RangesOptions.bytes or
+            len(sub_ranges) > settings.RANGES_MAX):
+        return None
+
+    resolved = sorted(
+        r
+        for r in (
+            _resolve_one(start, end, length)
+            for start, end in sub_ranges)
+        if r is not None)
+    coalesced = []
+    overlaps = 0
+
+    for start, end in resolved:
+        if not coalesced or start > coalesced[-1][1] + 1:
+            coalesced.append((start, end))
+            continue
+
+        last_start, last_end = coalesced[-1]
+
+        if start <= last_end:
+            overlaps += 1
+
+        coalesced[-1] = (last_start, max(last_end, end))
+
+    if overlaps > settings.RANGE_OVERLAPS_MAX:
+        return None
+
+    return tuple(coalesced)
+
+
+def content_ranges(ranges, length):
+    """
+    Return the ``ContentRange``\
+    values of resolved ranges
+
+    :param ranges: Resolved ranges,\
+    see ``resolve``
+    :param length: Length of the representation
+    :return: ``tuple`` of values, a single\
+    unsatisfied one if there are no ranges
+    """
+    if not ranges:
+        return (content_range.content_range_bytes_unsatisfied(length), )
+
+    return tuple(
+        content_range.content_range_bytes(start, end, length)
+        for start, end in ranges)
+
+
+def make_boundary():
+    return binascii.hexlify(os.urandom(16)).decode('ascii')
+
+
+class MultipartByteRanges:
+    """
+    Body of a ``multipart/byteranges``\
+    response, for two or more ranges.
+
+    The parts are made of the part headers\
+    as ``bytes`` and the ``(offset, count)``\
+    of the ranges, so they can be sent\
+    by ``os.sendfile`` or sliced out of\
+    a ``mmap`` without copying.
+
+    Usage::
+
+        body = MultipartByteRanges(
+            ranges,
+            length,
+            content_type=ContentType([...]))
+        headers.set(body.content_type())
+        headers.set(ContentLength([body.content_length()]))
+
+        with open(path, 'rb') as fh:
+            for chunk in body.iter_file(fh):
+                write(chunk)
+
+    :param ranges: Resolved ranges,\
+    see ``resolve``
+    :param length: Length of the representation
+    :param content_type: ``ContentType``\
+    header of the representation or ``None``
+    :param boundary: Boundary ``str``, a\
+    random one is made if not given
+    """
+
+    __slots__ = (
+        'boundary',
+        '_parts')
+
+    def __init__(self, ranges, length, content_type=None, boundary=None):
+        assert ranges
+
+        self.boundary = boundary or make_boundary()
+
+        delimiter = b'--' + self.boundary.encode('ascii')
+        part_headers = []
+
+        if content_type is not None:
+            part_headers.append(bytes(content_type))
+
+        self._parts = []
+
+        for i, (start, end) in enumerate(ranges):
+            # The first delimiter has no line break
+            self._parts.append(b''.join((
+                _B_CLRF if i else b'',
+                delimiter,
+                _B_CLRF,
+                _B_CLRF.join(part_headers + [
+                    bytes(fields.ContentRange([
+                        content_range.content_range_bytes(
+                            start, end, length)]))]),
+                _B_CLRF,
+                _B_CLRF)))
+            self._parts.append((start, end - start + 1))
+
+        self._parts.append(b''.join((
+            _B_CLRF,
+            delimiter,
+            b'--',
+            _B_CLRF)))
+
+    def content_type(self):
+        """
+        Return the ``ContentType`` header\
+        of the response
+
+        :return: ``ContentType`` header
+        """
+        return fields.ContentType([
+            media_types.media_type(
+                media_types.MediaType.multipart,
+                media_types.MediaType.byteranges,
+                boundary=self.boundary)])
+
+    def content_length(self):
+        return sum(
+            len(part)
+            if isinstance(part, bytes)
+            else part[1]
+            for part in self._parts)
+
+    def parts(self):
+        """
+        Return the parts of the body
+
+        :return: ``bytes`` and ``(offset, count)``\
+        of the ranges
+        """
+        return tuple(self._parts)
+
+    def iter_file(self, file, chunk_size=64 * 1024):
+        """
+        Read the body out of a file
+
+        :param file: File opened in binary mode
+        :param chunk_size: Maximum size\
+        of the chunks read
+        :return: Iterator of ``bytes``
+        :raises exceptions.InternalError:\
+        If the file is shorter than the length
+        """
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+
+            offset, count = part
+            file.seek(offset)
+
+            while count:
+                chunk = file.read(min(count, chunk_size))
+
+                if not chunk:
+                    raise exceptions.InternalError(
+                        'File is shorter than expected')
+
+                count -= len(chunk)
+                yield chunk
+
+    def iter_buffer(self, buffer):
+        """
+        Slice the body out of a buffer\
+        (ie: a ``mmap``) without copying
+
+        :param buffer: Object supporting\
+        the buffer protocol
+        :return: Iterator of ``bytes``\
+        and ``memoryview``
+        """
+        view = memoryview(buffer)
+
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+
+            offset, count = part
+            yield view[offset:offset + count]
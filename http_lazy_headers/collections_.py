@@ -2,20 +2,70 @@
 
 import collections
 
+from . import fields
 from .shared import bases
 
 
 _CLRF = '\r\n'
+_B_CLRF = b'\r\n'
+
+
+def _status_line_buffers(status_line):
+    if status_line is None:
+        return []
+
+    if isinstance(status_line, str):
+        status_line = status_line.encode('latin1')
+
+    return [status_line, _B_CLRF]
+
+
+def name_of(key):
+    """
+    Return the header name of a lookup key
+
+    :param key: Field class, header\
+    instance or lower case header name
+    :return: Header name
+    """
+    if isinstance(key, str):
+        return key
+
+    assert (
+        isinstance(key, bases.HeaderBase) or
+        issubclass(key, bases.HeaderBase))
+    assert key.name is not None, (
+        'Custom headers must be '
+        'looked up by name')
+
+    return key.name
 
 
 class Headers:
     """
     Headers collection
+
+    Headers are looked up by their\
+    field class, an instance of it or\
+    their name in lower case.
+
+    Usage::
+
+        headers = Headers([Accept(...), Custom('x-foo', ...)])
+        headers[Accept]
+        headers.get(Accept.name)
+        'x-foo' in headers
+
+    :param headers: Iterable of headers
+    :param passthrough: Raw ``(name, raw_values)``\
+    headers kept as they are, see ``HeaderSchema``
     """
 
-    __slots__ = ('_headers',)
+    __slots__ = (
+        '_headers',
+        '_passthrough')
 
-    def __init__(self, headers=None):
+    def __init__(self, headers=None, passthrough=()):
         assert all(
             isinstance(h, bases.HeaderBase)
             for h in headers or ())
@@ -23,6 +73,7 @@ class Headers:
         self._headers = collections.OrderedDict(
             (h.name, h)
             for h in headers or ())
+        self._passthrough = passthrough
 
     def __repr__(self):
         return '{}({})'.format(
@@ -37,17 +88,13 @@ class Headers:
             _CLRF))
 
     def __contains__(self, key):
-        assert isinstance(key, bases.HeaderBase)
-
-        return key.name in self._headers
+        return name_of(key) in self._headers
 
     def __getitem__(self, key):
-        assert isinstance(key, bases.HeaderBase)
-
-        return self._headers[key.name]
+        return self._headers[name_of(key)]
 
     def __iter__(self):
-        return self._headers.values()
+        return iter(self._headers.values())
 
     def __len__(self):
         return len(self._headers)
@@ -58,30 +105,387 @@ class Headers:
     def fields(self):
         return self._headers.values()
 
-    def get(self, header, *args):
-        assert isinstance(header, bases.HeaderBase)
-
+    def get(self, key, *args):
         return self._headers.get(
-            header.name, *args)
+            name_of(key), *args)
+
+    def to_buffers(self, status_line=None):
+        """
+        Return the header block as a list\
+        of ``bytes``, ready to be written\
+        with ``socket.sendmsg`` or ``os.writev``.\
+        The block is the status line (if any),\
+        a ``name: value\\r\\n`` line per header\
+        and the final empty line.
+
+        The headers bytes are memoized,\
+        so no buffer is created for\
+        an already serialized header.
+
+        Usage::
+
+            headers.to_buffers('HTTP/1.1 200 OK')
+            # [b'HTTP/1.1 200 OK', b'\\r\\n',
+            #  b'content-length: 100', b'\\r\\n',
+            #  b'\\r\\n']
+
+        :param status_line: ``str`` or ``bytes``\
+        without line break
+        :return: List of ``bytes``
+        """
+        buffers = _status_line_buffers(status_line)
+
+        for header in self.fields():
+            buffers.append(bytes(header))
+            buffers.append(_B_CLRF)
+
+        buffers.append(_B_CLRF)
+        return buffers
+
+    def write_into(self, buffer, status_line=None):
+        """
+        Write the header block\
+        into a ``bytearray``
+
+        :param buffer: ``bytearray`` to extend
+        :param status_line: ``str`` or ``bytes``\
+        without line break
+        """
+        for b in self.to_buffers(status_line):
+            buffer += b
+
+    def to_bytes(self, status_line=None):
+        """
+        Return the header block
+
+        :param status_line: ``str`` or ``bytes``\
+        without line break
+        :return: ``bytes``
+        """
+        return b''.join(self.to_buffers(status_line))
+
+    def freeze(self):
+        """
+        Return a ``FrozenHeaders`` copy
+
+        :return: ``FrozenHeaders``
+        """
+        return FrozenHeaders(
+            self.fields(),
+            passthrough=self._passthrough)
+
+    def passthrough(self):
+        """
+        Return the headers that were\
+        not parsed, as raw ``(name, raw_values)``
+
+        :return: Sequence of raw headers
+        """
+        return self._passthrough
+
+
+class FrozenHeaders(Headers):
+    """
+    Immutable headers collection, meant\
+    for headers sent on every response.
+
+    The headers are checked and serialized\
+    on creation, and the header block\
+    is written as it was stored.
+
+    Usage::
+
+        STATIC_HEADERS = Headers([
+            Server(...),
+            Vary(...)]).freeze()
+        headers = HeadersMut([ContentLength(...)])
+        headers.merge(STATIC_HEADERS)
+        headers.to_bytes('HTTP/1.1 200 OK')
+    """
+
+    __slots__ = ('_block',)
+
+    def __init__(self, headers=None, passthrough=()):
+        super().__init__(headers, passthrough)
+
+        for header in self.fields():
+            header.check(header.values())
+
+        self._block = b''.join(
+            b''.join((bytes(header), _B_CLRF))
+            for header in self.fields())
+
+    def to_buffers(self, status_line=None):
+        buffers = _status_line_buffers(status_line)
+        buffers.append(self._block)
+        buffers.append(_B_CLRF)
+        return buffers
 
 
 class HeadersMut(Headers):
 
+    __slots__ = ('_frozen',)
+
+    def __init__(self, headers=None, passthrough=()):
+        super().__init__(headers, passthrough)
+
+        # Merged frozen headers with
+        # none of their headers replaced
+        self._frozen = []
+
     def set(self, header):
         assert isinstance(header, bases.HeaderBase)
 
+        self._thaw(header.name)
         self._headers[header.name] = header
 
-    def pop(self, header, default=None):
-        assert isinstance(header, bases.HeaderBase)
-
-        return self._headers.pop(
-            header.name, default)
+    def pop(self, key, default=None):
+        name = name_of(key)
+        self._thaw(name)
+        return self._headers.pop(name, default)
 
     def clear(self):
         self._headers.clear()
+        self._frozen = []
+
+    def merge(self, headers):
+        """
+        Set every header of a collection.
+
+        The block of ``FrozenHeaders``\
+        is written as it was stored,\
+        unless some of its headers\
+        are replaced or removed later.\
+        These blocks are written\
+        before the other headers.
+
+        :param headers: ``Headers`` collection
+        """
+        for header in headers:
+            self.set(header)
+
+        if (isinstance(headers, FrozenHeaders) and
+                headers not in self._frozen):
+            self._frozen.append(headers)
+
+    def _thaw(self, name):
+        if self._frozen:
+            self._frozen = [
+                frozen
+                for frozen in self._frozen
+                if name not in frozen._headers]
+
+    def to_buffers(self, status_line=None):
+        if not self._frozen:
+            return super().to_buffers(status_line)
+
+        buffers = _status_line_buffers(status_line)
+
+        for frozen in self._frozen:
+            buffers.append(frozen._block)
+
+        for header in self.fields():
+            if any(
+                    header.name in frozen._headers
+                    for frozen in self._frozen):
+                continue
+
+            buffers.append(bytes(header))
+            buffers.append(_B_CLRF)
+
+        buffers.append(_B_CLRF)
+        return buffers
 
     def frozen_copy(self):
-        headers = Headers()
+        headers = Headers(passthrough=self._passthrough)
         headers._headers = self._headers.copy()
         return headers
+
+
+def _make_slots():
+    slots = {}
+    slot = 0
+
+    for field_name in fields.__all__:
+        field = getattr(fields, field_name)
+
+        if field.name is None:  # Custom
+            continue
+
+        slots[field] = slot
+        slots[field.name] = slot
+        slot += 1
+
+    return slots, slot
+
+
+# Field class and name -> slot
+_SLOTS, _SLOTS_LEN = _make_slots()
+
+
+class SlotHeaders(Headers):
+    """
+    Headers collection that keeps every\
+    known header in a list, at the fixed\
+    slot of its field name. Only ``Custom``\
+    headers are kept in a dict.
+
+    Lookups by field class take a single\
+    dict lookup on the class (hashed by id)\
+    and a list indexing. A ``Custom`` header\
+    named as a known one takes its slot,\
+    so it replaces it, same as ``Headers``.\
+    The headers are iterated in insertion\
+    order, kept as a list of their slots\
+    and custom names.
+
+    Usage::
+
+        headers = SlotHeaders([Accept(...), Custom('x-foo', ...)])
+        headers[Accept]
+        headers.get('x-foo')
+    """
+
+    __slots__ = (
+        '_slots',
+        '_customs',
+        '_order')
+
+    def __init__(self, headers=None, passthrough=()):
+        assert all(
+            isinstance(h, bases.HeaderBase)
+            for h in headers or ())
+
+        self._slots = [None] * _SLOTS_LEN
+        self._customs = None
+        self._order = []
+        self._passthrough = passthrough
+
+        for header in headers or ():
+            self._set(header)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __getitem__(self, key):
+        header = self._find(key)
+
+        if header is None:
+            raise KeyError(key)
+
+        return header
+
+    def __iter__(self):
+        return iter(self.fields())
+
+    def __len__(self):
+        return len(self._order)
+
+    def __bool__(self):
+        return bool(self._order)
+
+    def fields(self):
+        slots = self._slots
+        customs = self._customs
+        return tuple(
+            slots[key]
+            if key.__class__ is int
+            else customs[key]
+            for key in self._order)
+
+    def get(self, key, default=None):
+        header = self._find(key)
+
+        if header is None:
+            return default
+
+        return header
+
+    def _find(self, key):
+        slot = _SLOTS.get(key)
+
+        if slot is not None:
+            return self._slots[slot]
+
+        if isinstance(key, bases.HeaderBase):
+            slot = _SLOTS.get(key.name)
+
+            if slot is not None:
+                return self._slots[slot]
+
+        if self._customs is None:
+            return None
+
+        return self._customs.get(name_of(key))
+
+    def _set(self, header):
+        slot = _SLOTS.get(header.name)
+
+        if slot is not None:
+            # Replacing keeps the position
+            if self._slots[slot] is None:
+                self._order.append(slot)
+
+            self._slots[slot] = header
+            return
+
+        if self._customs is None:
+            self._customs = {}
+
+        if header.name not in self._customs:
+            self._order.append(header.name)
+
+        self._customs[header.name] = header
+
+    def _remove(self, header):
+        slot = _SLOTS.get(header.name)
+
+        if slot is not None:
+            self._slots[slot] = None
+            self._order.remove(slot)
+        else:
+            del self._customs[header.name]
+            self._order.remove(header.name)
+
+
+class SlotHeadersMut(SlotHeaders):
+
+    __slots__ = ()
+
+    def set(self, header):
+        assert isinstance(header, bases.HeaderBase)
+
+        self._set(header)
+
+    def pop(self, key, default=None):
+        header = self._find(key)
+
+        if header is None:
+            return default
+
+        self._remove(header)
+        return header
+
+    def clear(self):
+        self._slots = [None] * _SLOTS_LEN
+        self._customs = None
+        self._order = []
+
+    def merge(self, headers):
+        """
+        Set every header of a collection
+
+        :param headers: ``Headers`` collection
+        """
+        for header in headers:
+            self._set(header)
+
+    def frozen_copy(self):
+        headers = SlotHeaders(passthrough=self._passthrough)
+        headers._slots = self._slots[:]
+        headers._order = self._order[:]
+
+        if self._customs is not None:
+            headers._customs = self._customs.copy()
+
+        return headers
@@ -23,6 +23,7 @@ class Age(bases.SingleHeaderBase):
     """
 
     name = 'age'
+    bytes_native = True
 
     def check_one(self, value):
         assertions.must_be_int(value)
@@ -31,6 +31,7 @@ class ContentLength(bases.HeaderBase):
     """
 
     name = 'content-length'
+    bytes_native = True
 
     def check(self, values):
         assertions.must_have_one_value(values)
@@ -275,7 +275,7 @@ class ContentRange(bases.SingleHeaderBase):
         if length is not None:
             length = cleaners.clean_number(
                 length,
-                max_chars=settings.CONTENT_MAX_CHARS)
+                max_chars=settings.RANGE_MAX_CHARS)
 
         if range_ == '*':
             return content_range_bytes_unsatisfied(length)
@@ -6,23 +6,6 @@ from .. import exceptions
 from ..shared import bases
 
 
-_B_TOKEN_CHARS = frozenset(
-    bytes(c, 'latin1')
-    for c in checkers._TOKEN_CHARS)
-
-
-def is_token(txt):
-    assert isinstance(txt, (str, bytes))
-
-    if not txt:
-        return False
-
-    if isinstance(txt, bytes):
-        return set(txt).issubset(_B_TOKEN_CHARS)
-    else:
-        return checkers.is_token(txt)
-
-
 class Custom(bases.HeaderBase):
     """
     The ``Custom`` header provides simple\
@@ -46,7 +29,7 @@ class Custom(bases.HeaderBase):
             values=values,
             raw_values_collection=raw_values_collection)
 
-        if not is_token(name):
+        if not checkers.is_token(name):
             raise exceptions.HeaderError(
                 'Header name must '
                 'be a valid token')
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from ..shared import bases
+from ..shared.common import dates
+from ..settings import settings
 
 
 class Date(bases.DateSomeBase):
@@ -14,7 +16,45 @@ class Date(bases.DateSomeBase):
             datetime.now()
         ])
 
+        Date.now()
+
     `Ref. <http://httpwg.org/specs/rfc7231.html#header.date>`_
     """
 
     name = 'date'
+
+    # The current second and its header,
+    # for each dates mode
+    _now = {
+        False: (None, None),
+        True: (None, None)}
+
+    @classmethod
+    def now(cls):
+        """
+        Return a ``Date`` header of the\
+        current time, from ``dates.clock``.\
+        The same header is returned within\
+        a second, its serialized forms\
+        are the ones of the clock
+
+        :return: ``Date`` header
+        """
+        clock_time = dates.clock.now()
+        as_epoch = bool(settings.DATES_AS_EPOCH)
+        seconds, header = cls._now[as_epoch]
+
+        if seconds != clock_time.seconds:
+            if as_epoch:
+                header = cls([clock_time.seconds])
+            else:
+                header = cls([clock_time.date_time])
+
+            # The clock formatted it already
+            header._values_str = clock_time.date_str
+            header._str = ': '.join((cls.name, clock_time.date_str))
+            header._bytes = b': '.join((
+                cls.name.encode('ascii'), clock_time.date_bytes))
+            cls._now[as_epoch] = (clock_time.seconds, header)
+
+        return header
@@ -43,6 +43,7 @@ class ETag(bases.SingleHeaderBase):
     # todo: match ala http://hyper.rs/hyper/v0.9.12/hyper/header/struct.EntityTag.html
 
     name = 'etag'
+    bytes_native = True
 
     def check_one(self, value):
         entity_tags.check_etag(value)
@@ -4,6 +4,7 @@ import datetime
 
 from ..shared.common import dates
 from ..shared import bases
+from ..settings import settings
 
 
 class Expires(bases.SingleHeaderBase):
@@ -38,14 +39,20 @@ class Expires(bases.SingleHeaderBase):
     def to_str(self, values):
         value = values[0]
 
-        if isinstance(value, datetime.datetime):
-            return dates.format_date(values[0])
+        if value != 0 and dates.is_date(value):
+            return dates.format_date(value)
 
         # Invalid date
         return str(value)
 
     def clean_one(self, raw_value):
         # Invalid dates are represented
-        # as a time in the past
+        # as a time in the past, or as
+        # zero in epoch mode, so "0"
+        # is serialized back
+        if settings.DATES_AS_EPOCH:
+            return dates.clean_date_time(
+                raw_value, as_epoch=True, default=0)
+
         return dates.clean_date_time(
             raw_value, default=datetime.datetime.min)
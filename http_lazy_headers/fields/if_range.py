@@ -54,25 +54,23 @@ class IfRange(bases.SingleHeaderBase):
     name = 'if-range'
 
     def check_one(self, value):
-        assertions.must_be_instance_of(
-            value, (tuple, datetime.datetime))
+        if not isinstance(value, tuple):
+            dates.check_date(value)
+            return
 
-        (isinstance(value, datetime.datetime) or
-         (entity_tags.check_etag(value)))
-
-        (isinstance(value, datetime.datetime) or
-         assertions.assertion(
-             not value[1],
-             '"{}" received, a strong e-tag '
-             'was expected'.format(value)))
+        entity_tags.check_etag(value)
+        assertions.assertion(
+            not value[1],
+            '"{}" received, a strong e-tag '
+            'was expected'.format(value))
 
     def to_str(self, values):
         value = values[0]
 
-        if isinstance(value, datetime.datetime):
-            return dates.format_date(value)
-        else:  # e-tag
+        if isinstance(value, tuple):  # e-tag
             return next(entity_tags.format_etags(values))
+        else:
+            return dates.format_date(value)
 
     def clean_one(self, raw_value):
         # Can't be weak
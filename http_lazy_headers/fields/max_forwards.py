@@ -25,6 +25,7 @@ class MaxForwards(bases.SingleHeaderBase):
     """
 
     name = 'max-forwards'
+    bytes_native = True
 
     def check_one(self, value):
         assertions.must_be_int(value)
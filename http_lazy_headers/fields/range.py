@@ -7,6 +7,7 @@ from ..shared.utils import assertions
 from ..shared.utils import constraints
 from ..shared.utils import checkers
 from ..shared.values import ranges
+from ..settings import settings
 
 
 def range_bytes(sub_ranges):
@@ -114,10 +115,13 @@ class Range(bases.SingleHeaderBase):
                 'more visible chars')
             return name, raw_range
 
-        # todo: setting.BYTES_RANGES_LIMIT
         ranges_ = tuple(
             cleaners.clean_bytes_range(r)
-            for r in raw_range.split(',', 20))
+            for r in raw_range.split(',', settings.RANGES_MAX))
+
+        constraints.constraint(
+            len(ranges_) <= settings.RANGES_MAX,
+            'Too many ranges')
 
         constraints.constraint(
             all(start is not None or
@@ -4,6 +4,7 @@ import datetime
 
 from ..shared.common import dates
 from ..shared.generic import cleaners
+from ..shared.utils import assertions
 from .. import exceptions
 from ..shared import bases
 
@@ -37,7 +38,7 @@ class RetryAfter(bases.SingleHeaderBase):
 
     def check_one(self, value):
         (isinstance(value, int) or
-         dates.check_date(value))
+         assertions.must_be_datetime(value))
 
     def to_str(self, values):
         value = values[0]
@@ -49,6 +50,8 @@ class RetryAfter(bases.SingleHeaderBase):
 
     def clean_one(self, raw_value):
         try:
-            return dates.clean_date_time(raw_value)
+            # An int is a delay here, so dates
+            # are never parsed as POSIX seconds
+            return dates.clean_date_time(raw_value, as_epoch=False)
         except exceptions.HeaderError:
             return cleaners.clean_delta_seconds(raw_value)
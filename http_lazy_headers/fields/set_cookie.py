@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import collections
+import datetime
 import encodings.idna
 
 from ..shared.common import cookies
@@ -12,6 +13,7 @@ from ..shared.utils import parsers
 from ..shared.utils import assertions
 from .. import exceptions
 from ..shared import bases
+from ..settings import settings
 
 
 # 0x20-0x7E (except ";")
@@ -19,6 +21,8 @@ _COOKIE_CHARS = (
     frozenset(ascii_tools.ascii_chars((0x20, 0x7E))) -
     frozenset(';'))
 
+_COOKIE_TABLE = ascii_tools.deletion_table(_COOKIE_CHARS)
+
 
 CookiePair = collections.namedtuple(
     'CookiePair',
@@ -69,6 +73,16 @@ def clean_expires(raw_expires):
     return dates.clean_date_time(raw_expires)
 
 
+def check_expires(expires):
+    # Cookies are made by hand, so a
+    # datetime is fine in epoch mode too
+    if (settings.DATES_AS_EPOCH and
+            isinstance(expires, datetime.datetime)):
+        return
+
+    dates.check_date(expires)
+
+
 def clean_max_age(raw_age):
     # http://httpwg.org/specs/rfc6265.html#max-age-attribute
 
@@ -87,14 +101,14 @@ def is_path(raw_path):
     if not raw_path.startswith('/'):
         return False
 
-    return set(raw_path).issubset(_COOKIE_CHARS)
+    return ascii_tools.is_made_of(raw_path, _COOKIE_TABLE)
 
 
 def is_extension(raw_extension):
     if not raw_extension:
         return False
 
-    return set(raw_extension).issubset(_COOKIE_CHARS)
+    return ascii_tools.is_made_of(raw_extension, _COOKIE_TABLE)
 
 
 def clean_path(raw_path):
@@ -207,7 +221,7 @@ class SetCookie(bases.HeaderBase):
 
     name = 'set-cookie'
 
-    def __str__(self):
+    def _field_str(self):
         # Support multi headers
         return '\r\n'.join(
             '{}: {}'.format(
@@ -225,7 +239,7 @@ class SetCookie(bases.HeaderBase):
                 c._fields == CookiePair._fields,
                 '"{}" received, a CookiePair '
                 'was expected'.format(c))
-            c.expires is None or dates.check_date(c.expires)
+            c.expires is None or check_expires(c.expires)
             c.max_age is None or assertions.must_be_int(c.max_age)
             c.domain is None or assertions.assertion(
                 isinstance(c.domain, str) and
@@ -166,6 +166,6 @@ class Warning(bases.MultiHeaderBase):
         text = parsers.dequote(text)
 
         if date is not None:
-            date = dates.clean_date_time(date[1:-1])
+            date = dates.clean_date_time(date[1:-1], as_epoch=False)
 
         return code, (host, pseudonym), text, date
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from .charsets import CharsetNegotiator
+from .encodings import EncodingNegotiator
+from .languages import LanguageMatcher
+from .media_types import MediaTypeNegotiator
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from ..shared import bases
+from ..shared.utils import lru_cache
+
+
+_MISSING = object()
+
+
+class NegotiatorBase:
+    """
+    Base of the negotiators. A negotiator\
+    is created once per endpoint out of\
+    the server offers, and it's shared\
+    by every request.
+
+    Decisions are memoized by the raw\
+    values of the header, so a known\
+    header costs a cache lookup.\
+    Headers created out of values\
+    (rather than raw values) are\
+    not memoized.
+
+    :param max_entries: Maximum number\
+    of memoized decisions
+    """
+
+    field = None
+
+    __slots__ = ('_cache',)
+
+    def __init__(self, max_entries=1024):
+        self._cache = lru_cache.LRUCache(max_entries=max_entries)
+
+    def negotiate(self, header):
+        """
+        Return the best offer for a header
+
+        :param header: Field instance, its\
+        raw value (``str`` or ``bytes``)\
+        or ``None`` if missing
+        :return: The best offer or\
+        ``None`` if none is acceptable
+        :raises exceptions.HeaderError:\
+        On malformed header
+        """
+        if header is None:
+            return self.default()
+
+        return self._memoized(self._cache, header, self.best)
+
+    def _memoized(self, cache, header, func, *args):
+        if not isinstance(header, bases.HeaderBase):
+            header = self.field(raw_values_collection=[header])
+
+        assert isinstance(header, self.field)
+
+        if header._raw_values_collection is None:
+            return func(header.values(), *args)
+
+        key = tuple(header._raw_values_collection)
+        result = cache.get(key, _MISSING)
+
+        if result is _MISSING:
+            result = func(header.values(), *args)
+            cache.set(key, result)
+
+        return result
+
+    def default(self):
+        """
+        Return the offer for a missing header
+
+        :return: The best offer or ``None``
+        """
+        raise NotImplementedError
+
+    def best(self, values):
+        """
+        Return the best offer for the header values
+
+        :param values: Header values
+        :return: The best offer or ``None``
+        """
+        raise NotImplementedError
+
+    def stats(self):
+        return self._cache.stats()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import codecs
+
+from .. import fields
+from ..shared.values import charsets
+from . import bases
+
+
+def _make_codecs():
+    codecs_ = {}
+
+    for charset, codec in charsets.CHARSET_CODECS.items():
+        codec_info = codecs.lookup(codec)
+
+        for name in (charset, ) + charsets.CHARSET_ALIASES[charset]:
+            codecs_[name.lower()] = codec_info
+
+    return codecs_
+
+
+# IANA charset or alias
+# in lower case -> codec
+_CODECS = _make_codecs()
+
+
+def lookup(charset):
+    """
+    Return the codec of a charset.\
+    IANA names and aliases are looked up\
+    in a precomputed table, other names\
+    are left to ``codecs.lookup``
+
+    :param charset: Charset name
+    :return: ``codecs.CodecInfo``\
+    or ``None`` if unknown
+    """
+    try:
+        return _CODECS[charset.lower()]
+    except KeyError:
+        pass
+
+    try:
+        return codecs.lookup(charset)
+    except LookupError:
+        return None
+
+
+class CharsetNegotiator(bases.NegotiatorBase):
+    """
+    Choose the charset of the response\
+    out of the ``Accept-Charset`` header.
+
+    Charsets are compared by codec, so\
+    ``utf8``, ``UTF-8`` and ``unicode-1-1-utf-8``\
+    are the same one. A charset of zero\
+    weight is not acceptable. The ``*``\
+    gives its weight to the charsets\
+    not listed. The offer with the highest\
+    weight wins, ties are broken by the\
+    order of the offers.
+
+    The codec of the offer is returned,\
+    so there is no need to look it up again.
+
+    Usage::
+
+        negotiator = CharsetNegotiator([
+            Charsets.utf_8,
+            Charsets.iso_8859_1])
+        codec = negotiator.negotiate('latin1, utf8;q=0.5')
+        # <codecs.CodecInfo object for encoding iso8859-1 ...>
+        negotiator.charset_of(codec)
+        # 'ISO-8859-1'
+        codec.encode('text')
+
+    :param offers: Charsets, in order of preference
+    :param max_entries: Maximum number\
+    of memoized decisions
+    """
+
+    field = fields.AcceptCharset
+
+    __slots__ = (
+        '_offers',
+        '_codecs',
+        '_charsets')
+
+    def __init__(self, offers, max_entries=1024):
+        super().__init__(max_entries=max_entries)
+
+        self._offers = tuple(offers)
+        self._codecs = tuple(
+            lookup(offer)
+            for offer in self._offers)
+
+        assert self._offers
+        assert None not in self._codecs, 'Unknown charset'
+
+        self._charsets = {}
+
+        for offer, codec in zip(self._offers, self._codecs):
+            self._charsets.setdefault(codec.name, offer)
+
+    def offers(self):
+        return self._offers
+
+    def charset_of(self, codec):
+        """
+        Return the offered charset of a codec
+
+        :param codec: ``codecs.CodecInfo``
+        :return: Charset name
+        """
+        return self._charsets[codec.name]
+
+    def default(self):
+        # No header means any charset
+        return self._codecs[0]
+
+    def best(self, values):
+        weights = {}
+        star = None
+
+        for charset, weight in values:
+            if weight is None:
+                weight = 1
+
+            if charset == '*':
+                if star is None:
+                    star = weight
+
+                continue
+
+            codec = lookup(charset)
+
+            if codec is not None:
+                weights.setdefault(codec.name, weight)
+
+        best_codec = None
+        best_weight = 0  # Zero q means not acceptable
+
+        for codec in self._codecs:
+            weight = weights.get(codec.name, star)
+
+            if weight is not None and weight > best_weight:
+                best_codec = codec
+                best_weight = weight
+
+        return best_codec
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+from .. import fields
+from ..shared.values import encodings
+from . import bases
+
+
+# Equivalent codings, see RFC 7230 section 4.2
+_ALIASES = {
+    encodings.Encodings.x_gzip: encodings.Encodings.gzip,
+    encodings.Encodings.x_compress: encodings.Encodings.compress}
+
+
+class EncodingNegotiator(bases.NegotiatorBase):
+    """
+    Choose the content-coding of the\
+    response out of the ``Accept-Encoding``\
+    header, see RFC 7231 section 5.3.4.
+
+    A coding of zero weight is not acceptable.\
+    The ``*`` gives its weight to the codings\
+    not listed. The offer with the highest\
+    weight wins, ties are broken by the order\
+    of the offers. The ``identity`` is chosen\
+    when no other offer is acceptable, unless\
+    it's excluded by ``identity;q=0`` or\
+    ``*;q=0``. An empty header means\
+    ``identity`` only.
+
+    Usage::
+
+        negotiator = EncodingNegotiator([
+            Encodings.br,
+            Encodings.gzip])
+        negotiator.negotiate('gzip, deflate, br')
+        # 'br'
+        negotiator.negotiate('br;q=0.5, gzip')
+        # 'gzip'
+        negotiator.negotiate('*;q=0')
+        # None
+
+    :param offers: Content-codings, in order\
+    of preference. The ``identity`` is\
+    added as the last one if missing
+    :param max_entries: Maximum number\
+    of memoized decisions
+    """
+
+    field = fields.AcceptEncoding
+
+    __slots__ = ('_offers',)
+
+    def __init__(self, offers, max_entries=1024):
+        super().__init__(max_entries=max_entries)
+
+        offers = [offer.lower() for offer in offers]
+
+        if encodings.Encodings.identity not in offers:
+            offers.append(encodings.Encodings.identity)
+
+        assert '*' not in offers
+
+        self._offers = tuple(offers)
+
+    def offers(self):
+        return self._offers
+
+    def default(self):
+        # No header means any coding, but the
+        # client may not decode any of them
+        return encodings.Encodings.identity
+
+    def best(self, values):
+        weights = {}
+        star = None
+
+        # Values are sorted by weight, so the
+        # highest is kept for repeated codings
+        for coding, weight in values:
+            if weight is None:
+                weight = 1
+
+            if coding == '*':
+                if star is None:
+                    star = weight
+
+                continue
+
+            weights.setdefault(_ALIASES.get(coding, coding), weight)
+
+        best_offer = None
+        best_weight = 0  # Zero q means not acceptable
+
+        for offer in self._offers:
+            weight = weights.get(offer, star)
+
+            if weight is not None and weight > best_weight:
+                best_offer = offer
+                best_weight = weight
+
+        if best_offer is not None:
+            return best_offer
+
+        identity = encodings.Encodings.identity
+
+        if weights.get(identity, star) == 0:
+            return None
+
+        return identity
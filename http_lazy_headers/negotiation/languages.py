@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+from .. import fields
+from ..shared.common import language_tags
+from ..shared.utils import lru_cache
+from . import bases
+
+
+def _sub_tags(language_tag):
+    return language_tags.format_language_tag(*language_tag).split('-')
+
+
+def _specificity(range_sub_tags):
+    if range_sub_tags == ['*']:
+        return 0
+
+    return len(range_sub_tags)
+
+
+def _extended_match(range_sub_tags, sub_tags):
+    """
+    Extended filtering of a tag
+
+    `Ref. <https://tools.ietf.org/html/rfc4647#section-3.3.2>`_
+    """
+    range_len = len(range_sub_tags)
+    tag_len = len(sub_tags)
+    r = 1
+    t = 1
+
+    while r < range_len:
+        range_sub_tag = range_sub_tags[r]
+
+        if range_sub_tag == '*':
+            r += 1
+            continue
+
+        if t >= tag_len:
+            return False
+
+        if range_sub_tag == sub_tags[t]:
+            r += 1
+            t += 1
+            continue
+
+        # Singletons can't be skipped
+        if len(sub_tags[t]) == 1:
+            return False
+
+        t += 1
+
+    return True
+
+
+class _Node:
+
+    __slots__ = (
+        'children',
+        'locale',
+        'locales')
+
+    def __init__(self):
+        self.children = {}
+        self.locale = None  # Locale ending at this node
+        self.locales = []  # Locales under this node
+
+
+class LanguageMatcher(bases.NegotiatorBase):
+    """
+    Match the ``Accept-Language`` header\
+    against the supported locales,\
+    see RFC 4647.
+
+    The locales are compiled into a trie\
+    of sub-tags. ``negotiate`` does a\
+    "lookup": the locale matching the\
+    language ranges by priority, truncating\
+    every range until a locale is found.\
+    ``filter`` returns every locale\
+    matching the ranges by priority,\
+    either by "basic" or "extended"\
+    filtering. Ranges of zero weight\
+    are not acceptable, and they filter\
+    out the locales they match more\
+    specifically than any other range.
+
+    Results are memoized by the\
+    raw value of the header.
+
+    Usage::
+
+        matcher = LanguageMatcher(['en', 'en-GB', 'de-Latn-DE'])
+        matcher.negotiate('en-gb-oxendict, de;q=0.5')
+        # 'en-GB'
+        matcher.filter('de-de, en;q=0.5', extended=True)
+        # ('de-Latn-DE', 'en', 'en-GB')
+
+    :param locales: Language tags of\
+    the supported locales, in order\
+    of preference
+    :param default: Locale to return\
+    when none is matched by a lookup.\
+    It's also returned when the header\
+    is missing, if given
+    :param max_entries: Maximum number\
+    of memoized results
+    """
+
+    field = fields.AcceptLanguage
+
+    __slots__ = (
+        '_locales',
+        '_sub_tags',
+        '_default',
+        '_root',
+        '_filter_caches')
+
+    def __init__(self, locales, default=None, max_entries=1024):
+        super().__init__(max_entries=max_entries)
+
+        self._locales = tuple(locales)
+
+        assert self._locales
+        assert default is None or default in self._locales
+
+        self._default = default
+        self._sub_tags = tuple(
+            _sub_tags(language_tags.clean_language_tag(locale))
+            for locale in self._locales)
+        self._root = _Node()
+        self._filter_caches = {
+            False: lru_cache.LRUCache(max_entries=max_entries),
+            True: lru_cache.LRUCache(max_entries=max_entries)}
+
+        for index, sub_tags in enumerate(self._sub_tags):
+            node = self._root
+            node.locales.append(index)
+
+            for sub_tag in sub_tags:
+                node = node.children.setdefault(sub_tag, _Node())
+                node.locales.append(index)
+
+            if node.locale is None:
+                node.locale = index
+
+    def locales(self):
+        return self._locales
+
+    def default(self):
+        # No header means any language
+        if self._default is not None:
+            return self._default
+
+        return self._locales[0]
+
+    def best(self, values):
+        """
+        Lookup the locale for the header values
+
+        `Ref. <https://tools.ietf.org/html/rfc4647#section-3.4>`_
+
+        :param values: ``AcceptLanguage`` values
+        :return: Locale or the default
+        """
+        for language_tag, weight in values:
+            if weight == 0:
+                continue
+
+            node = self._root
+            index = None
+
+            # The locale at the deepest node is the
+            # first one found by truncating the range.
+            # Truncating must not leave a singleton
+            for sub_tag in _sub_tags(language_tag):
+                node = node.children.get(sub_tag)
+
+                if node is None:
+                    break
+
+                if node.locale is not None and len(sub_tag) > 1:
+                    index = node.locale
+
+            if index is not None:
+                return self._locales[index]
+
+        return self._default
+
+    def filter(self, header, extended=False):
+        """
+        Return the locales matching\
+        the header, by priority
+
+        :param header: ``AcceptLanguage``, its\
+        raw value (``str`` or ``bytes``)\
+        or ``None`` if missing
+        :param extended: Use extended filtering,\
+        otherwise basic filtering
+        :return: ``tuple`` of locales
+        :raises exceptions.HeaderError:\
+        On malformed header
+        """
+        if header is None:
+            return self._locales
+
+        return self._memoized(
+            self._filter_caches[extended],
+            header,
+            self.filter_values,
+            extended)
+
+    def filter_values(self, values, extended=False):
+        """
+        Return the locales matching\
+        the header values, by priority
+
+        `Ref. <https://tools.ietf.org/html/rfc4647#section-3.3>`_
+
+        :param values: ``AcceptLanguage`` values
+        :param extended: Use extended filtering,\
+        otherwise basic filtering
+        :return: ``tuple`` of locales
+        """
+        ranges = tuple(
+            (_sub_tags(language_tag), weight)
+            for language_tag, weight in values)
+        excluded = tuple(
+            (_specificity(range_sub_tags), frozenset(
+                self._match(range_sub_tags, extended)))
+            for range_sub_tags, weight in ranges
+            if weight == 0)
+        seen = set()
+        locales = []
+
+        for range_sub_tags, weight in ranges:
+            if weight == 0:
+                continue
+
+            specificity = _specificity(range_sub_tags)
+
+            for index in self._match(range_sub_tags, extended):
+                if index in seen:
+                    continue
+
+                if any(
+                        excluded_specificity > specificity and
+                        index in excluded_indexes
+                        for excluded_specificity, excluded_indexes
+                        in excluded):
+                    continue
+
+                seen.add(index)
+                locales.append(self._locales[index])
+
+        return tuple(locales)
+
+    def _match(self, range_sub_tags, extended):
+        """
+        Return the indexes of the\
+        locales matching a range
+        """
+        first = range_sub_tags[0]
+
+        if first == '*':
+            node = self._root
+        else:
+            node = self._root.children.get(first)
+
+            if node is None:
+                return ()
+
+        if not extended:
+            if first == '*':
+                return node.locales
+
+            for sub_tag in range_sub_tags[1:]:
+                node = node.children.get(sub_tag)
+
+                if node is None:
+                    return ()
+
+            return node.locales
+
+        return tuple(
+            index
+            for index in node.locales
+            if _extended_match(range_sub_tags, self._sub_tags[index]))
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+from .. import fields
+from ..shared.common import media_ranges
+from . import bases
+
+
+def _param_value(param, value):
+    # Charsets are case-insensitive
+    if param == 'charset':
+        return value.lower()
+
+    return value
+
+
+def _range_params(params):
+    """
+    Return the media range params.\
+    The params after "q" are\
+    accept-ext and are ignored
+    """
+    range_params = []
+
+    for param, value in params.items():
+        if param == 'q':
+            break
+
+        range_params.append((param, _param_value(param, value)))
+
+    return tuple(range_params)
+
+
+class MediaTypeNegotiator(bases.NegotiatorBase):
+    """
+    Choose the media type of the response\
+    out of the ``Accept`` header.
+
+    The offers are compiled into lookup\
+    tables by type and subtype. The quality\
+    of every offer is the one of the most\
+    specific media range matching it\
+    (``text/html;level=1``, ``text/html``,\
+    ``text/*``, ``*/*``). The offer with\
+    the highest quality wins, ties are\
+    broken by the order of the offers.
+
+    Usage::
+
+        negotiator = MediaTypeNegotiator([
+            media_type(MediaType.application, MediaType.json),
+            media_type(MediaType.text, MediaType.html)])
+        negotiator.negotiate(
+            headers.get(Accept))
+        # (('text', 'html'), ParamsCI(()))
+
+    :param offers: Media types as\
+    ``((type, subtype), params)``\
+    or ``str``, in order of preference
+    :param max_entries: Maximum number\
+    of memoized decisions
+    """
+
+    field = fields.Accept
+
+    __slots__ = (
+        '_offers',
+        '_exact',
+        '_types',
+        '_all')
+
+    def __init__(self, offers, max_entries=1024):
+        super().__init__(max_entries=max_entries)
+
+        self._offers = tuple(
+            media_ranges.clean_media_type(offer)
+            if isinstance(offer, str)
+            else offer
+            for offer in offers)
+
+        assert self._offers
+
+        self._exact = {}
+        self._types = {}
+        self._all = []
+
+        for index, ((type_, subtype), params) in enumerate(self._offers):
+            type_ = type_.lower()
+            subtype = subtype.lower()
+
+            assert type_ != '*' and subtype != '*', (
+                'Offers must be media types, not ranges')
+
+            offer = (index, {
+                param: _param_value(param, value)
+                for param, value in params.items()})
+            self._exact.setdefault((type_, subtype), []).append(offer)
+            self._types.setdefault(type_, []).append(offer)
+            self._all.append(offer)
+
+    def offers(self):
+        return self._offers
+
+    def default(self):
+        # No header means any media type
+        return self._offers[0]
+
+    def best(self, values):
+        matches = {}
+
+        for (type_, subtype), params in values:
+            type_ = type_.lower()
+            subtype = subtype.lower()
+
+            if type_ == '*':
+                level = 0
+                candidates = self._all
+            elif subtype == '*':
+                level = 1
+                candidates = self._types.get(type_, ())
+            else:
+                level = 2
+                candidates = self._exact.get((type_, subtype), ())
+
+            range_params = _range_params(params)
+            specificity = (level, len(range_params))
+            quality = params.get('q', 1)
+
+            for index, offer_params in candidates:
+                if any(
+                        offer_params.get(param) != value
+                        for param, value in range_params):
+                    continue
+
+                match = matches.get(index)
+
+                if match is None or match[0] < specificity:
+                    matches[index] = (specificity, quality)
+
+        best_index = None
+        best_quality = 0  # Zero q means not acceptable
+
+        for index in sorted(matches):
+            _, quality = matches[index]
+
+            if quality > best_quality:
+                best_index = index
+                best_quality = quality
+
+        if best_index is None:
+            return None
+
+        return self._offers[best_index]
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import functools
+
+from . import fields
+from .collections_ import Headers
+
+
+def _name_variants(name):
+    """
+    Return the usual casings of a header name:\
+    lower case, canonical and upper case
+    """
+    canonical = '-'.join(
+        part.capitalize()
+        for part in name.split('-'))
+    names = {name, canonical, name.upper()}
+    return names | {n.encode('ascii') for n in names}
+
+
+def _make_registry():
+    registry = {}
+
+    for field_name in fields.__all__:
+        field = getattr(fields, field_name)
+
+        if field.name is None:  # Custom
+            continue
+
+        for name in _name_variants(field.name):
+            assert name not in registry
+            registry[name] = field
+
+    return registry
+
+
+# Header name -> field class
+_REGISTRY = _make_registry()
+
+
+def get_field(name):
+    """
+    Return the field class for a header name
+
+    Names in lower case, canonical case\
+    (ie: ``Content-Type``) or upper case\
+    are found without changing the name.
+
+    :param name: ``str`` or ``bytes`` header name
+    :return: Field class or ``None``\
+    for unknown headers
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        return _REGISTRY.get(name.lower())
+
+
+class HeaderSchema:
+    """
+    The headers an endpoint needs.
+
+    When building ``Headers`` with a\
+    schema, the headers outside of it\
+    are never made into fields. They are\
+    kept as raw ``(name, raw_values)``\
+    (see ``Headers.passthrough``),\
+    or dropped when ``passthrough``\
+    is ``False``.
+
+    The accepted names are computed once,\
+    so the schema should be created once\
+    and shared by every request.
+
+    Usage::
+
+        schema = HeaderSchema([Accept, ContentType], customs=['x-foo'])
+        headers = to_headers(raw_headers, schema=schema)
+        headers.passthrough()
+        # (('User-Agent', 'curl/7.0'), ...)
+
+    :param field_classes: Iterable of field classes
+    :param customs: Iterable of ``Custom``\
+    headers names in lower case
+    :param passthrough: Whether to keep the\
+    raw headers outside of the schema
+    """
+
+    __slots__ = (
+        'fields',
+        'customs',
+        'passthrough',
+        '_names')
+
+    def __init__(self, field_classes, customs=(), passthrough=True):
+        self.fields = frozenset(field_classes)
+        self.customs = frozenset(customs)
+        self.passthrough = passthrough
+
+        assert fields.Custom not in self.fields
+        assert all(
+            get_field(name) is None and
+            name == name.lower()
+            for name in self.customs)
+
+        self._names = {}
+
+        for field in self.fields:
+            for name in _name_variants(field.name):
+                self._names[name] = field
+
+        for name in self.customs:
+            for name_variant in _name_variants(name):
+                self._names[name_variant] = fields.Custom
+
+    def __contains__(self, field):
+        return field in self.fields
+
+    def get_field(self, name):
+        """
+        Return the field class for a header name
+
+        :param name: ``str`` or ``bytes`` header name
+        :return: Field class, ``Custom``\
+        or ``None`` for headers outside\
+        of the schema
+        """
+        try:
+            return self._names[name]
+        except KeyError:
+            return self._names.get(name.lower())
+
+
+def to_headers(raw_headers, schema=None):
+    """
+    Create lazy ``Headers`` out of\
+    raw ``(name, raw_values)`` pairs.
+
+    The values of repeated headers\
+    are merged in a single header.\
+    Unknown headers become ``Custom``.\
+    Headers outside of the ``schema``\
+    are passed through without parsing.
+
+    Usage::
+
+        to_headers([
+            ('Accept', 'text/html'),
+            ('X-Foo', 'bar'),
+            ('accept', 'application/json')])
+        # Headers(
+        #     Accept(raw_values_collection=[
+        #         'text/html', 'application/json']),
+        #     Custom(raw_values_collection=['bar']))
+
+    :param raw_headers: Iterable of\
+    ``(name, raw_values)``, either\
+    ``str`` or ``bytes``
+    :param schema: ``HeaderSchema`` or ``None``
+    :return: ``Headers`` collection
+    """
+    raw_fields = collections.OrderedDict()
+    passthrough = []
+
+    for name, raw_values in raw_headers:
+        if schema is None:
+            field = get_field(name)
+        else:
+            field = schema.get_field(name)
+
+            if field is None:
+                if schema.passthrough:
+                    passthrough.append((name, raw_values))
+
+                continue
+
+            if field is fields.Custom:
+                field = None
+
+        if field is None:
+            name = name.lower()
+            key = name
+        else:
+            key = field
+
+        try:
+            raw_fields[key][1].append(raw_values)
+        except KeyError:
+            if field is None:
+                field = functools.partial(fields.Custom, name)
+
+            raw_fields[key] = (field, [raw_values])
+
+    return Headers(
+        [field(raw_values_collection=raw_values_collection)
+         for field, raw_values_collection in raw_fields.values()],
+        passthrough=tuple(passthrough))
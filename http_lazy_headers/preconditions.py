@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+from . import exceptions
+from . import fields
+from .shared.common import dates
+from .shared.common import entity_tags
+from .shared.values import methods
+
+
+NOT_MODIFIED = 304
+PRECONDITION_FAILED = 412
+
+_ANY = ('*', False)
+
+_SAFE_METHODS = frozenset((
+    methods.Methods.get,
+    methods.Methods.head))
+
+
+def _epoch_of(header):
+    """
+    Return the date of a header as\
+    POSIX seconds, or ``None`` if it's\
+    not a valid HTTP-date, then it\
+    must be ignored
+    """
+    try:
+        return header.epoch()
+    except exceptions.HeaderError:
+        return None
+
+
+def _match(header, etag, exists, compare):
+    for value in header.values():
+        if value == _ANY:
+            return exists
+
+        if etag is not None and compare(value, etag):
+            return True
+
+    return False
+
+
+def evaluate_preconditions(
+        headers,
+        etag=None,
+        last_modified=None,
+        method=methods.Methods.get,
+        exists=True):
+    """
+    Evaluate the conditional headers of\
+    a request against the selected\
+    representation, see RFC 7232 section 6.
+
+    The headers are evaluated in order:\
+    ``If-Match``, ``If-Unmodified-Since``\
+    (when there is no ``If-Match``),\
+    ``If-None-Match`` and ``If-Modified-Since``\
+    (when there is no ``If-None-Match``).\
+    Only the headers needed are parsed,\
+    the evaluation stops at the first\
+    one that fails. ``If-Range`` is\
+    evaluated by ``is_range_fresh``\
+    once the request may proceed.
+
+    Usage::
+
+        status = evaluate_preconditions(
+            headers,
+            etag=entity_tag('xyzzy'),
+            last_modified=last_modified,
+            method=Methods.get)
+
+        if status is not None:
+            return Response(status=status)
+
+    :param headers: ``Headers`` collection
+    :param etag: ``(etag, is_weak)`` of the\
+    representation or ``None``
+    :param last_modified: Last modification\
+    date of the representation (``datetime``\
+    or POSIX seconds) or ``None``
+    :param method: Request method
+    :param exists: Whether there is a\
+    current representation
+    :return: ``None`` if the request\
+    may proceed, ``NOT_MODIFIED``\
+    or ``PRECONDITION_FAILED``
+    :raises exceptions.HeaderError:\
+    On malformed e-tags
+    """
+    if last_modified is not None:
+        last_modified = dates.to_epoch(last_modified)
+
+    if_match = headers.get(fields.IfMatch)
+
+    if if_match is not None:
+        if not _match(
+                if_match,
+                etag,
+                exists,
+                entity_tags.strong_compare):
+            return PRECONDITION_FAILED
+    elif last_modified is not None:
+        if_unmodified_since = headers.get(fields.IfUnmodifiedSince)
+
+        if if_unmodified_since is not None:
+            date = _epoch_of(if_unmodified_since)
+
+            if date is not None and last_modified > date:
+                return PRECONDITION_FAILED
+
+    if_none_match = headers.get(fields.IfNoneMatch)
+
+    if if_none_match is not None:
+        if _match(
+                if_none_match,
+                etag,
+                exists,
+                entity_tags.weak_compare):
+            if method in _SAFE_METHODS:
+                return NOT_MODIFIED
+
+            return PRECONDITION_FAILED
+    elif (last_modified is not None and
+            method in _SAFE_METHODS):
+        if_modified_since = headers.get(fields.IfModifiedSince)
+
+        if if_modified_since is not None:
+            date = _epoch_of(if_modified_since)
+
+            if date is not None and last_modified <= date:
+                return NOT_MODIFIED
+
+    return None
+
+
+def is_range_fresh(headers, etag=None, last_modified=None):
+    """
+    Evaluate the ``If-Range`` header,\
+    see RFC 7233 section 3.2.
+
+    The ``Range`` header must be ignored\
+    when the representation has changed.\
+    An e-tag is strongly compared and a\
+    date must be the exact last modification\
+    date. Invalid dates never match.
+
+    :param headers: ``Headers`` collection
+    :param etag: ``(etag, is_weak)`` of the\
+    representation or ``None``
+    :param last_modified: Last modification\
+    date of the representation (``datetime``\
+    or POSIX seconds) or ``None``
+    :return: Whether the ``Range``\
+    header may be served
+    """
+    if_range = headers.get(fields.IfRange)
+
+    if if_range is None:
+        return True
+
+    return if_range_matches(if_range, etag, last_modified)
+
+
+def if_range_matches(if_range, etag=None, last_modified=None):
+    """
+    Whether the ``If-Range`` matches\
+    the representation, see ``is_range_fresh``
+
+    :param if_range: ``IfRange`` header
+    :param etag: ``(etag, is_weak)`` of the\
+    representation or ``None``
+    :param last_modified: Last modification\
+    date of the representation (``datetime``\
+    or POSIX seconds) or ``None``
+    :return: Whether the ``Range``\
+    header may be served
+    """
+    value = if_range.values()[0]
+
+    if isinstance(value, tuple):  # e-tag
+        return (
+            etag is not None and
+            entity_tags.strong_compare(value, etag))
+
+    return (
+        last_modified is not None and
+        dates.to_epoch(value) == dates.to_epoch(last_modified))
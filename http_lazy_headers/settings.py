@@ -8,8 +8,13 @@ class Settings:
             header_values_max=25,
             value_params_max=25,
             header_max_len=4 * 1024,
+            headers_max_len=64 * 1024,
             content_max_size=1024 * 1024,
             host_unsafe_allow=False,
+            ranges_max=20,
+            range_overlaps_max=5,
+            range_max_chars=19,
+            dates_as_epoch=False,
             debug=True):
         # Maximum number of header values willing to parse
         self.HEADER_VALUES_MAX = header_values_max
@@ -22,6 +27,11 @@ class Settings:
         # request_line_max_len
         self.HEADER_MAX_LEN = header_max_len
 
+        # Maximum length for the whole
+        # header block, including the
+        # final empty line
+        self.HEADERS_MAX_LEN = headers_max_len
+
         # Maximum size in bytes for the body message/payload
         self.CONTENT_MAX_SIZE = content_max_size
         self.CONTENT_MAX_CHARS = len(str(content_max_size))
@@ -31,6 +41,26 @@ class Settings:
         # valid domains or IPs
         self.HOST_UNSAFE_ALLOW = host_unsafe_allow
 
+        # Maximum number of byte ranges
+        # willing to parse and serve
+        self.RANGES_MAX = ranges_max
+
+        # Maximum number of overlapping byte
+        # ranges willing to serve, the
+        # ``Range`` is ignored past it
+        self.RANGE_OVERLAPS_MAX = range_overlaps_max
+
+        # Maximum digits of a byte position,
+        # ranges are on the representation,
+        # so they are not bound by CONTENT_MAX_SIZE
+        self.RANGE_MAX_CHARS = range_max_chars
+
+        # Represent dates as ``int`` POSIX
+        # seconds instead of ``datetime``.
+        # Retry-After and Warning dates
+        # are always ``datetime``
+        self.DATES_AS_EPOCH = dates_as_epoch
+
         # Debug mode for logging and values checking
         self.DEBUG = debug
 
@@ -6,6 +6,7 @@ from .generic import formatters
 from .generic import cleaners
 from .generic import quality
 from .generic import preparers
+from .parse_cache import parse_cache
 from .utils import ascii_tools
 from .utils import parsers
 from .utils import constraints
@@ -16,19 +17,14 @@ from ..settings import settings
 
 
 # HTAB / SP / VCHAR
-_B_HEADER_VALUE_CHARS = frozenset(
-    ascii_tools.ascii_bytes(0x09, (0x20, 0x7E)))
-_U_HEADER_VALUE_CHARS = frozenset(
+_HEADER_VALUE_TABLE = ascii_tools.deletion_table(
     ascii_tools.ascii_chars(0x09, (0x20, 0x7E)))
 
 
 def is_value(raw_value):
     assert isinstance(raw_value, (str, bytes))
 
-    if isinstance(raw_value, bytes):
-        return set(raw_value).issubset(_B_HEADER_VALUE_CHARS)
-    else:
-        return set(raw_value).issubset(_U_HEADER_VALUE_CHARS)
+    return ascii_tools.is_made_of(raw_value, _HEADER_VALUE_TABLE)
 
 
 def decode_one(raw_values):
@@ -42,7 +38,13 @@ def decode_one(raw_values):
             'Value can\'t be decoded')
 
 
-def pre_clean(strings_collection):
+def pre_clean(strings_collection, decode=True):
+    """
+    Validate the raw values and decode\
+    them into ``str``, unless ``decode``\
+    is ``False``, then ``bytes`` values\
+    are yielded as they are
+    """
     total_len = 0
 
     for rvs in strings_collection:
@@ -56,16 +58,26 @@ def pre_clean(strings_collection):
             raise exceptions.BadRequest(
                 'Value chars are not valid')
 
-        yield decode_one(rvs)
+        if decode:
+            yield decode_one(rvs)
+        else:
+            yield rvs
 
 
 class HeaderBase:
 
     name = None
 
+    # Whether ``clean`` can take ``bytes``
+    # raw values, so they are not decoded
+    bytes_native = False
+
     __slots__ = (
         '_values',
-        '_raw_values_collection')
+        '_raw_values_collection',
+        '_values_str',
+        '_str',
+        '_bytes')
 
     def __init__(
             self,
@@ -90,6 +102,13 @@ class HeaderBase:
         self._values = values
         self._raw_values_collection = raw_values_collection
 
+        # Serialized forms, set on first use.
+        # The values never change, so
+        # they are formatted just once
+        self._values_str = None
+        self._str = None
+        self._bytes = None
+
     def __repr__(self):
         name = self.__class__.__name__
 
@@ -104,9 +123,33 @@ class HeaderBase:
         return '{}()'.format(name)
 
     def __str__(self):
+        if self._str is None:
+            self._str = self._field_str()
+
+        return self._str
+
+    def __bytes__(self):
+        if self._bytes is None:
+            self._bytes = str(self).encode('latin1')
+
+        return self._bytes
+
+    def _field_str(self):
         return ': '.join((
             self.name,
-            self.to_str(self.values())))
+            self.values_str()))
+
+    def values_str(self):
+        """
+        Return the formatted values,\
+        same as ``to_str(values())``
+
+        :return: ``str``
+        """
+        if self._values_str is None:
+            self._values_str = self.to_str(self.values())
+
+        return self._values_str
 
     def values(self):
         self.validate()
@@ -116,15 +159,30 @@ class HeaderBase:
         if self._raw_values_collection is None:
             return
 
+        is_cached = parse_cache.is_enabled(self.__class__)
+
+        if is_cached:
+            values = parse_cache.get_values(self)
+
+            if values is not None:
+                self._values = values
+                self._raw_values_collection = None
+                return
+
         try:
             self._values = self.clean(
                 self.prepare_raw(
-                    pre_clean(self._raw_values_collection)))
+                    pre_clean(
+                        self._raw_values_collection,
+                        decode=not self.bytes_native)))
         except exceptions.HeaderError as err:
             err.explanation = '{}: {}'.format(
                 self.name, err.explanation)
             raise
 
+        if is_cached:
+            parse_cache.set_values(self, self._values)
+
         self._raw_values_collection = None
 
     def check_one(self, value):
@@ -233,6 +291,15 @@ class DateSomeBase(SingleHeaderBase):
     def clean_one(self, raw_value):
         return dates.clean_date_time(raw_value)
 
+    def epoch(self):
+        """
+        Return the date as POSIX seconds,\
+        in either dates mode
+
+        :return: ``int``
+        """
+        return dates.to_epoch(self.values()[0])
+
 
 class IfMatchSomeBase(MultiHeaderBase):
     """
@@ -245,6 +312,8 @@ class IfMatchSomeBase(MultiHeaderBase):
 
     """
 
+    bytes_native = True
+
     def check_one(self, value):
         entity_tags.check_etag(value)
 
@@ -259,15 +328,18 @@ class IfMatchSomeBase(MultiHeaderBase):
     def clean_one(self, raw_value):
         # todo: validate is single value when value is "*"
 
-        if raw_value == '*':
-            return raw_value, False
+        if raw_value in ('*', b'*'):
+            return '*', False
 
         return entity_tags.clean_etag(raw_value)
 
     def match(self, etag, is_weak=False):
-        values = set(self.values())
-        return ((etag, is_weak) in values or
-                ('*', False) in values)
+        # There are a few values at most,
+        # so no need to build a set here
+        matches = ((etag, is_weak), ('*', False))
+        return any(
+            value in matches
+            for value in self.values())
 
 
 class AcceptSomeBase(HeaderBase):
@@ -41,12 +41,16 @@ _DOMAIN_CHARS = frozenset(
         0x2D,
         0x2E))
 
+_COOKIE_OCTET_TABLE = ascii_tools.deletion_table(_COOKIE_OCTET_CHARS)
+_COOKIE_TOKEN_TABLE = ascii_tools.deletion_table(_COOKIE_TOKEN_CHARS)
+_DOMAIN_TABLE = ascii_tools.deletion_table(_DOMAIN_CHARS)
+
 
 def is_cookie_octets(txt):
     if not txt:
         return False
 
-    return set(txt).issubset(_COOKIE_OCTET_CHARS)
+    return ascii_tools.is_made_of(txt, _COOKIE_OCTET_TABLE)
 
 
 def is_quoted_cookie_octets(txt):
@@ -66,7 +70,7 @@ def is_cookie_token(txt):
     if not txt:
         return False
 
-    return set(txt).issubset(_COOKIE_TOKEN_CHARS)
+    return ascii_tools.is_made_of(txt, _COOKIE_TOKEN_TABLE)
 
 
 def clean_cookie_pair(raw_cookie_pair):
@@ -116,7 +120,7 @@ def is_domain(txt):
     if txt[-1] in _DIGITS:
         return False
 
-    if not set(txt).issubset(_DOMAIN_CHARS):
+    if not ascii_tools.is_made_of(txt, _DOMAIN_TABLE):
         return False
 
     parts = txt.split('.', 128)
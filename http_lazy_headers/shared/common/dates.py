@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import calendar
+import collections
 import datetime
+import time
 
 from ..generic import cleaners
 from ..utils import constraints
 from ..utils import assertions
 from ... import exceptions
+from ...settings import settings
 
 
 _DAYS = (
@@ -25,20 +29,48 @@ _WEEK_DAYS_SHORT = {
     d[:3]: n
     for n, d in enumerate(_DAYS)}
 
-_WEEK_DAYS_SHORT_NUM = {
-    v: k
-    for k, v in _WEEK_DAYS_SHORT.items()}
-
 _MONTHS = {
     m: n + 1
     for n, m in enumerate((
         'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-        'Jul', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec'))}
+        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'))}
 
 _MONTHS_NUM = {
     v: k
     for k, v in _MONTHS.items()}
 
+# Indexed by week day and month number
+_WEEK_DAYS_SHORT_NAMES = tuple(
+    d[:3]
+    for d in _DAYS)
+_MONTHS_NAMES = (None,) + tuple(
+    _MONTHS_NUM[n]
+    for n in range(1, 13))
+
+_IMF_FIXDATE_FORMAT = '%s, %02d %s %04d %02d:%02d:%02d GMT'
+
+_MONTHS_DAYS = (None, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MONTHS_CUMULATIVE_DAYS = (None,) + tuple(
+    sum(_MONTHS_DAYS[1:n])
+    for n in range(1, 13))
+
+# Days from 0001-01-01 to 1970-01-01,
+# a Thursday (Monday is 0)
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_DAYS = _EPOCH.toordinal() - 1
+_EPOCH_WEEK_DAY = _EPOCH.weekday()
+
+_TWO_DIGITS = {
+    '%02d' % n: n
+    for n in range(100)}
+
+# Parsed IMF-fixdate values, these are
+# mostly our own Last-Modified values
+# sent back in conditional requests
+_IMF_FIXDATE_CACHE = {}
+_IMF_FIXDATE_EPOCH_CACHE = {}
+_IMF_FIXDATE_CACHE_MAX = 128
+
 _IMF_FIXDATE_LEN = len('Ddd, dd Mmm YYYY HH:MM:SS GMT')
 
 _RFC_850_DATE_MIN_LEN = (
@@ -68,7 +100,41 @@ def _clean_time(raw_time):
         cleaners.clean_number(ss))
 
 
-def _to_datetime(week_day, year, month, day, hh, mm, ss):
+def _to_epoch(week_day, year, month, day, hh, mm, ss):
+    is_leap = (
+        year % 4 == 0 and
+        (year % 100 != 0 or year % 400 == 0))
+
+    constraints.constraint(
+        1 <= year and
+        1 <= day <= _MONTHS_DAYS[month] + (month == 2 and is_leap) and
+        hh < 24 and
+        mm < 60 and
+        ss < 60,
+        'Bad date time')
+
+    last_year = year - 1
+    days = (
+        last_year * 365 +
+        last_year // 4 -
+        last_year // 100 +
+        last_year // 400 +
+        _MONTHS_CUMULATIVE_DAYS[month] +
+        (month > 2 and is_leap) +
+        day - 1 -
+        _EPOCH_DAYS)
+
+    constraints.constraint(
+        (days + _EPOCH_WEEK_DAY) % 7 == week_day,
+        'Bad week day')
+
+    return days * 86400 + hh * 3600 + mm * 60 + ss
+
+
+def _to_date_time(week_day, year, month, day, hh, mm, ss, as_epoch):
+    if as_epoch:
+        return _to_epoch(week_day, year, month, day, hh, mm, ss)
+
     try:
         date_time = datetime.datetime(
             year, month, day, hh, mm, ss)
@@ -83,13 +149,86 @@ def _to_datetime(week_day, year, month, day, hh, mm, ss):
     return date_time
 
 
-def clean_imf_fix_date(raw_date):
+def _parse_imf_fix_date(raw_date, as_epoch):
+    """
+    Parse the fixed positions of\
+    an IMF-fixdate. Return ``None``\
+    if it's not in the exact format
+    """
+    if (raw_date[3:5] != ', ' or
+            raw_date[7] != ' ' or
+            raw_date[11] != ' ' or
+            raw_date[16] != ' ' or
+            raw_date[19] != ':' or
+            raw_date[22] != ':' or
+            raw_date[25:] != ' GMT'):
+        return None
+
+    try:
+        week_day = _WEEK_DAYS_SHORT[raw_date[:3]]
+        day = _TWO_DIGITS[raw_date[5:7]]
+        month = _MONTHS[raw_date[8:11]]
+        year = (
+            _TWO_DIGITS[raw_date[12:14]] * 100 +
+            _TWO_DIGITS[raw_date[14:16]])
+        hh = _TWO_DIGITS[raw_date[17:19]]
+        mm = _TWO_DIGITS[raw_date[20:22]]
+        ss = _TWO_DIGITS[raw_date[23:25]]
+    except KeyError:
+        return None
+
+    # See ``_clean_imf_fix_date``
+    if ss == 60:
+        ss = 59
+
+    return _to_date_time(
+        week_day=week_day,
+        year=year,
+        month=month,
+        day=day,
+        hh=hh,
+        mm=mm,
+        ss=ss,
+        as_epoch=as_epoch)
+
+
+def clean_imf_fix_date(raw_date, as_epoch=False):
     # http://httpwg.org/specs/rfc7231.html#preferred.date.format
 
     # Python has some built-in date parsers
     # (email and datetime) but this is way
     # simpler, faster and securer
 
+    if as_epoch:
+        cache = _IMF_FIXDATE_EPOCH_CACHE
+    else:
+        cache = _IMF_FIXDATE_CACHE
+
+    try:
+        return cache[raw_date]
+    except KeyError:
+        pass
+
+    constraints.constraint(
+        len(raw_date) == _IMF_FIXDATE_LEN,
+        'Date value is not valid')
+
+    date_time = _parse_imf_fix_date(raw_date, as_epoch)
+
+    # Let the slow parser tell what's wrong
+    if date_time is None:
+        date_time = _clean_imf_fix_date(raw_date, as_epoch)
+
+    # A tiny cache, it's just
+    # emptied once it's full
+    if len(cache) >= _IMF_FIXDATE_CACHE_MAX:
+        cache.clear()
+
+    cache[raw_date] = date_time
+    return date_time
+
+
+def _clean_imf_fix_date(raw_date, as_epoch=False):
     constraints.constraint(
         len(raw_date) == _IMF_FIXDATE_LEN,
         'Date value is not valid')
@@ -133,17 +272,18 @@ def clean_imf_fix_date(raw_date):
     if ss == 60:
         ss = 59
 
-    return _to_datetime(
+    return _to_date_time(
         week_day=week_day,
         year=cleaners.clean_number(year),
         month=_MONTHS[month],
         day=cleaners.clean_number(day),
         hh=hh,
         mm=mm,
-        ss=ss)
+        ss=ss,
+        as_epoch=as_epoch)
 
 
-def clean_rfc_850_date(raw_date):
+def clean_rfc_850_date(raw_date, as_epoch=False):
     constraints.constraint(
         (_RFC_850_DATE_MIN_LEN <=
          len(raw_date) <=
@@ -204,17 +344,18 @@ def clean_rfc_850_date(raw_date):
     else:  # 2000-2068
         year += 2000
 
-    return _to_datetime(
+    return _to_date_time(
         week_day=week_day,
         year=year,
         month=_MONTHS[month],
         day=cleaners.clean_number(day),
         hh=hh,
         mm=mm,
-        ss=ss)
+        ss=ss,
+        as_epoch=as_epoch)
 
 
-def clean_asctime_date(raw_date):
+def clean_asctime_date(raw_date, as_epoch=False):
     # Sun Nov  7 08:48:37 1994
     # Sun Nov 17 08:48:37 1994
 
@@ -259,17 +400,18 @@ def clean_asctime_date(raw_date):
         0 <= ss <= 59,
         'Seconds must be in between 0-59')
 
-    return _to_datetime(
+    return _to_date_time(
         week_day=_WEEK_DAYS_SHORT[week_day],
         year=cleaners.clean_number(year),
         month=_MONTHS[month],
         day=cleaners.clean_number(day),
         hh=hh,
         mm=mm,
-        ss=ss)
+        ss=ss,
+        as_epoch=as_epoch)
 
 
-def _clean_date_time(raw_date_time):
+def _clean_date_time(raw_date_time, as_epoch):
     assert (
         _ASCTIME_LEN <
         _IMF_FIXDATE_LEN <
@@ -278,47 +420,190 @@ def _clean_date_time(raw_date_time):
     raw_date_time_len = len(raw_date_time)
 
     if raw_date_time_len == _ASCTIME_LEN:
-        return clean_asctime_date(raw_date_time)
+        return clean_asctime_date(raw_date_time, as_epoch)
 
     if raw_date_time_len >= _RFC_850_DATE_MIN_LEN:
-        return clean_rfc_850_date(raw_date_time)
+        return clean_rfc_850_date(raw_date_time, as_epoch)
 
     # Default to the preferred date-time
-    return clean_imf_fix_date(raw_date_time)
+    return clean_imf_fix_date(raw_date_time, as_epoch)
 
 
-def clean_date_time(raw_date_time, **default):
+def clean_date_time(raw_date_time, as_epoch=None, **default):
+    """
+    Parse a HTTP-date into a ``datetime``,\
+    or into ``int`` POSIX seconds when\
+    ``as_epoch`` is true. It defaults\
+    to ``settings.DATES_AS_EPOCH``
+
+    A ``datetime`` default is\
+    converted to POSIX seconds\
+    as well.
+    """
     assert (
         not default or
         (len(default) == 1 and
          'default' in default))
 
+    if as_epoch is None:
+        as_epoch = settings.DATES_AS_EPOCH
+
     try:
-        return _clean_date_time(raw_date_time)
+        return _clean_date_time(raw_date_time, as_epoch)
     except exceptions.HeaderError:
-        if default:
-            return default['default']
+        if not default:
+            raise
+
+        if as_epoch:
+            return to_epoch(default['default'])
 
-        raise
+        return default['default']
+
+
+def is_date(value):
+    """
+    Whether the value is a date\
+    in the current dates mode,\
+    see ``settings.DATES_AS_EPOCH``
+    """
+    if settings.DATES_AS_EPOCH:
+        return isinstance(value, int)
+
+    return isinstance(value, datetime.datetime)
+
+
+def to_epoch(date_time):
+    """
+    Return the POSIX seconds of\
+    a date in either mode. Naive\
+    ``datetime`` are taken as UTC
+
+    :param date_time: ``datetime`` or ``int``
+    :return: ``int``
+    """
+    if isinstance(date_time, int):
+        return date_time
+
+    return calendar.timegm(date_time.utctimetuple())
+
+
+def to_datetime(seconds):
+    """
+    Return the naive UTC ``datetime``\
+    of a date in either mode
+
+    :param seconds: ``int`` or ``datetime``
+    :return: ``datetime``
+    """
+    if isinstance(seconds, datetime.datetime):
+        return seconds
+
+    return _EPOCH + datetime.timedelta(seconds=seconds)
 
 
 def format_date(date_time):
+    if isinstance(date_time, int):
+        return format_epoch(date_time)
+
     assert isinstance(date_time, datetime.datetime)
 
     # There is a `strftime()` but
     # it's locale dependent
-    return (
-        '{week_day}, {day:02} {month} {year} '
-        '{hour:02}:{minute:02}:{second:02} GMT'.format(
-            week_day=_WEEK_DAYS_SHORT_NUM[date_time.weekday()],
-            day=date_time.day,
-            month=_MONTHS_NUM[date_time.month],
-            year=date_time.year,
-            hour=date_time.hour,
-            minute=date_time.minute,
-            second=date_time.second))
+    return _IMF_FIXDATE_FORMAT % (
+        _WEEK_DAYS_SHORT_NAMES[date_time.weekday()],
+        date_time.day,
+        _MONTHS_NAMES[date_time.month],
+        date_time.year,
+        date_time.hour,
+        date_time.minute,
+        date_time.second)
+
+
+def format_epoch(seconds):
+    """
+    Format POSIX seconds as IMF-fixdate
+
+    :param seconds: ``int`` seconds since epoch
+    :return: ``str``
+    """
+    tm = time.gmtime(seconds)
+    return _IMF_FIXDATE_FORMAT % (
+        _WEEK_DAYS_SHORT_NAMES[tm.tm_wday],
+        tm.tm_mday,
+        _MONTHS_NAMES[tm.tm_mon],
+        tm.tm_year,
+        tm.tm_hour,
+        tm.tm_min,
+        tm.tm_sec)
+
+
+ClockTime = collections.namedtuple(
+    'ClockTime', (
+        'seconds',
+        'date_time',
+        'date_str',
+        'date_bytes'))
+
+
+def _clock_time(seconds):
+    date_str = format_epoch(seconds)
+    return ClockTime(
+        seconds=seconds,
+        date_time=datetime.datetime(*time.gmtime(seconds)[:6]),
+        date_str=date_str,
+        date_bytes=date_str.encode('ascii'))
+
+
+class DateClock:
+    """
+    A clock that keeps the current\
+    date and time, formatted as\
+    IMF-fixdate. It's updated at\
+    most once per second.
+
+    The current time is a ``ClockTime``\
+    tuple, replaced as a whole, so\
+    it's safe to share the clock\
+    between threads and tasks.
+
+    Usage::
+
+        clock.now()
+        # ClockTime(
+        #     seconds=784111777,
+        #     date_time=datetime.datetime(1994, 11, 6, 8, 49, 37),
+        #     date_str='Sun, 06 Nov 1994 08:49:37 GMT',
+        #     date_bytes=b'Sun, 06 Nov 1994 08:49:37 GMT')
+
+    :param time_func: Function returning\
+    the POSIX time in seconds
+    """
+
+    __slots__ = (
+        '_time',
+        '_now')
+
+    def __init__(self, time_func=time.time):
+        self._time = time_func
+        self._now = _clock_time(int(time_func()))
+
+    def now(self):
+        now = self._now
+        seconds = int(self._time())
+
+        if seconds != now.seconds:
+            now = _clock_time(seconds)
+            self._now = now
+
+        return now
+
+
+clock = DateClock()
 
 
 def check_date(date_time):
-    assertions.must_be_instance_of(
-        date_time, datetime.datetime)
+    if settings.DATES_AS_EPOCH:
+        assertions.must_be_int(date_time)
+    else:
+        assertions.must_be_instance_of(
+            date_time, datetime.datetime)
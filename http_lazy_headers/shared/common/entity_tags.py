@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
+from ..utils import ascii_tools
 from ..utils import assertions
 from ..utils import checkers
 from ..utils import constraints
+from ..utils import parsers
 
 
 def entity_tag(etag, is_weak=False):
@@ -22,6 +24,35 @@ def check_etag(etag_value):
     assertions.must_be_instance_of(is_weak, bool)
 
 
+def strong_compare(etag_value, other):
+    """
+    Whether both e-tags are strong\
+    and their opaque-tags are equal
+
+    `Ref. <http://httpwg.org/specs/rfc7232.html#entity.tag.comparison>`_
+
+    :param etag_value: ``(etag, is_weak)``
+    :param other: ``(etag, is_weak)``
+    :return: Whether they match
+    """
+    return (
+        not etag_value[1] and
+        not other[1] and
+        etag_value[0] == other[0])
+
+
+def weak_compare(etag_value, other):
+    """
+    Whether the opaque-tags\
+    of both e-tags are equal
+
+    :param etag_value: ``(etag, is_weak)``
+    :param other: ``(etag, is_weak)``
+    :return: Whether they match
+    """
+    return etag_value[0] == other[0]
+
+
 def format_etags(etags):
     for etag, is_weak in etags:
         if is_weak:
@@ -33,10 +64,10 @@ def format_etags(etags):
 def clean_etag(raw_value):
     is_weak = False
 
-    if raw_value.startswith('W/'):
+    if raw_value.startswith(ascii_tools.as_type_of('W/', raw_value)):
         raw_value = raw_value[len('W/'):]
         is_weak = True
 
     constraints.must_be_etag(raw_value)
 
-    return raw_value[1:-1], is_weak
+    return parsers.decode(raw_value[1:-1]), is_weak
@@ -40,6 +40,10 @@ _REG_NAME = (
     frozenset('!$&\'()*+,;=') |
     frozenset('%'))
 
+_HEXDIG_TABLE = ascii_tools.deletion_table(_HEXDIG)
+_IPV_FUTURE_TAIL_TABLE = ascii_tools.deletion_table(_IPV_FUTURE_TAIL)
+_REG_NAME_TABLE = ascii_tools.deletion_table(_REG_NAME)
+
 
 def is_ipv4(raw_ipv4):
     ipv4 = raw_ipv4.split('.', 3)
@@ -66,7 +70,7 @@ def _is_h16(raw_h16):
     if not 1 <= len(raw_h16) <= 4:
         return False
 
-    return set(raw_h16).issubset(_HEXDIG)
+    return ascii_tools.is_made_of(raw_h16, _HEXDIG_TABLE)
 
 
 def is_ipv6(raw_ipv6):
@@ -159,17 +163,17 @@ def is_ipv_future(raw_ipv_future):
     if not head or not tail:
         return False
 
-    if not set(head).issubset(_HEXDIG):
+    if not ascii_tools.is_made_of(head, _HEXDIG_TABLE):
         return False
 
-    if not set(tail).issubset(_IPV_FUTURE_TAIL):
+    if not ascii_tools.is_made_of(tail, _IPV_FUTURE_TAIL_TABLE):
         return False
 
     return True
 
 
 def is_unsafe_host(raw_host):
-    if not set(raw_host).issubset(_REG_NAME):
+    if not ascii_tools.is_made_of(raw_host, _REG_NAME_TABLE):
         return False
 
     percent = False
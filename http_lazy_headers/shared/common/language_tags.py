@@ -13,6 +13,8 @@ _ALPHA = frozenset(
         (0x41, 0x5A),
         (0x61, 0x7A)))
 
+_ALPHA_TABLE = ascii_tools.deletion_table(_ALPHA)
+
 
 (LANG,
  EXT_LANG,
@@ -61,7 +63,7 @@ def is_alpha(txt):
     if not txt:
         return False
 
-    return set(txt).issubset(_ALPHA)
+    return ascii_tools.is_made_of(txt, _ALPHA_TABLE)
 
 
 def is_sub_tag(txt):
@@ -3,6 +3,7 @@
 import itertools
 import urllib.parse
 
+from ..utils import ascii_tools
 from ..utils import constraints
 from ..utils import parsers
 from ..utils import checkers
@@ -13,7 +14,7 @@ from ...settings import settings
 
 def clean_token(raw_token):
     constraints.must_be_token(raw_token)
-    return raw_token
+    return parsers.decode(raw_token)
 
 
 def clean_tokens_ci(raw_tokens):
@@ -162,7 +163,8 @@ def clean_accept_some(raw_value):
 def clean_bytes_range(raw_bytes):
     # Don't allow more/less than one dash
     try:
-        start, end = raw_bytes.split('-', 2)
+        start, end = raw_bytes.split(
+            ascii_tools.as_type_of('-', raw_bytes), 2)
     except ValueError:
         raise exceptions.BadRequest(
             'Param must have start-end format')
@@ -172,11 +174,11 @@ def clean_bytes_range(raw_bytes):
 
     if start:
         start = clean_number(
-            start, max_chars=settings.CONTENT_MAX_CHARS)
+            start, max_chars=settings.RANGE_MAX_CHARS)
 
     if end:
         end = clean_number(
-            end, max_chars=settings.CONTENT_MAX_CHARS)
+            end, max_chars=settings.RANGE_MAX_CHARS)
 
     (start is None or
      end is None or
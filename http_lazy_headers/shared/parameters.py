@@ -10,10 +10,13 @@ class Params:
     An immutable DS for header-value parameters.
     """
 
-    __slots__ = ('_params',)
+    __slots__ = (
+        '_params',
+        '_str')
 
     def __init__(self, params=None):
         self._params = collections.OrderedDict(params or ())
+        self._str = None  # Default separator str
 
     def __repr__(self):
         return '%s(%s)' % (
@@ -45,6 +48,15 @@ class Params:
         return bool(self._params)
 
     def as_str(self, separator=';'):
+        if separator != ';':
+            return self._as_str(separator)
+
+        if self._str is None:
+            self._str = self._as_str(separator)
+
+        return self._str
+
+    def _as_str(self, separator):
         separator = ''.join((
             separator.strip(),
             ' '))
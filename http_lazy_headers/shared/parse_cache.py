@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+from .utils import lru_cache
+from ..settings import settings
+
+
+class ParseCache(lru_cache.LRUCache):
+    """
+    A cache of parsed header values, keyed\
+    by the header class, its name and its\
+    raw values. It's disabled for every\
+    header until it gets enabled.
+
+    The size of every entry is the\
+    length of its raw values, so\
+    ``max_bytes`` bounds the memory\
+    taken by the cached raw values.
+
+    Usage::
+
+        parse_cache.enable(Accept, AcceptEncoding)
+        Accept(raw_values_collection=['text/html']).values()  # Miss
+        Accept(raw_values_collection=['text/html']).values()  # Hit
+        parse_cache.stats()
+        # {'hits': 1, 'misses': 1, 'evictions': 0, ...}
+        parse_cache.disable(Accept)
+    """
+
+    __slots__ = ('_fields',)
+
+    def __init__(self, max_entries=1024, max_bytes=None):
+        super().__init__(
+            max_entries=max_entries,
+            max_size=max_bytes)
+        self._fields = frozenset()
+
+    def enable(self, *fields):
+        self._fields = self._fields | frozenset(fields)
+
+    def disable(self, *fields):
+        fields = frozenset(fields)
+        self._fields = self._fields - fields
+        self.discard_if(lambda key: key[0] in fields)
+
+    def is_enabled(self, field):
+        return field in self._fields
+
+    def get_values(self, header):
+        """
+        Return the cached values\
+        for a not yet cleaned header
+
+        :param header: ``HeaderBase`` instance
+        :return: Values or ``None``
+        """
+        return self.get(_key_for(header))
+
+    def set_values(self, header, values):
+        raw_values_collection = header._raw_values_collection
+        self.set(
+            _key_for(header),
+            values,
+            size=sum(
+                len(rvs)
+                for rvs in raw_values_collection))
+
+
+def _key_for(header):
+    # Dates are cleaned into either
+    # type, depending on the mode
+    return (
+        header.__class__,
+        header.name,
+        tuple(header._raw_values_collection),
+        settings.DATES_AS_EPOCH)
+
+
+parse_cache = ParseCache()
@@ -2,11 +2,23 @@
 
 import collections
 
+
+# Identity table for ``bytes.translate``
+_IDENTITY = bytes(range(256))
+
+# ``str.translate`` is faster than encoding
+# and translating the bytes for short strings
+_SHORT_STR_LEN = 16
+
 __all__ = [
     'ascii_range',
     'ascii_chars',
     'ascii_range_bytes',
-    'ascii_bytes']
+    'ascii_bytes',
+    'ascii_codes',
+    'as_type_of',
+    'deletion_table',
+    'is_made_of']
 
 
 def _ascii_range(start, end, to_chr):
@@ -47,3 +59,96 @@ def ascii_range_bytes(start, end):
 
 def ascii_bytes(*args):
     return _ascii_chars(*args, to_chr=_byte)
+
+
+def ascii_codes(*args):
+    """
+    Same as ``ascii_chars`` but it\
+    returns the code points, the same\
+    way iterating over ``bytes`` does
+    """
+    return _ascii_chars(*args, to_chr=int)
+
+
+def as_type_of(chars, txt):
+    """
+    Return ASCII ``chars`` as ``bytes``\
+    if ``txt`` is ``bytes``, otherwise\
+    return them as they are
+
+    :param chars: ASCII ``str``
+    :param txt: ``str`` or ``bytes``
+    :return: ``str`` or ``bytes``
+    """
+    if isinstance(txt, bytes):
+        return chars.encode('ascii')
+
+    return chars
+
+
+def deletion_table(chars):
+    """
+    Build the tables to validate\
+    a ``str`` or ``bytes`` is made of\
+    ``chars`` only. See ``is_made_of``.
+
+    :param chars: Iterable of ASCII chars
+    :return: 256 entries ``str.translate``\
+    table and ``bytes.translate`` delete chars
+    """
+    chars = frozenset(chars)
+
+    assert all(
+        ord(c) < 128
+        for c in chars)
+
+    return (
+        [None if chr(cp) in chars else chr(cp)
+         for cp in range(256)],
+        bytes(sorted(ord(c) for c in chars)))
+
+
+def is_made_of(txt, table):
+    """
+    Check ``txt`` is made of the chars\
+    in the ``table``. The chars are\
+    deleted from ``txt`` and what\
+    remains is expected to be empty.
+
+    Usage::
+
+        is_made_of('abc', deletion_table('abc'))
+        # True
+
+        is_made_of(b'abcd', deletion_table('abc'))
+        # False
+
+    :param txt: ``str`` or ``bytes``
+    :param table: Table returned by ``deletion_table``
+    :return: Whether ``txt`` is made of the chars
+    """
+    if isinstance(txt, str):
+        # Chars out of the table are not
+        # deleted, so non-latin1 is not valid
+        if len(txt) < _SHORT_STR_LEN:
+            return not txt.translate(table[0])
+
+        if not _is_ascii(txt):
+            return False
+
+        txt = txt.encode('ascii')
+
+    return not txt.translate(_IDENTITY, table[1])
+
+
+def _is_ascii_fallback(txt):
+    try:
+        txt.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+
+    return True
+
+
+# Python < 3.7
+_is_ascii = getattr(str, 'isascii', _is_ascii_fallback)
@@ -43,33 +43,51 @@ _VISIBLE_CHARS = frozenset(
     ascii_tools.ascii_chars((0x21, 0x7E)))
 
 
+# Tables for ``ascii_tools.is_made_of``
+_TOKEN_TABLE = ascii_tools.deletion_table(_TOKEN_CHARS)
+_TOKEN68_TABLE = ascii_tools.deletion_table(_TOKEN68_CHARS)
+_URI_TABLE = ascii_tools.deletion_table(_URI_CHARS)
+_ETAG_TABLE = ascii_tools.deletion_table(_ETAG_CHARS)
+_MIME_CHARSET_TABLE = ascii_tools.deletion_table(_MIME_CHARSET_CHARS)
+_MIME_CHARSET_VALUE_TABLE = ascii_tools.deletion_table(
+    _MIME_CHARSET_VALUE_CHARS)
+_LANG_TABLE = ascii_tools.deletion_table(_LANG_CHARS)
+_DIGIT_TABLE = ascii_tools.deletion_table(_DIGIT_CHARS)
+_ASCII_TABLE = ascii_tools.deletion_table(_ASCII_CHARS)
+_EXT_TOKEN_TABLE = ascii_tools.deletion_table(_EXT_TOKEN)
+_VISIBLE_TABLE = ascii_tools.deletion_table(_VISIBLE_CHARS)
+_ALPHA_NUM_TABLE = ascii_tools.deletion_table(_ALPHA_NUM)
+
+
 def is_token(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_TOKEN_CHARS)
+    return ascii_tools.is_made_of(txt, _TOKEN_TABLE)
 
 
 def is_quoted_string(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if len(txt) < 2:  # Single quote?
         return False
 
-    if (not txt.startswith('"') or
-            not txt.endswith('"')):
+    quote = ascii_tools.as_type_of('"', txt)
+
+    if (not txt.startswith(quote) or
+            not txt.endswith(quote)):
         return False
 
     return True
 
 
 def is_comment(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
-    if (not txt.startswith('(') and
-            not txt.endswith(')')):
+    if (not txt.startswith(ascii_tools.as_type_of('(', txt)) and
+            not txt.endswith(ascii_tools.as_type_of(')', txt))):
         return False
 
     return True
@@ -79,104 +97,106 @@ def is_token68(txt):
     """
     http://httpwg.org/specs/rfc7235.html#challenge.and.response
     """
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
-    txt = txt.rstrip('=')
+    txt = txt.rstrip(ascii_tools.as_type_of('=', txt))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_TOKEN68_CHARS)
+    return ascii_tools.is_made_of(txt, _TOKEN68_TABLE)
 
 
 def is_uri(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_URI_CHARS)
+    return ascii_tools.is_made_of(txt, _URI_TABLE)
 
 
 def is_etag(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if len(txt) < 2:  # Single quote?
         return False
 
-    if (not txt.startswith('"') or
-            not txt.endswith('"')):
+    quote = ascii_tools.as_type_of('"', txt)
+
+    if (not txt.startswith(quote) or
+            not txt.endswith(quote)):
         return False
 
-    return set(txt[1:-1]).issubset(_ETAG_CHARS)
+    return ascii_tools.is_made_of(txt[1:-1], _ETAG_TABLE)
 
 
 def is_mime_charset(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_MIME_CHARSET_CHARS)
+    return ascii_tools.is_made_of(txt, _MIME_CHARSET_TABLE)
 
 
 def is_mime_charset_value(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     # May be empty
 
-    return set(txt).issubset(_MIME_CHARSET_VALUE_CHARS)
+    return ascii_tools.is_made_of(txt, _MIME_CHARSET_VALUE_TABLE)
 
 
 def is_lang_value(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_LANG_CHARS)
+    return ascii_tools.is_made_of(txt, _LANG_TABLE)
 
 
 def is_number(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_DIGIT_CHARS)
+    return ascii_tools.is_made_of(txt, _DIGIT_TABLE)
 
 
 def is_ascii(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_ASCII_CHARS)
+    return ascii_tools.is_made_of(txt, _ASCII_TABLE)
 
 
 def is_ext_token(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_EXT_TOKEN)
+    return ascii_tools.is_made_of(txt, _EXT_TOKEN_TABLE)
 
 
 def is_visible_chars(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_VISIBLE_CHARS)
+    return ascii_tools.is_made_of(txt, _VISIBLE_TABLE)
 
 
 def is_alphanum(txt):
-    assert isinstance(txt, str)
+    assert isinstance(txt, (str, bytes))
 
     if not txt:
         return False
 
-    return set(txt).issubset(_ALPHA_NUM)
+    return ascii_tools.is_made_of(txt, _ALPHA_NUM_TABLE)
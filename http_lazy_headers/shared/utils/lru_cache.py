@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import threading
+
+
+_UNCHANGED = object()
+
+
+class LRUCache:
+    """
+    A size-bounded mapping that evicts\
+    the least recently used entries.
+
+    The budget is given by a maximum number\
+    of entries and/or a maximum total size,\
+    where the size of every entry is provided\
+    by the caller when setting it.
+
+    It's safe to share it between threads.
+
+    Usage::
+
+        cache = LRUCache(max_entries=2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.get('foo')
+        # 1
+        cache.set('baz', 3)  # Evicts "bar"
+        cache.get('bar')
+        # None
+    """
+
+    __slots__ = (
+        'max_entries',
+        'max_size',
+        'hits',
+        'misses',
+        'evictions',
+        '_entries',
+        '_size',
+        '_lock')
+
+    def __init__(self, max_entries=1024, max_size=None):
+        assert (
+            max_entries is None or
+            max_entries > 0)
+        assert (
+            max_size is None or
+            max_size > 0)
+
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '{}(max_entries={}, max_size={})'.format(
+            self.__class__.__name__,
+            self.max_entries,
+            self.max_size)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, size=1):
+        if (self.max_size is not None and
+                size > self.max_size):
+            return
+
+        with self._lock:
+            try:
+                _, old_size = self._entries.pop(key)
+            except KeyError:
+                pass
+            else:
+                self._size -= old_size
+
+            self._entries[key] = (value, size)
+            self._size += size
+            self._evict()
+
+    def _evict(self):
+        while (
+                (self.max_entries is not None and
+                 len(self._entries) > self.max_entries) or
+                (self.max_size is not None and
+                 self._size > self.max_size)):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+
+    def resize(self, max_entries=_UNCHANGED, max_size=_UNCHANGED):
+        """
+        Change the bounds given, ``None``\
+        removes a bound. Entries are\
+        evicted until they fit
+
+        :param max_entries: Maximum number of entries
+        :param max_size: Maximum total size
+        """
+        assert (
+            max_entries in (None, _UNCHANGED) or
+            max_entries > 0)
+        assert (
+            max_size in (None, _UNCHANGED) or
+            max_size > 0)
+
+        with self._lock:
+            if max_entries is not _UNCHANGED:
+                self.max_entries = max_entries
+
+            if max_size is not _UNCHANGED:
+                self.max_size = max_size
+
+            self._evict()
+
+    def discard_if(self, predicate):
+        """
+        Remove the entries for\
+        which ``predicate(key)`` is true
+
+        :param predicate: A callable\
+        receiving the entry key
+        """
+        with self._lock:
+            for key in tuple(self._entries):
+                if predicate(key):
+                    _, size = self._entries.pop(key)
+                    self._size -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def size(self):
+        return self._size
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'size': self._size}
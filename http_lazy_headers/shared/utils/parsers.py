@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from . import ascii_tools
 from . import checkers
 from ... import exceptions
 from ...settings import settings
@@ -7,6 +8,165 @@ from ...settings import settings
 
 _QUOTE_OR_COMMENT_CHARS_MAP = {'"': '"', '(': ')'}
 
+# Quote, opening and closing parenthesis,
+# escape and optional white-spaces (SP / HTAB)
+_SCAN_CHARS = ('"', '(', ')', '\\', ' \t')
+_B_SCAN_CHARS = (b'"', b'(', b')', b'\\', frozenset(b' \t'))
+
+
+def _skip_quoted(raw_values, start, quote, escape):
+    """
+    Return the index after the closing quote\
+    of the ``quoted-string`` at ``start``
+    """
+    find = raw_values.find
+    curr = start + 1
+
+    while True:
+        closing_i = find(quote, curr)
+
+        if closing_i == -1:
+            return len(raw_values)
+
+        escape_i = find(escape, curr, closing_i)
+
+        if escape_i == -1:
+            return closing_i + 1
+
+        curr = escape_i + 2  # Skip quoted-pair
+
+
+def _skip_comment(raw_values, start, opening, closing, escape):
+    """
+    Return the index after the closing\
+    parenthesis of the (maybe nested)\
+    ``comment`` at ``start``
+    """
+    find = raw_values.find
+    curr = start + 1
+    depth = 1
+
+    while True:
+        closing_i = find(closing, curr)
+
+        if closing_i == -1:
+            return len(raw_values)
+
+        escape_i = find(escape, curr, closing_i)
+
+        if escape_i != -1:
+            depth += raw_values.count(opening, curr, escape_i)
+            curr = escape_i + 2  # Skip quoted-pair
+            continue
+
+        depth += raw_values.count(opening, curr, closing_i)
+        depth -= 1
+        curr = closing_i + 1
+
+        if not depth:
+            return curr
+
+
+def scan(raw_values, max_values, separator=','):
+    """
+    Find the values in a list the same way\
+    ``from_raw`` does, but return them as\
+    ``(start, end)`` offsets excluding\
+    the surrounding white-spaces, instead\
+    of new strings.
+
+    This does a single pass over the value.\
+    The separators, quotes and parentheses are\
+    found by the built-in ``find``, so only\
+    the values delimiters are visited.\
+    Comments may be nested.
+
+    Example::
+
+        scan('foo, "bar, baz" ,qux', max_values=10)
+        # [(0, 3), (5, 15), (17, 20)]
+
+    :param raw_values: ``str`` or ``bytes``
+    :param max_values: Max number of values
+    :param separator: Values separator
+    :return: List of offsets
+    """
+    if isinstance(raw_values, bytes):
+        separator = separator.encode('ascii')
+        quote, opening, closing, escape, ows = _B_SCAN_CHARS
+    else:
+        quote, opening, closing, escape, ows = _SCAN_CHARS
+
+    find = raw_values.find
+    size = len(raw_values)
+    offsets = []
+    start = 0
+
+    # Next separator and openers, these
+    # are found again only once passed by
+    separator_i = find(separator)
+    quote_i = find(quote)
+    opening_i = find(opening)
+
+    while True:
+        end = separator_i
+
+        if end == -1:
+            end = size
+
+        if -1 < quote_i < end or -1 < opening_i < end:
+            if opening_i == -1 or -1 < quote_i < opening_i:
+                curr = _skip_quoted(
+                    raw_values, quote_i, quote, escape)
+            else:
+                curr = _skip_comment(
+                    raw_values, opening_i, opening, closing, escape)
+
+            if -1 < separator_i < curr:
+                separator_i = find(separator, curr)
+
+            if -1 < quote_i < curr:
+                quote_i = find(quote, curr)
+
+            if -1 < opening_i < curr:
+                opening_i = find(opening, curr)
+
+            continue
+
+        value_start = start
+        value_end = end
+
+        while (value_start < value_end and
+                raw_values[value_start] in ows):
+            value_start += 1
+
+        while (value_end > value_start and
+                raw_values[value_end - 1] in ows):
+            value_end -= 1
+
+        offsets.append((value_start, value_end))
+
+        if end == size:
+            return offsets
+
+        start = end + 1
+
+        if (len(offsets) >= max_values and
+                start < size):
+            raise exceptions.BadRequest('Too many values')
+
+        separator_i = find(separator, start)
+
+
+def _split(raw_values, max_values, separator):
+    values = raw_values.split(separator, max_values)
+
+    if len(values) > max_values and values[-1]:
+        raise exceptions.BadRequest('Too many values')
+
+    for value in values:
+        yield value.strip()
+
 
 def from_raw(raw_values, max_values, separator=','):
     """
@@ -34,41 +194,21 @@ def from_raw(raw_values, max_values, separator=','):
         parse_values_list(',', max_values=10)
         # ('', '')
 
+    ``bytes`` values are split into ``bytes``.
     """
-    start_i = 0
-    escape = False
-    quote_or_comment_char = None
-    values_count = 0
-
-    for curr_i, char in enumerate(raw_values):
-        if values_count >= max_values:
-            raise exceptions.BadRequest('Too many values')
-
-        if escape:
-            escape = False
-            continue
-
-        if quote_or_comment_char:
-            if char == '\\':
-                escape = True
-
-            if char == quote_or_comment_char:
-                quote_or_comment_char = None
-
-            continue
-
-        if char in _QUOTE_OR_COMMENT_CHARS_MAP:
-            quote_or_comment_char = _QUOTE_OR_COMMENT_CHARS_MAP[char]
-            continue
-
-        if char == separator:
-            yield raw_values[start_i:curr_i].strip()
-            start_i = curr_i + 1  # + skip separator
-            values_count += 1
+    # Most values have no quoted-string nor
+    # comment, the built-in split is the
+    # fastest way to split them
+    if (ascii_tools.as_type_of('"', raw_values) not in raw_values and
+            ascii_tools.as_type_of('(', raw_values) not in raw_values):
+        yield from _split(
+            raw_values,
+            max_values,
+            ascii_tools.as_type_of(separator, raw_values))
+        return
 
-    # If start is zero and there are
-    # no spaces, this won't copy the str
-    yield raw_values[start_i:].strip()
+    for start, end in scan(raw_values, max_values, separator):
+        yield raw_values[start:end]
 
 
 def from_raw_values(raw_values, separator=','):
@@ -112,12 +252,14 @@ def from_tokens(raw_tokens, separator=','):
     Use it over ``from_raw_values`` when the header's\
     values don't allow ``quoted-string`` anywhere.
 
+    ``bytes`` tokens are split into ``bytes``.
+
     :param raw_tokens:
     :param separator:
     :return:
     """
     tokens = raw_tokens.split(
-        sep=separator,
+        sep=ascii_tools.as_type_of(separator, raw_tokens),
         maxsplit=settings.HEADER_VALUES_MAX + 1)
 
     if len(tokens) > settings.HEADER_VALUES_MAX:
@@ -130,6 +272,21 @@ def from_tokens(raw_tokens, separator=','):
             yield token
 
 
+def decode(raw_value):
+    """
+    Decode a bytes-native value.\
+    This is meant to be called only on\
+    values handed back to the user as text.
+
+    :param raw_value: ``bytes`` or ``str``
+    :return: ``str``
+    """
+    if isinstance(raw_value, bytes):
+        return str(raw_value, 'latin1')
+
+    return raw_value
+
+
 def dequote(raw_value):
     """
     :param raw_value:
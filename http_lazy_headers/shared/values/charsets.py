@@ -37,3 +37,87 @@ class Charsets:
 
 CHARSET_VALUES = misc.vars_for(Charsets)
 
+# IANA charset -> aliases, see the
+# registry for the names not in it
+CHARSET_ALIASES = {
+    Charsets.us_ascii: (
+        'iso-ir-6', 'ANSI_X3.4-1968', 'ANSI_X3.4-1986',
+        'ISO_646.irv:1991', 'ISO646-US', 'us', 'IBM367',
+        'cp367', 'csASCII'),
+    Charsets.iso_8859_1: (
+        'iso-ir-100', 'ISO_8859-1:1987', 'ISO_8859-1',
+        'latin1', 'l1', 'IBM819', 'CP819', 'csISOLatin1'),
+    Charsets.iso_8859_2: (
+        'iso-ir-101', 'ISO_8859-2:1987', 'ISO_8859-2',
+        'latin2', 'l2', 'csISOLatin2'),
+    Charsets.iso_8859_3: (
+        'iso-ir-109', 'ISO_8859-3:1988', 'ISO_8859-3',
+        'latin3', 'l3', 'csISOLatin3'),
+    Charsets.iso_8859_4: (
+        'iso-ir-110', 'ISO_8859-4:1988', 'ISO_8859-4',
+        'latin4', 'l4', 'csISOLatin4'),
+    Charsets.iso_8859_5: (
+        'iso-ir-144', 'ISO_8859-5:1988', 'ISO_8859-5',
+        'cyrillic', 'csISOLatinCyrillic'),
+    Charsets.iso_8859_6: (
+        'iso-ir-127', 'ISO_8859-6:1987', 'ISO_8859-6',
+        'ECMA-114', 'ASMO-708', 'arabic', 'csISOLatinArabic'),
+    Charsets.iso_8859_7: (
+        'iso-ir-126', 'ISO_8859-7:1987', 'ISO_8859-7',
+        'ELOT_928', 'ECMA-118', 'greek', 'greek8',
+        'csISOLatinGreek'),
+    Charsets.iso_8859_8: (
+        'iso-ir-138', 'ISO_8859-8:1988', 'ISO_8859-8',
+        'hebrew', 'csISOLatinHebrew'),
+    Charsets.iso_8859_9: (
+        'iso-ir-148', 'ISO_8859-9:1989', 'ISO_8859-9',
+        'latin5', 'l5', 'csISOLatin5'),
+    Charsets.iso_8859_10: (
+        'iso-ir-157', 'l6', 'ISO_8859-10:1992',
+        'csISOLatin6', 'latin6'),
+    Charsets.shift_jis: ('MS_Kanji', 'csShiftJIS'),
+    Charsets.euc_jp: (
+        'Extended_UNIX_Code_Packed_Format_for_Japanese',
+        'csEUCPkdFmtJapanese'),
+    Charsets.iso_2022_kr: ('csISO2022KR', ),
+    Charsets.euc_kr: ('csEUCKR', ),
+    Charsets.iso_2022_jp: ('csISO2022JP', ),
+    Charsets.iso_2022_jp_2: ('csISO2022JP2', ),
+    Charsets.iso_8859_6_e: ('csISO88596E', 'ISO_8859-6-E'),
+    Charsets.iso_8859_6_i: ('csISO88596I', 'ISO_8859-6-I'),
+    Charsets.iso_8859_8_e: ('csISO88598E', 'ISO_8859-8-E'),
+    Charsets.iso_8859_8_i: ('csISO88598I', 'ISO_8859-8-I'),
+    Charsets.gb2312: ('csGB2312', ),
+    Charsets.big5: ('csBig5', ),
+    Charsets.koi8_r: ('csKOI8R', ),
+    Charsets.utf_8: (
+        'csUTF8', 'unicode-1-1-utf-8',
+        'unicode-2-0-utf-8', 'x-unicode20utf8')}
+
+# IANA charset -> Python codec
+CHARSET_CODECS = {
+    Charsets.us_ascii: 'ascii',
+    Charsets.iso_8859_1: 'latin-1',
+    Charsets.iso_8859_2: 'iso8859-2',
+    Charsets.iso_8859_3: 'iso8859-3',
+    Charsets.iso_8859_4: 'iso8859-4',
+    Charsets.iso_8859_5: 'iso8859-5',
+    Charsets.iso_8859_6: 'iso8859-6',
+    Charsets.iso_8859_7: 'iso8859-7',
+    Charsets.iso_8859_8: 'iso8859-8',
+    Charsets.iso_8859_9: 'iso8859-9',
+    Charsets.iso_8859_10: 'iso8859-10',
+    Charsets.shift_jis: 'shift_jis',
+    Charsets.euc_jp: 'euc_jp',
+    Charsets.iso_2022_kr: 'iso2022_kr',
+    Charsets.euc_kr: 'euc_kr',
+    Charsets.iso_2022_jp: 'iso2022_jp',
+    Charsets.iso_2022_jp_2: 'iso2022_jp_2',
+    Charsets.iso_8859_6_e: 'iso8859-6',
+    Charsets.iso_8859_6_i: 'iso8859-6',
+    Charsets.iso_8859_8_e: 'iso8859-8',
+    Charsets.iso_8859_8_i: 'iso8859-8',
+    Charsets.gb2312: 'gb2312',
+    Charsets.big5: 'big5',
+    Charsets.koi8_r: 'koi8_r',
+    Charsets.utf_8: 'utf-8'}
@@ -67,6 +67,7 @@ class SubLevel:
 
     # multipart/*
     form_data = 'form-data'
+    byteranges = 'byteranges'
 
     # common image/*
     png = 'png'
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import mimetypes
+import os
+
+from . import fields
+from .collections_ import FrozenHeaders
+from .settings import settings
+from .shared.common import dates
+from .shared.common import media_ranges
+from .shared.values import media_types
+from .shared.values import ranges
+
+
+StaticFile = collections.namedtuple(
+    'StaticFile', (
+        'path',
+        'mtime_ns',
+        'size',
+        'etag',
+        'last_modified',
+        'headers'))
+
+
+def _walk(root):
+    """
+    Yield the ``(key, path, stat)`` of\
+    every file under the root. Hidden\
+    files and directories are skipped.\
+    Symlinks are followed, except the\
+    ones to a parent directory
+    """
+    root_stat = os.stat(root)
+    dirs = [('', root, frozenset((
+        (root_stat.st_dev, root_stat.st_ino), )))]
+
+    while dirs:
+        prefix, dir_path, parents = dirs.pop()
+
+        for entry in os.scandir(dir_path):
+            if entry.name.startswith('.'):
+                continue
+
+            key = '/'.join((prefix, entry.name))
+
+            if entry.is_dir():
+                dir_stat = entry.stat()
+                dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+
+                # Symlink loop
+                if dir_id in parents:
+                    continue
+
+                dirs.append((key, entry.path, parents | {dir_id}))
+            elif entry.is_file():
+                yield key, entry.path, entry.stat()
+
+
+class StaticIndex:
+    """
+    Index of the files under a directory,\
+    with the response headers of every\
+    file checked and serialized up front.
+
+    The headers are ``ContentType`` (guessed\
+    from the extension), ``ContentLength``,\
+    ``LastModified``, a strong ``ETag``\
+    made of the modification time and the size,\
+    ``AcceptRanges`` and the given ``CacheControl``.
+
+    ``refresh`` walks the directory again\
+    and only rebuilds the headers of the\
+    files whose modification time or size\
+    changed. The index is replaced as a\
+    whole, so it's safe to share between\
+    threads.
+
+    Usage::
+
+        index = StaticIndex(
+            '/srv/static',
+            cache_control=CacheControl([cache_control(max_age=3600)]))
+        static_file = index.get('/css/app.css')
+        headers = HeadersMut([...])
+        headers.merge(static_file.headers)
+        headers.to_bytes('HTTP/1.1 200 OK')
+
+    :param root: Directory path
+    :param cache_control: ``CacheControl``\
+    header or ``None``
+    :param content_types: Extension to\
+    media type ``str``, looked up\
+    before guessing the type
+    :param charset: Charset of the ``text/*``\
+    files or ``None``
+    :param default_type: Media type ``str``\
+    when it can't be guessed
+    """
+
+    __slots__ = (
+        'root',
+        '_cache_control',
+        '_content_types',
+        '_charset',
+        '_default_type',
+        '_files')
+
+    def __init__(
+            self,
+            root,
+            cache_control=None,
+            content_types=None,
+            charset=None,
+            default_type='application/octet-stream'):
+        assert os.path.isdir(root)
+        assert (
+            cache_control is None or
+            isinstance(cache_control, fields.CacheControl))
+
+        self.root = root
+        self._cache_control = cache_control
+        self._content_types = dict(content_types or ())
+        self._charset = charset
+        self._default_type = default_type
+        self._files = {}
+        self.refresh()
+
+    def __contains__(self, key):
+        return key in self._files
+
+    def __len__(self):
+        return len(self._files)
+
+    def get(self, key, default=None):
+        """
+        Return the file for a URL path
+
+        :param key: Path relative to\
+        the root, with a leading slash\
+        (ie: ``/css/app.css``)
+        :param default: Returned for\
+        unknown files
+        :return: ``StaticFile``
+        """
+        return self._files.get(key, default)
+
+    def keys(self):
+        return self._files.keys()
+
+    def refresh(self):
+        """
+        Walk the directory and update\
+        the index. Files that were not\
+        modified are kept as they are
+
+        :return: ``set`` of the keys of\
+        the files added, modified or removed
+        """
+        old_files = self._files
+        files = {}
+        changed = set()
+
+        for key, path, stat in _walk(self.root):
+            static_file = old_files.get(key)
+
+            if (static_file is None or
+                    static_file.mtime_ns != stat.st_mtime_ns or
+                    static_file.size != stat.st_size):
+                static_file = self._static_file(path, stat)
+                changed.add(key)
+
+            files[key] = static_file
+
+        changed.update(
+            key
+            for key in old_files
+            if key not in files)
+        self._files = files
+        return changed
+
+    def _static_file(self, path, stat):
+        etag = (
+            '{:x}-{:x}'.format(stat.st_mtime_ns, stat.st_size),
+            False)
+        last_modified = int(stat.st_mtime)
+
+        if not settings.DATES_AS_EPOCH:
+            last_modified = dates.to_datetime(last_modified)
+
+        headers = [
+            fields.ContentType([self._content_type(path)]),
+            fields.ContentLength([stat.st_size]),
+            fields.LastModified([last_modified]),
+            fields.ETag([etag]),
+            fields.AcceptRanges([ranges.RangesOptions.bytes])]
+
+        if self._cache_control is not None:
+            headers.append(self._cache_control)
+
+        return StaticFile(
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            etag=etag,
+            last_modified=last_modified,
+            headers=FrozenHeaders(headers))
+
+    def _content_type(self, path):
+        _, extension = os.path.splitext(path)
+        content_type = self._content_types.get(extension.lower())
+
+        if content_type is None:
+            content_type, encoding = mimetypes.guess_type(path)
+
+            # ie: a ".tar.gz" would need a
+            # Content-Encoding, not a tar type
+            if content_type is None or encoding is not None:
+                content_type = self._default_type
+
+        value = media_ranges.clean_media_type(content_type)
+        (top_level, _), params = value
+
+        if (self._charset is not None and
+                top_level == media_types.MediaType.text and
+                'charset' not in params):
+            value = (value[0], params.merge({'charset': self._charset}))
+
+        return value
@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+
+import collections
+
+from . import exceptions
+from . import fields
+from . import parser
+from .collections_ import Headers
+from .collections_ import name_of
+from .shared import bases
+from .shared.utils import checkers
+from .settings import settings
+
+
+_OWS = b' \t'
+
+
+class BufferedHeaders(Headers):
+    """
+    Headers collection backed by the\
+    buffer of the header block and the\
+    offsets of every header name and value.
+
+    A header field is created, and its\
+    values are sliced out of the buffer,\
+    only once it's looked up. Iterating\
+    creates every header field.
+
+    Headers outside of the ``schema``\
+    are never made into fields.
+
+    Example::
+
+        buffer = b'Accept: text/html\\r\\n\\r\\n'
+        BufferedHeaders(buffer, [(0, 6, 8, 17)])
+
+    :param buffer: ``bytes`` buffer
+    :param offsets: List of\
+    ``(name_start, name_end, value_start, value_end)``
+    :param schema: ``HeaderSchema`` or ``None``
+    """
+
+    __slots__ = (
+        '_buffer',
+        '_offsets',
+        '_schema',
+        '_is_complete')
+
+    def __init__(self, buffer, offsets, schema=None):
+        super().__init__()
+        self._buffer = buffer
+        self._offsets = offsets
+        self._schema = schema
+        self._is_complete = not offsets
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __getitem__(self, key):
+        header = self._find(key)
+
+        if header is None:
+            raise KeyError(key)
+
+        return header
+
+    def __iter__(self):
+        return iter(self.fields())
+
+    def __len__(self):
+        return len(self.fields())
+
+    def __bool__(self):
+        # Every header is a field when
+        # there is no schema to filter them
+        if self._schema is None:
+            return bool(self._offsets)
+
+        return bool(self.fields())
+
+    def fields(self):
+        if not self._is_complete:
+            self._complete()
+
+        return self._headers.values()
+
+    def get(self, key, default=None):
+        header = self._find(key)
+
+        if header is None:
+            return default
+
+        return header
+
+    def passthrough(self):
+        schema = self._schema
+
+        if schema is None or not schema.passthrough:
+            return ()
+
+        buffer = self._buffer
+        return tuple(
+            (buffer[name_start:name_end], buffer[value_start:value_end])
+            for name_start, name_end, value_start, value_end
+            in self._offsets
+            if schema.get_field(buffer[name_start:name_end]) is None)
+
+    def _find(self, key):
+        name = name_of(key)
+
+        try:
+            return self._headers[name]
+        except KeyError:
+            pass
+
+        if self._is_complete:
+            return None
+
+        if (self._schema is not None and
+                self._schema.get_field(name) is None):
+            return None
+
+        if not name:
+            return None
+
+        try:
+            b_name = name.encode('ascii')
+        except UnicodeEncodeError:
+            return None
+
+        buffer = self._buffer
+        name_len = len(b_name)
+        first = b_name[0]
+        first_upper = b_name[:1].upper()[0]
+
+        # Compare the length and the first char
+        # (either case) before slicing the name
+        raw_values_collection = [
+            buffer[value_start:value_end]
+            for name_start, name_end, value_start, value_end
+            in self._offsets
+            if (name_end - name_start == name_len and
+                (buffer[name_start] == first or
+                 buffer[name_start] == first_upper) and
+                buffer[name_start:name_end].lower() == b_name)]
+
+        if not raw_values_collection:
+            return None
+
+        if isinstance(key, str):
+            header = _to_field(name, raw_values_collection)
+        elif isinstance(key, fields.Custom):
+            header = fields.Custom(
+                name,
+                raw_values_collection=raw_values_collection)
+        elif isinstance(key, bases.HeaderBase):
+            header = key.__class__(
+                raw_values_collection=raw_values_collection)
+        else:
+            header = key(raw_values_collection=raw_values_collection)
+
+        self._headers[name] = header
+        return header
+
+    def _complete(self):
+        buffer = self._buffer
+        raw_fields = collections.OrderedDict()
+
+        for name_start, name_end, value_start, value_end in self._offsets:
+            name = str(buffer[name_start:name_end], 'latin1').lower()
+
+            if (self._schema is not None and
+                    self._schema.get_field(name) is None):
+                continue
+
+            try:
+                raw_fields[name].append(buffer[value_start:value_end])
+            except KeyError:
+                raw_fields[name] = [buffer[value_start:value_end]]
+
+        headers = collections.OrderedDict()
+
+        for name, raw_values_collection in raw_fields.items():
+            header = self._headers.get(name)
+
+            if header is None:
+                header = _to_field(name, raw_values_collection)
+
+            headers[name] = header
+
+        self._headers = headers
+        self._is_complete = True
+
+
+def _to_field(name, raw_values_collection):
+    field = parser.get_field(name)
+
+    if field is not None:
+        return field(raw_values_collection=raw_values_collection)
+
+    if not checkers.is_token(name):
+        raise exceptions.BadRequest(
+            'Header name must be a valid token')
+
+    return fields.Custom(
+        name,
+        raw_values_collection=raw_values_collection)
+
+
+class HeadersParser:
+    """
+    Incremental parser of the header block\
+    that follows the start-line of a message.
+
+    The data is fed as it's read from\
+    the socket, every line is scanned once,\
+    so data already fed is never scanned again.\
+    A ``Headers`` collection is returned once\
+    the empty line that ends the block arrives.\
+    It's a ``BufferedHeaders`` collection, so\
+    the values are sliced out of the block\
+    only for the headers looked up.
+
+    Headers outside of the ``schema``\
+    are never made into fields.
+
+    Lines ending with a bare LF are\
+    accepted. Obsolete line folding\
+    is rejected.
+
+    Usage::
+
+        headers_parser = HeadersParser()
+        headers_parser.feed(b'Host: example.com\\r\\nAccept: te')
+        # None
+        headers_parser.feed(b'xt/html\\r\\n\\r\\nbody')
+        # BufferedHeaders(...)
+        headers_parser.rest()
+        # b'body'
+
+    :param schema: ``HeaderSchema`` or ``None``
+    """
+
+    __slots__ = (
+        '_schema',
+        '_buffer',
+        '_line_start',
+        '_scan_start',
+        '_fields',
+        '_block_end')
+
+    def __init__(self, schema=None):
+        self._schema = schema
+        self._buffer = bytearray()
+        self._line_start = 0
+        self._scan_start = 0
+        self._fields = []
+        self._block_end = None
+
+    def is_done(self):
+        return self._block_end is not None
+
+    def rest(self):
+        """
+        Return the data fed past the\
+        header block (ie: the body start)
+
+        :return: ``bytes``
+        """
+        assert self.is_done()
+
+        return bytes(self._buffer[self._block_end:])
+
+    def feed(self, data):
+        """
+        Feed data read from the socket
+
+        :param data: ``bytes``
+        :return: ``Headers`` once the\
+        header block is complete,\
+        ``None`` otherwise
+        :raises exceptions.HeaderError:\
+        On malformed or too long block
+        """
+        assert not self.is_done()
+
+        buffer = self._buffer
+        buffer += data
+        find = buffer.find
+
+        while True:
+            line_end = find(b'\n', self._scan_start)
+
+            if line_end == -1:
+                self._scan_start = len(buffer)
+                self._check_length(self._scan_start)
+                return None
+
+            self._check_length(line_end)
+            self._scan_start = line_end + 1
+
+            if not self._parse_line(self._line_start, line_end):
+                self._block_end = self._scan_start
+                return self._headers()
+
+            self._line_start = self._scan_start
+
+    def _check_length(self, end):
+        if end - self._line_start > settings.HEADER_MAX_LEN:
+            raise exceptions.HeaderError(
+                'Header line is too long', status=431)
+
+        if end > settings.HEADERS_MAX_LEN:
+            raise exceptions.HeaderError(
+                'Header block is too long', status=431)
+
+    def _parse_line(self, start, end):
+        """
+        Store the offsets of a header line
+
+        :return: Whether the line is\
+        a header, otherwise it's the\
+        empty line ending the block
+        """
+        buffer = self._buffer
+
+        if end > start and buffer[end - 1] == ord('\r'):
+            end -= 1
+
+        if start == end:
+            return False
+
+        if buffer[start] in _OWS:
+            raise exceptions.BadRequest(
+                'Obsolete line folding is not allowed')
+
+        colon_i = buffer.find(b':', start, end)
+
+        if colon_i == -1:
+            raise exceptions.BadRequest(
+                'Header line must contain a colon')
+
+        # The name chars are checked once the header
+        # is created. A white-space before the colon
+        # must be rejected right away though
+        if colon_i == start or buffer[colon_i - 1] in _OWS:
+            raise exceptions.BadRequest(
+                'Header name must be a valid token')
+
+        value_start = colon_i + 1
+
+        while value_start < end and buffer[value_start] in _OWS:
+            value_start += 1
+
+        while end > value_start and buffer[end - 1] in _OWS:
+            end -= 1
+
+        self._fields.append((start, colon_i, value_start, end))
+        return True
+
+    def _headers(self):
+        return BufferedHeaders(
+            bytes(self._buffer[:self._block_end]),
+            self._fields,
+            schema=self._schema)
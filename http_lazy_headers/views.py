@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import keyword
+
+from . import fields
+
+
+def _attr_name(field):
+    attr = field.name.replace('-', '_')
+
+    if keyword.iskeyword(attr):  # from
+        attr += '_'
+
+    return attr
+
+
+def _lazy_property(field, slot):
+    """
+    Create a property parsing the header\
+    on first access and storing the\
+    result in the given slot
+    """
+    get_slot = slot.__get__
+    set_slot = slot.__set__
+
+    def getter(self):
+        try:
+            return get_slot(self)
+        except AttributeError:
+            pass
+
+        header = self._headers.get(field)
+
+        if header is None:
+            values = None
+        else:
+            values = header.values()
+
+        set_slot(self, values)
+        return values
+
+    return property(
+        getter,
+        doc='Parsed ``{}`` header'.format(field.__name__))
+
+
+class HeadersView:
+    """
+    Base of the typed views over a\
+    ``Headers`` collection. Subclasses\
+    are made by ``make_view``
+    """
+
+    __slots__ = ('_headers',)
+
+    def __init__(self, headers):
+        self._headers = headers
+
+    def __repr__(self):
+        return '{}({!r})'.format(
+            self.__class__.__name__,
+            self._headers)
+
+    @property
+    def headers(self):
+        return self._headers
+
+    def custom(self, name):
+        """
+        Return the values of\
+        a ``Custom`` header
+
+        :param name: Header name in lower case
+        :return: Values or ``None``
+        """
+        header = self._headers.get(name)
+
+        if header is None:
+            return None
+
+        return header.values()
+
+
+def make_view(name, field_classes, doc=None):
+    """
+    Create a ``HeadersView`` class with\
+    a lazy property for every field.
+
+    The property is the field name in\
+    snake case (ie: ``if_none_match``).\
+    It returns the header values or\
+    ``None`` when it's missing. Every\
+    header is parsed on first access\
+    and the result is stored in a\
+    slot of the view.
+
+    Usage::
+
+        PostView = make_view('PostView', [ContentType, ContentLength])
+        view = PostView(headers)
+        view.content_type
+        # ((('text', 'plain'), ParamsCI(())), )
+        view.content_length
+        # (100, )
+
+    :param name: Class name
+    :param field_classes: Iterable of field classes
+    :param doc: Class docstring
+    :return: ``HeadersView`` subclass
+    """
+    attrs = tuple(
+        (_attr_name(field), field)
+        for field in field_classes)
+    view = type(name, (HeadersView, ), {
+        '__doc__': doc,
+        '__slots__': tuple(
+            '_' + attr
+            for attr, _ in attrs)})
+
+    for attr, field in attrs:
+        setattr(
+            view,
+            attr,
+            _lazy_property(field, view.__dict__['_' + attr]))
+
+    return view
+
+
+_REQUEST_HEADERS_DOC = """
+    Typed view over the headers\
+    of a request, with a lazy property\
+    for every known field.
+
+    Usage::
+
+        headers = RequestHeaders(from_environ(environ))
+        headers.accept
+        # ((('text', 'html'), ParamsCI(())), ...)
+        headers.content_length
+        # (100, )
+        headers.if_none_match
+        # None
+    """
+
+RequestHeaders = make_view(
+    'RequestHeaders',
+    (getattr(fields, field_name)
+     for field_name in fields.__all__
+     if field_name != 'Custom'),
+    doc=_REQUEST_HEADERS_DOC)
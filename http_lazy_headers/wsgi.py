@@ -1,9 +1,47 @@
 # -*- coding: utf-8 -*-
 
+from . import fields
 from . import parser
+from .collections_ import Headers
 
 
-def from_wsgi(headers):
+# CGI variables with no ``HTTP_`` prefix,
+# these are empty strings when not sent
+_CONTENT_KEYS = frozenset((
+    'CONTENT_TYPE',
+    'CONTENT_LENGTH'))
+
+# Some servers also send these, they must be
+# ignored in favor of the CGI ones, see RFC 3875
+_HTTP_CONTENT_KEYS = frozenset(
+    'HTTP_' + key
+    for key in _CONTENT_KEYS)
+
+
+def _make_environ_registry():
+    registry = {}
+
+    for field_name in fields.__all__:
+        field = getattr(fields, field_name)
+
+        if field.name is None:  # Custom
+            continue
+
+        key = field.name.upper().replace('-', '_')
+
+        if key in _CONTENT_KEYS:
+            registry[key] = field
+        else:
+            registry['HTTP_' + key] = field
+
+    return registry
+
+
+# Environ key -> field class
+_ENVIRON_REGISTRY = _make_environ_registry()
+
+
+def from_wsgi(headers, schema=None):
     """
     Convert WSGI raw headers
     into lazy ``Headers``.
@@ -18,18 +56,67 @@ def from_wsgi(headers):
         #    ('Accept', 'text/html')))
 
     :param headers:
+    :param schema: ``HeaderSchema`` or ``None``
     :return:
     """
-    return parser.to_headers(
-        (h.lower(), (v, ))
-        for h, v in headers)
+    return parser.to_headers(headers, schema=schema)
+
+
+def from_environ(environ, schema=None):
+    """
+    Create lazy ``Headers`` out of\
+    the request headers in a WSGI environ.
+
+    Known headers are found by their\
+    environ key, no name is built for them.\
+    Other ``HTTP_`` keys become ``Custom``,\
+    except ``HTTP_CONTENT_TYPE`` and\
+    ``HTTP_CONTENT_LENGTH``, which are ignored.
+
+    Usage::
+
+        from_environ({
+            'CONTENT_LENGTH': '100',
+            'HTTP_ACCEPT_LANGUAGE': 'en',
+            'HTTP_X_FOO': 'bar',
+            'wsgi.version': (1, 0)})
+        # Headers((
+        #    ('Content-Length', '100'),
+        #    ('Accept-Language', 'en'),
+        #    ('X-Foo', 'bar')))
+
+    :param environ: WSGI environ
+    :param schema: ``HeaderSchema`` or ``None``
+    :return: ``Headers`` collection
+    """
+    headers = []
+    passthrough = []
+
+    for key, value in environ.items():
+        field = _ENVIRON_REGISTRY.get(key)
+
+        if field is not None:
+            if not value and key in _CONTENT_KEYS:
+                continue
+
+            if schema is None or field in schema.fields:
+                headers.append(
+                    field(raw_values_collection=[value]))
+            elif schema.passthrough:
+                passthrough.append((field.name, value))
+        elif (key.startswith('HTTP_') and
+                key not in _HTTP_CONTENT_KEYS):
+            name = key[5:].replace('_', '-').lower()
 
+            if schema is None or name in schema.customs:
+                headers.append(
+                    fields.Custom(
+                        name,
+                        raw_values_collection=[value]))
+            elif schema.passthrough:
+                passthrough.append((name, value))
 
-def from_environ(environ):
-    return from_wsgi(
-        (k[5:], v)
-        for k, v in environ.items()
-        if k.startswith('HTTP_'))
+    return Headers(headers, passthrough=tuple(passthrough))
 
 
 def to_wsgi(headers):
@@ -57,6 +144,6 @@ def to_wsgi(headers):
 
     for header in headers:
         wsgi_headers.append(
-            (header.name, header.to_str()))
+            (header.name, header.values_str()))
 
     return wsgi_headers
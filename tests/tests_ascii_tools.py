@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from http_lazy_headers.shared.utils import ascii_tools
+
+
+class IsMadeOfTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ascii_tools.deletion_table('abc-')
+
+    def test_str(self):
+        """
+        Should check short and long str
+        """
+        self.assertTrue(ascii_tools.is_made_of('', self.table))
+        self.assertTrue(ascii_tools.is_made_of('a-b', self.table))
+        self.assertTrue(ascii_tools.is_made_of('abc-' * 10, self.table))
+        self.assertFalse(ascii_tools.is_made_of('a-d', self.table))
+        self.assertFalse(ascii_tools.is_made_of('abc-' * 10 + 'd', self.table))
+
+    def test_bytes(self):
+        """
+        Should check bytes
+        """
+        self.assertTrue(ascii_tools.is_made_of(b'a-b', self.table))
+        self.assertTrue(ascii_tools.is_made_of(b'abc-' * 10, self.table))
+        self.assertFalse(ascii_tools.is_made_of(b'a-d', self.table))
+        self.assertFalse(ascii_tools.is_made_of(b'a\xe1', self.table))
+
+    def test_non_ascii(self):
+        """
+        Should not allow non-ascii chars
+        """
+        self.assertFalse(ascii_tools.is_made_of('a\xe1', self.table))
+        self.assertFalse(ascii_tools.is_made_of('aĀ', self.table))
+        self.assertFalse(
+            ascii_tools.is_made_of('abc-' * 10 + '\xe1', self.table))
+        self.assertFalse(
+            ascii_tools.is_made_of('abc-' * 10 + 'Ā', self.table))
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import http_lazy_headers as hlh
+
+
+class SerializationTest(unittest.TestCase):
+
+    def test_memoize(self):
+        """
+        Should format the values just once
+        """
+        header = hlh.Vary(['accept', 'accept-encoding'])
+        self.assertIsNone(header._str)
+        self.assertEqual(str(header), 'vary: accept, accept-encoding')
+        self.assertIs(str(header), str(header))
+        self.assertIs(header.values_str(), header.values_str())
+        self.assertEqual(header.values_str(), 'accept, accept-encoding')
+        self.assertEqual(bytes(header), b'vary: accept, accept-encoding')
+        self.assertIs(bytes(header), bytes(header))
+
+    def test_raw(self):
+        """
+        Should format parsed values
+        """
+        header = hlh.ContentLength(raw_values_collection=['100'])
+        self.assertEqual(bytes(header), b'content-length: 100')
+        self.assertEqual(header.values_str(), '100')
+
+    def test_set_cookie(self):
+        """
+        Should format a line per cookie
+        """
+        header = hlh.SetCookie([
+            hlh.cookie_pair('foo', 'bar'),
+            hlh.cookie_pair('baz', 'qux', secure=True)])
+        self.assertEqual(
+            bytes(header),
+            b'set-cookie: foo=bar\r\n'
+            b'set-cookie: baz=qux; Secure')
+        self.assertIs(str(header), str(header))
+
+    def test_params(self):
+        """
+        Should format the params just once
+        """
+        params = hlh.ParamsCI((('charset', 'utf-8'), ('q', 'a b')))
+        self.assertEqual(params.as_str(), 'charset=utf-8; q="a b"')
+        self.assertIs(params.as_str(), params.as_str())
+        self.assertEqual(params.as_str(','), 'charset=utf-8, q="a b"')
+        self.assertEqual(
+            params.merge({'q': 'c'}).as_str(), 'charset=utf-8; q=c')
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+import io
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import byte_ranges
+from http_lazy_headers import exceptions
+from http_lazy_headers import parser
+from http_lazy_headers.fields import content_type
+from http_lazy_headers.utils import override_settings
+
+
+def _resolve(raw_range, length=10, raw_if_range=None, **kwargs):
+    raw_headers = [('Range', raw_range)]
+
+    if raw_if_range is not None:
+        raw_headers.append(('If-Range', raw_if_range))
+
+    headers = parser.to_headers(raw_headers)
+    return byte_ranges.resolve(
+        headers.get(hlh.Range),
+        length,
+        if_range=headers.get(hlh.IfRange),
+        **kwargs)
+
+
+class ResolveTest(unittest.TestCase):
+
+    def test_resolve(self):
+        """
+        Should resolve the ranges against the length
+        """
+        for raw_range, ranges in (
+                ('bytes=0-4', ((0, 4), )),
+                ('bytes=5-', ((5, 9), )),
+                ('bytes=5-100', ((5, 9), )),
+                ('bytes=-3', ((7, 9), )),
+                ('bytes=-100', ((0, 9), )),
+                ('bytes=0-1,5-6', ((0, 1), (5, 6))),
+                ('bytes=5-6,0-1', ((0, 1), (5, 6)))):
+            self.assertEqual(_resolve(raw_range), ranges)
+
+    def test_coalesce(self):
+        """
+        Should coalesce overlapping and adjacent ranges
+        """
+        self.assertEqual(_resolve('bytes=0-4,3-6'), ((0, 6), ))
+        self.assertEqual(_resolve('bytes=0-4,5-6'), ((0, 6), ))
+        self.assertEqual(_resolve('bytes=0-4,3-6,-3'), ((0, 9), ))
+        self.assertEqual(_resolve('bytes=0-1,4-5,1-4'), ((0, 5), ))
+
+    def test_unsatisfiable(self):
+        """
+        Should return no ranges when none is satisfiable
+        """
+        self.assertEqual(_resolve('bytes=10-'), ())
+        self.assertEqual(_resolve('bytes=-0'), ())
+        self.assertEqual(_resolve('bytes=0-', length=0), ())
+        self.assertEqual(_resolve('bytes=20-30,0-1'), ((0, 1), ))
+
+    def test_ignore(self):
+        """
+        Should ignore invalid and unknown ranges
+        """
+        self.assertIsNone(byte_ranges.resolve(None, 10))
+        self.assertIsNone(_resolve('bytes=5-1'))
+        self.assertIsNone(_resolve('foo'))
+        self.assertIsNone(_resolve('items=0-1'))
+
+    @override_settings(RANGES_MAX=2)
+    def test_ranges_max(self):
+        """
+        Should ignore too many ranges
+        """
+        self.assertEqual(_resolve('bytes=0-1,3-4'), ((0, 1), (3, 4)))
+        self.assertIsNone(_resolve('bytes=0-1,3-4,6-7'))
+
+    @override_settings(RANGE_OVERLAPS_MAX=1)
+    def test_overlaps_max(self):
+        """
+        Should ignore too many overlapping ranges
+        """
+        self.assertEqual(_resolve('bytes=0-5,1-2'), ((0, 5), ))
+        self.assertEqual(_resolve('bytes=0-1,2-3,4-5'), ((0, 5), ))
+        self.assertIsNone(_resolve('bytes=0-5,1-2,3-4'))
+
+    def test_if_range(self):
+        """
+        Should ignore the ranges if the If-Range does not match
+        """
+        self.assertEqual(
+            _resolve(
+                'bytes=0-1',
+                raw_if_range='"xyzzy"',
+                etag=('xyzzy', False)),
+            ((0, 1), ))
+        self.assertIsNone(
+            _resolve(
+                'bytes=0-1',
+                raw_if_range='"foo"',
+                etag=('xyzzy', False)))
+        self.assertIsNone(_resolve('bytes=0-1', raw_if_range='"xyzzy"'))
+
+    def test_large(self):
+        """
+        Should resolve positions past the content max size
+        """
+        self.assertEqual(
+            _resolve('bytes=10000000000-', length=20000000000),
+            ((10000000000, 19999999999), ))
+
+    def test_content_ranges(self):
+        """
+        Should return the Content-Range values
+        """
+        self.assertEqual(
+            byte_ranges.content_ranges(((0, 1), (5, 9)), 10),
+            (('bytes', (0, 1), 10, None), ('bytes', (5, 9), 10, None)))
+        self.assertEqual(
+            str(hlh.ContentRange(byte_ranges.content_ranges((), 10))),
+            'content-range: bytes */10')
+
+
+class MultipartByteRangesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.body = byte_ranges.MultipartByteRanges(
+            ((0, 1), (5, 9)),
+            10,
+            content_type=hlh.ContentType([
+                content_type.content_type(
+                    hlh.MediaType.text,
+                    hlh.MediaType.plain)]),
+            boundary='THIS_STRING_SEPARATES')
+        self.expected = (
+            b'--THIS_STRING_SEPARATES\r\n'
+            b'content-type: text/plain\r\n'
+            b'content-range: bytes 0-1/10\r\n'
+            b'\r\n'
+            b'01\r\n'
+            b'--THIS_STRING_SEPARATES\r\n'
+            b'content-type: text/plain\r\n'
+            b'content-range: bytes 5-9/10\r\n'
+            b'\r\n'
+            b'56789\r\n'
+            b'--THIS_STRING_SEPARATES--\r\n')
+
+    def test_iter_file(self):
+        """
+        Should read the ranges out of the file
+        """
+        self.assertEqual(
+            b''.join(self.body.iter_file(
+                io.BytesIO(b'0123456789'), chunk_size=2)),
+            self.expected)
+        self.assertEqual(self.body.content_length(), len(self.expected))
+
+    def test_iter_buffer(self):
+        """
+        Should slice the ranges out of the buffer
+        """
+        self.assertEqual(
+            b''.join(self.body.iter_buffer(b'0123456789')),
+            self.expected)
+
+    def test_parts(self):
+        """
+        Should return the file offsets of the ranges
+        """
+        self.assertEqual(
+            [part for part in self.body.parts()
+             if isinstance(part, tuple)],
+            [(0, 2), (5, 5)])
+
+    def test_short_file(self):
+        """
+        Should raise when the file is too short
+        """
+        self.assertRaises(
+            exceptions.InternalError,
+            b''.join,
+            self.body.iter_file(io.BytesIO(b'0123')))
+
+    def test_content_type(self):
+        """
+        Should return the multipart content type
+        """
+        self.assertEqual(
+            str(self.body.content_type()),
+            'content-type: multipart/byteranges; '
+            'boundary=THIS_STRING_SEPARATES')
+        self.assertNotEqual(
+            byte_ranges.MultipartByteRanges(((0, 1), ), 10).boundary,
+            byte_ranges.MultipartByteRanges(((0, 1), ), 10).boundary)
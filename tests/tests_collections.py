@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import collections_
+from http_lazy_headers import exceptions
+
+
+class HeadersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.headers = collections_.HeadersMut([
+            hlh.ContentLength([100]),
+            hlh.Custom('x-foo', ['bar'])])
+
+    def test_lookup(self):
+        """
+        Should look up by class, instance or name
+        """
+        content_length = self.headers[hlh.ContentLength]
+        self.assertIs(self.headers[hlh.ContentLength([1])], content_length)
+        self.assertIs(self.headers['content-length'], content_length)
+        self.assertIs(self.headers.get(hlh.ContentLength), content_length)
+        self.assertIn(hlh.ContentLength, self.headers)
+        self.assertIn('x-foo', self.headers)
+        self.assertNotIn(hlh.Age, self.headers)
+        self.assertIsNone(self.headers.get(hlh.Age))
+        self.assertRaises(KeyError, lambda: self.headers[hlh.Age])
+
+    def test_pop(self):
+        """
+        Should pop by class or name
+        """
+        self.assertEqual(
+            self.headers.pop(hlh.ContentLength).values(), (100, ))
+        self.assertEqual(
+            self.headers.pop('x-foo').values(), ('bar', ))
+        self.assertIsNone(self.headers.pop(hlh.ContentLength))
+        self.assertFalse(self.headers)
+
+
+class SlotHeadersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.headers = collections_.SlotHeadersMut([
+            hlh.Custom('x-foo', ['bar']),
+            hlh.ContentLength([100]),
+            hlh.Age([1])])
+
+    def test_lookup(self):
+        """
+        Should look up by class, instance or name
+        """
+        content_length = self.headers[hlh.ContentLength]
+        self.assertIs(self.headers[hlh.ContentLength([1])], content_length)
+        self.assertIs(self.headers['content-length'], content_length)
+        self.assertEqual(self.headers['x-foo'].values(), ('bar', ))
+        self.assertIn(hlh.Age, self.headers)
+        self.assertNotIn(hlh.Accept, self.headers)
+        self.assertNotIn('x-bar', self.headers)
+        self.assertIsNone(self.headers.get(hlh.Accept))
+        self.assertRaises(KeyError, lambda: self.headers[hlh.Accept])
+
+    def test_order(self):
+        """
+        Should keep the insertion order
+        """
+        age = hlh.Age([2])
+        self.headers.set(age)
+        self.headers.set(hlh.Allow(['GET']))
+        self.assertEqual(
+            [h.name for h in self.headers],
+            ['x-foo', 'content-length', 'age', 'allow'])
+        self.assertIs(self.headers[hlh.Age], age)
+        self.assertEqual(len(self.headers), 4)
+
+    def test_pop(self):
+        """
+        Should pop by class or name
+        """
+        self.assertEqual(
+            self.headers.pop(hlh.ContentLength).values(), (100, ))
+        self.assertEqual(
+            self.headers.pop('x-foo').values(), ('bar', ))
+        self.assertIsNone(self.headers.pop(hlh.ContentLength))
+        self.assertEqual([h.name for h in self.headers], ['age'])
+        self.headers.clear()
+        self.assertFalse(self.headers)
+
+    def test_frozen_copy(self):
+        """
+        Should not share the headers
+        """
+        headers = self.headers.frozen_copy()
+        self.headers.pop(hlh.Age)
+        self.headers.pop('x-foo')
+        self.assertIn(hlh.Age, headers)
+        self.assertIn('x-foo', headers)
+        self.assertEqual(len(headers), 3)
+        self.assertEqual(
+            str(headers),
+            'x-foo: bar\r\ncontent-length: 100\r\nage: 1\r\n')
+
+    def test_custom_known_name(self):
+        """
+        Should replace the known header, same as Headers
+        """
+        raw_headers = [
+            hlh.Accept(raw_values_collection=['text/html']),
+            hlh.Age([1]),
+            hlh.Custom('accept', ['*/*'])]
+        headers = collections_.HeadersMut(raw_headers)
+        slot_headers = collections_.SlotHeadersMut(raw_headers)
+        self.assertEqual(len(slot_headers), len(headers))
+        self.assertEqual(str(slot_headers), str(headers))
+        self.assertEqual(str(slot_headers), 'accept: */*\r\nage: 1\r\n')
+        self.assertIs(slot_headers[hlh.Accept], headers[hlh.Accept])
+        self.assertIs(slot_headers['accept'], headers['accept'])
+        accept = hlh.Accept(raw_values_collection=['text/plain'])
+        headers.set(accept)
+        slot_headers.set(accept)
+        self.assertEqual(str(slot_headers), str(headers))
+        self.assertIs(slot_headers.pop('accept'), accept)
+        self.assertNotIn(hlh.Accept, slot_headers)
+        self.assertEqual(len(slot_headers), 1)
+
+    def test_order_pop(self):
+        """
+        Should move a header popped and set again to the end
+        """
+        self.headers.pop(hlh.ContentLength)
+        self.headers.pop('x-foo')
+        self.headers.set(hlh.ContentLength([1]))
+        self.headers.set(hlh.Custom('x-foo', ['baz']))
+        self.headers.set(hlh.Age([2]))
+        self.assertEqual(
+            [h.name for h in self.headers],
+            ['age', 'content-length', 'x-foo'])
+        self.assertEqual(len(self.headers), 3)
+
+    def test_no_dict(self):
+        """
+        Should not create an instance dict
+        """
+        self.assertFalse(hasattr(self.headers, '__dict__'))
+        self.assertFalse(
+            hasattr(self.headers.frozen_copy(), '__dict__'))
+
+    def test_merge(self):
+        """
+        Should set every header of a collection
+        """
+        self.headers.merge(collections_.Headers([
+            hlh.Age([2]),
+            hlh.Custom('x-bar', ['baz'])]).freeze())
+        self.assertEqual(
+            [h.name for h in self.headers],
+            ['x-foo', 'content-length', 'age', 'x-bar'])
+        self.assertEqual(self.headers[hlh.Age].values(), (2, ))
+        self.assertEqual(self.headers['x-bar'].values(), ('baz', ))
+
+
+class SerializeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.headers = collections_.Headers([
+            hlh.ContentLength([100]),
+            hlh.SetCookie([
+                hlh.cookie_pair('foo', 'bar'),
+                hlh.cookie_pair('baz', 'qux')])])
+
+    def test_to_bytes(self):
+        """
+        Should serialize the header block
+        """
+        block = (
+            b'content-length: 100\r\n'
+            b'set-cookie: foo=bar\r\n'
+            b'set-cookie: baz=qux\r\n'
+            b'\r\n')
+        self.assertEqual(self.headers.to_bytes(), block)
+        self.assertEqual(
+            self.headers.to_bytes('HTTP/1.1 200 OK'),
+            b'HTTP/1.1 200 OK\r\n' + block)
+        self.assertEqual(
+            self.headers.to_bytes(b'HTTP/1.1 200 OK'),
+            b'HTTP/1.1 200 OK\r\n' + block)
+        self.assertEqual(
+            self.headers.to_bytes().decode('latin1'),
+            str(self.headers) + '\r\n')
+        self.assertEqual(collections_.Headers().to_bytes(), b'\r\n')
+
+    def test_write_into(self):
+        """
+        Should extend the buffer
+        """
+        buffer = bytearray(b'foo')
+        self.headers.write_into(buffer, 'HTTP/1.1 200 OK')
+        self.assertEqual(
+            bytes(buffer),
+            b'foo' + self.headers.to_bytes('HTTP/1.1 200 OK'))
+
+    def test_to_buffers(self):
+        """
+        Should return the memoized header bytes
+        """
+        buffers = self.headers.to_buffers()
+        self.assertEqual(len(buffers), 5)
+        self.assertIs(
+            buffers[0], bytes(self.headers[hlh.ContentLength]))
+        self.assertEqual(b''.join(buffers), self.headers.to_bytes())
+
+
+class FrozenHeadersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.frozen = collections_.Headers([
+            hlh.Vary(['accept']),
+            hlh.Custom('x-content-type-options', ['nosniff'])]).freeze()
+        self.block = (
+            b'vary: accept\r\n'
+            b'x-content-type-options: nosniff\r\n')
+
+    def test_freeze(self):
+        """
+        Should store the header block
+        """
+        self.assertIsInstance(self.frozen, collections_.FrozenHeaders)
+        self.assertEqual(self.frozen._block, self.block)
+        self.assertEqual(self.frozen.to_buffers(), [self.block, b'\r\n'])
+        self.assertEqual(
+            self.frozen.to_bytes('HTTP/1.1 200 OK'),
+            b'HTTP/1.1 200 OK\r\n' + self.block + b'\r\n')
+        self.assertEqual(len(self.frozen), 2)
+
+    def test_check(self):
+        """
+        Should check the values
+        """
+        self.assertRaises(
+            exceptions.HeaderError,
+            collections_.Headers([
+                hlh.ContentLength(raw_values_collection=['foo'])]).freeze)
+
+    def test_merge(self):
+        """
+        Should write the frozen block verbatim
+        """
+        headers = collections_.HeadersMut([hlh.ContentLength([100])])
+        headers.merge(self.frozen)
+        self.assertIn(hlh.Vary, headers)
+        self.assertEqual(
+            headers.to_buffers(),
+            [self.block, b'content-length: 100', b'\r\n', b'\r\n'])
+
+    def test_merge_replace(self):
+        """
+        Should not write a frozen block once changed
+        """
+        headers = collections_.HeadersMut([hlh.ContentLength([100])])
+        headers.merge(self.frozen)
+        headers.set(hlh.Vary(['accept-encoding']))
+        self.assertEqual(
+            headers.to_bytes(),
+            b'content-length: 100\r\n'
+            b'vary: accept-encoding\r\n'
+            b'x-content-type-options: nosniff\r\n'
+            b'\r\n')
+        headers.merge(self.frozen)
+        headers.pop('x-content-type-options')
+        self.assertEqual(
+            headers.to_bytes(),
+            b'content-length: 100\r\n'
+            b'vary: accept\r\n'
+            b'\r\n')
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+
+from http_lazy_headers import exceptions
+from http_lazy_headers.shared.common import dates
+from http_lazy_headers.utils import override_settings
+
+
+class DateClockTest(unittest.TestCase):
+
+    def test_now(self):
+        """
+        Should update the time once per second
+        """
+        times = [784111777.1, 784111777.9, 784111778.0]
+        clock = dates.DateClock(time_func=lambda: times[0])
+        now = clock.now()
+        self.assertEqual(now.seconds, 784111777)
+        self.assertEqual(
+            now.date_time,
+            datetime.datetime(1994, 11, 6, 8, 49, 37))
+        self.assertEqual(now.date_str, 'Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertEqual(now.date_bytes, b'Sun, 06 Nov 1994 08:49:37 GMT')
+        times.pop(0)
+        self.assertIs(clock.now(), now)
+        times.pop(0)
+        self.assertEqual(
+            clock.now().date_str, 'Sun, 06 Nov 1994 08:49:38 GMT')
+
+
+class FormatTest(unittest.TestCase):
+
+    def test_format_epoch(self):
+        """
+        Should format POSIX seconds
+        """
+        self.assertEqual(
+            dates.format_epoch(784111777),
+            'Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertEqual(
+            dates.format_epoch(0),
+            'Thu, 01 Jan 1970 00:00:00 GMT')
+
+    def test_format_months(self):
+        """
+        Should format every month
+        """
+        self.assertEqual(
+            [dates.format_date(datetime.datetime(2016, m, 1))[8:11]
+             for m in range(1, 13)],
+            ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+
+
+class CleanIMFFixDateTest(unittest.TestCase):
+
+    def setUp(self):
+        dates._IMF_FIXDATE_CACHE.clear()
+
+    def test_clean(self):
+        """
+        Should parse the fixed positions
+        """
+        self.assertEqual(
+            dates.clean_imf_fix_date('Sun, 06 Nov 1994 08:49:37 GMT'),
+            datetime.datetime(1994, 11, 6, 8, 49, 37))
+        self.assertEqual(
+            dates.clean_imf_fix_date('Sat, 31 Dec 2016 23:59:60 GMT'),
+            datetime.datetime(2016, 12, 31, 23, 59, 59))
+
+    def test_bad(self):
+        """
+        Should reject bad dates
+        """
+        for raw_date in (
+                'Sun, 06 Nov 1994 08:49:37 UTC',
+                'Sun,  6 Nov 1994 08:49:37 GMT',
+                'Mon, 06 Nov 1994 08:49:37 GMT',
+                'Sun, 06 Nob 1994 08:49:37 GMT',
+                'Sun, 31 Nov 1994 08:49:37 GMT',
+                'Sun, 06 Nov 1994 08:49:+7 GMT',
+                'Sun, 06 Nov 1994 08.49.37 GMT',
+                'Sun, 06 Nov 1994 08:49:37 GMT '):
+            self.assertRaises(
+                exceptions.HeaderError,
+                dates.clean_imf_fix_date,
+                raw_date)
+
+        self.assertFalse(dates._IMF_FIXDATE_CACHE)
+
+    def test_cache(self):
+        """
+        Should cache the parsed dates
+        """
+        date_time = dates.clean_imf_fix_date(
+            'Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertIs(
+            dates.clean_imf_fix_date('Sun, 06 Nov 1994 08:49:37 GMT'),
+            date_time)
+
+        for seconds in range(dates._IMF_FIXDATE_CACHE_MAX):
+            dates.clean_imf_fix_date(dates.format_epoch(seconds))
+
+        self.assertLessEqual(
+            len(dates._IMF_FIXDATE_CACHE),
+            dates._IMF_FIXDATE_CACHE_MAX)
+
+
+class EpochTest(unittest.TestCase):
+
+    def test_clean(self):
+        """
+        Should parse every format into POSIX seconds
+        """
+        for raw_date in (
+                'Sun, 06 Nov 1994 08:49:37 GMT',
+                'Sunday, 06-Nov-94 08:49:37 GMT',
+                'Sun Nov  6 08:49:37 1994'):
+            self.assertEqual(
+                dates.clean_date_time(raw_date, as_epoch=True),
+                784111777)
+
+        self.assertEqual(
+            dates.clean_imf_fix_date(
+                'Sat, 31 Dec 2016 23:59:60 GMT', as_epoch=True),
+            1483228799)
+
+    def test_bad(self):
+        """
+        Should reject the dates rejected in datetime mode
+        """
+        for raw_date in (
+                'Mon, 06 Nov 1994 08:49:37 GMT',
+                'Sun, 31 Nov 1994 08:49:37 GMT',
+                'Tue, 29 Feb 2100 08:49:37 GMT'):
+            self.assertRaises(
+                exceptions.HeaderError,
+                dates.clean_date_time,
+                raw_date,
+                as_epoch=True)
+
+    def test_default(self):
+        """
+        Should convert a datetime default
+        """
+        self.assertEqual(
+            dates.clean_date_time(
+                'foo', as_epoch=True, default=datetime.datetime.min),
+            dates.to_epoch(datetime.datetime.min))
+
+    @override_settings(DATES_AS_EPOCH=True)
+    def test_settings(self):
+        """
+        Should follow the dates mode setting
+        """
+        self.assertEqual(
+            dates.clean_date_time('Sun, 06 Nov 1994 08:49:37 GMT'),
+            784111777)
+        self.assertEqual(
+            dates.format_date(784111777),
+            'Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertTrue(dates.is_date(784111777))
+        self.assertFalse(dates.is_date(datetime.datetime.now()))
+
+    def test_to_epoch(self):
+        """
+        Should convert between the modes
+        """
+        date_time = datetime.datetime(1994, 11, 6, 8, 49, 37)
+        self.assertEqual(dates.to_epoch(date_time), 784111777)
+        self.assertEqual(dates.to_epoch(784111777), 784111777)
+        self.assertEqual(dates.to_datetime(784111777), date_time)
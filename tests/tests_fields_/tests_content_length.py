@@ -18,6 +18,21 @@ class ContentLengthTest(utils.FieldTestCase):
             ['3495, 3495, 3495, 3495'],
             (3495,))
 
+    def test_raw_bytes(self):
+        """
+        Should parse bytes without decoding them
+        """
+        self.assertFieldRawEqual(
+            [b'3495'],
+            (3495,))
+
+        self.assertFieldRawEqual(
+            [b'3495, 3495', b'3495'],
+            (3495,))
+
+        self.assertRaisesHeaderError([b'34 95'])
+        self.assertRaisesHeaderError([b'3495\xff'])
+
     def test_str(self):
         self.assertFieldStrEqual(
             (3495,),
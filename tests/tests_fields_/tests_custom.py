@@ -16,6 +16,21 @@ class CustomTestCase(utils.FieldTestCase):
             ['foo, bar', 'baz'],
             ('foo, bar', 'baz'))
 
+    def test_raw_bytes(self):
+        """
+        Should allow bytes name and values
+        """
+        self.assertEqual(
+            hlh.Custom(
+                name=b'Foo',
+                raw_values_collection=[b'foo, bar']).values(),
+            ('foo, bar',))
+        self.assertEqual(
+            hlh.Custom(
+                name=b'Foo',
+                raw_values_collection=[b'foo, bar']).name,
+            'foo')
+
     def test_str(self):
         self.assertFieldStrEqual(
             ('foo', 'bar', 'baz'),
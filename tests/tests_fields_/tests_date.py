@@ -4,6 +4,9 @@ import datetime
 
 import http_lazy_headers as hlh
 
+from http_lazy_headers.shared.common import dates
+from http_lazy_headers.utils import override_settings
+
 from . import utils
 
 
@@ -91,3 +94,82 @@ class DateTest(utils.FieldTestCase):
         self.assertRaisesInternalError(['foo'])
         self.assertRaisesInternalError([None])
         self.assertRaisesInternalError([good_date, good_date])
+
+    def test_str_september(self):
+        self.assertFieldStrEqual(
+            (datetime.datetime(
+                year=2016,
+                month=9,
+                day=3,
+                hour=1,
+                minute=2,
+                second=3),),
+            'date: Sat, 03 Sep 2016 01:02:03 GMT')
+        self.assertFieldRawEqual(
+            ['Sat, 03 Sep 2016 01:02:03 GMT'],
+            (datetime.datetime(
+                year=2016,
+                month=9,
+                day=3,
+                hour=1,
+                minute=2,
+                second=3),))
+
+    def test_now(self):
+        header = hlh.Date.now()
+        self.assertIs(hlh.Date.now(), header)
+        self.assertIsInstance(header.values()[0], datetime.datetime)
+
+    def test_now_dates_mode(self):
+        """
+        Should not share the header between dates modes
+        """
+        clock = dates.clock
+        self.addCleanup(setattr, dates, 'clock', clock)
+        dates.clock = dates.DateClock(time_func=lambda: 784111777.5)
+
+        @override_settings(DATES_AS_EPOCH=True)
+        def epoch_now():
+            return hlh.Date.now()
+
+        header = hlh.Date.now()
+        self.assertEqual(
+            header.values(),
+            (datetime.datetime(1994, 11, 6, 8, 49, 37),))
+        self.assertEqual(epoch_now().values(), (784111777,))
+        self.assertIs(hlh.Date.now(), header)
+        self.assertIs(epoch_now(), epoch_now())
+        self.assertEqual(
+            str(epoch_now()), 'date: Sun, 06 Nov 1994 08:49:37 GMT')
+
+    def test_now_clock_str(self):
+        """
+        Should take the serialized date from the clock
+        """
+        clock = dates.clock
+        self.addCleanup(setattr, dates, 'clock', clock)
+        dates.clock = dates.DateClock(time_func=lambda: 784111778.5)
+        header = hlh.Date.now()
+        self.assertIs(header.values_str(), dates.clock.now().date_str)
+        self.assertEqual(
+            str(header), 'date: Sun, 06 Nov 1994 08:49:38 GMT')
+        self.assertEqual(
+            bytes(header), b'date: Sun, 06 Nov 1994 08:49:38 GMT')
+        self.assertEqual(str(header), header._field_str())
+
+    @override_settings(DATES_AS_EPOCH=True)
+    def test_epoch(self):
+        self.assertFieldRawEqual(
+            ['Sun, 06 Nov 1994 08:49:37 GMT'],
+            (784111777,))
+        self.assertFieldStrEqual(
+            (784111777,),
+            'date: Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertRaisesInternalError(
+            [datetime.datetime(1994, 11, 6, 8, 49, 37)])
+        self.assertEqual(hlh.Date([784111777]).epoch(), 784111777)
+
+    def test_epoch_from_datetime(self):
+        self.assertEqual(
+            hlh.Date([datetime.datetime(1994, 11, 6, 8, 49, 37)]).epoch(),
+            784111777)
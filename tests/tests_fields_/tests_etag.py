@@ -26,6 +26,20 @@ class ETagTest(utils.FieldTestCase):
             ['W/""'],
             (('', True),))
 
+    def test_raw_bytes(self):
+        """
+        Should parse bytes and decode the etag only
+        """
+        self.assertFieldRawEqual(
+            [b'W/"xyzzy"'],
+            (('xyzzy', True),))
+
+        self.assertFieldRawEqual(
+            [b'"xyzzy"'],
+            (('xyzzy', False),))
+
+        self.assertRaisesHeaderError([b'xyzzy'])
+
     def test_str(self):
         self.assertFieldStrEqual(
             (('xyzzy', True),),
@@ -3,6 +3,7 @@
 import datetime
 
 import http_lazy_headers as hlh
+from http_lazy_headers.utils import override_settings
 
 from . import utils
 
@@ -93,3 +94,23 @@ class ExpiresTest(utils.FieldTestCase):
         self.assertRaisesInternalError(['foo'])
         self.assertRaisesInternalError([None])
         self.assertRaisesInternalError([good_date, good_date])
+
+    @override_settings(DATES_AS_EPOCH=True)
+    def test_epoch(self):
+        """
+        Should clean invalid dates as zero in epoch mode
+        """
+        self.assertFieldRawEqual(
+            ['Thu, 01 Dec 1994 16:00:00 GMT'],
+            (786297600,))
+        self.assertFieldRawEqual(['0'], (0,))
+        self.assertFieldRawEqual(['bad value'], (0,))
+        self.assertEqual(
+            str(hlh.Expires(raw_values_collection=['0'])),
+            'expires: 0')
+        self.assertEqual(
+            str(hlh.Expires(raw_values_collection=['bad value'])),
+            'expires: 0')
+        self.assertFieldStrEqual(
+            (786297600,),
+            'expires: Thu, 01 Dec 1994 16:00:00 GMT')
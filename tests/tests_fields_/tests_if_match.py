@@ -16,6 +16,20 @@ class IfMatchTest(utils.FieldTestCase):
              ('r2d2xxxx', False),
              ('c3piozzzz', False)))
 
+    def test_raw_bytes(self):
+        """
+        Should parse bytes and decode the etags only
+        """
+        self.assertFieldRawEqual(
+            [b'"xyzzy", "r2d2xxxx"', b'"c3piozzzz"'],
+            (('xyzzy', False),
+             ('r2d2xxxx', False),
+             ('c3piozzzz', False)))
+
+        self.assertFieldRawEqual(
+            [b'*'],
+            (('*', False),))
+
     def test_str(self):
         self.assertFieldStrEqual(
             (('xyzzy', False),
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import http_lazy_headers as hlh
+from http_lazy_headers.utils import override_settings
 
 from . import utils
 
@@ -88,6 +89,14 @@ class RangeTest(utils.FieldTestCase):
         self.assertRaisesHeaderError(['bytes=0-499,'])
         self.assertRaisesHeaderError(['bytes=1-100,,101-200'])
 
+    @override_settings(RANGES_MAX=2)
+    def test_ranges_max(self):
+        """
+        Should not allow more ranges than the setting
+        """
+        self.assertRawOK(['bytes=0-1,2-3'])
+        self.assertRaisesHeaderError(['bytes=0-1,2-3,4-5'])
+
     def test_bad_values(self):
         """
         Should not allow bad values
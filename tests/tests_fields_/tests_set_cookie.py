@@ -3,6 +3,7 @@
 import datetime
 
 import http_lazy_headers as hlh
+from http_lazy_headers.utils import override_settings
 
 from . import utils
 
@@ -347,3 +348,28 @@ class SetCookieTest(utils.FieldTestCase):
                 'SID',
                 '31d4d96e407aad42',
                 extension=[';'])])
+
+    @override_settings(DATES_AS_EPOCH=True)
+    def test_epoch(self):
+        """
+        Should allow datetime and int expires in epoch mode
+        """
+        self.assertFieldStrEqual(
+            (hlh.cookie_pair(
+                'SID',
+                '31d4d96e407aad42',
+                expires=datetime.datetime(1994, 11, 15, 8, 12, 31)),),
+            'set-cookie: SID=31d4d96e407aad42; '
+            'expires=Tue, 15 Nov 1994 08:12:31 GMT')
+        self.assertFieldStrEqual(
+            (hlh.cookie_pair(
+                'SID',
+                '31d4d96e407aad42',
+                expires=784887151),),
+            'set-cookie: SID=31d4d96e407aad42; '
+            'expires=Tue, 15 Nov 1994 08:12:31 GMT')
+        self.assertRaisesInternalError([
+            hlh.cookie_pair(
+                'SID',
+                '31d4d96e407aad42',
+                expires='foo')])
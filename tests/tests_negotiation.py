@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import exceptions
+from http_lazy_headers import negotiation
+from http_lazy_headers.shared.values import media_types
+
+
+class MediaTypeNegotiatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.json = media_types.media_type(
+            hlh.MediaType.application, hlh.MediaType.json)
+        self.html = media_types.media_type(
+            hlh.MediaType.text, hlh.MediaType.html)
+        self.plain = media_types.media_type(
+            hlh.MediaType.text,
+            hlh.MediaType.plain,
+            charset=hlh.Charsets.utf_8)
+        self.negotiator = negotiation.MediaTypeNegotiator([
+            self.json,
+            self.html,
+            self.plain])
+
+    def test_negotiate(self):
+        """
+        Should return the offer with the highest quality
+        """
+        for raw_accept, offer in (
+                ('text/html', self.html),
+                ('TEXT/HTML', self.html),
+                ('text/html;q=0.5, application/json;q=0.8', self.json),
+                ('text/*', self.html),
+                ('*/*', self.json),
+                ('text/*;q=0.5, application/*;q=0.4', self.html),
+                ('text/plain;charset=UTF-8', self.plain)):
+            self.assertEqual(
+                self.negotiator.negotiate(raw_accept), offer)
+
+    def test_specificity(self):
+        """
+        Should take the quality of the most specific range
+        """
+        self.assertEqual(
+            self.negotiator.negotiate('text/*;q=0.9, text/html;q=0'),
+            self.plain)
+        self.assertEqual(
+            self.negotiator.negotiate(
+                '*/*;q=0.1, text/plain;q=0.5, '
+                'text/plain;charset=utf-8;q=0.2, application/json;q=0.3'),
+            self.json)
+
+    def test_not_acceptable(self):
+        """
+        Should return None when no offer is acceptable
+        """
+        for raw_accept in (
+                'image/png',
+                'text/html;level=1',
+                '*/*;q=0',
+                ''):
+            self.assertIsNone(self.negotiator.negotiate(raw_accept))
+
+    def test_missing(self):
+        """
+        Should return the first offer when the header is missing
+        """
+        self.assertEqual(self.negotiator.negotiate(None), self.json)
+
+    def test_header(self):
+        """
+        Should take the header or its raw value
+        """
+        self.assertEqual(
+            self.negotiator.negotiate(hlh.Accept(
+                raw_values_collection=['text/html'])),
+            self.html)
+        self.assertEqual(
+            self.negotiator.negotiate(b'text/html'),
+            self.html)
+        self.assertEqual(
+            self.negotiator.negotiate(hlh.Accept([
+                media_types.media_type(
+                    hlh.MediaType.text, hlh.MediaType.star)])),
+            self.html)
+
+    def test_memoize(self):
+        """
+        Should memoize the decisions by raw value
+        """
+        self.negotiator.negotiate('image/png')
+        self.negotiator.negotiate('image/png')
+        self.negotiator.negotiate('text/html')
+        self.assertEqual(self.negotiator.stats()['hits'], 1)
+        self.assertEqual(self.negotiator.stats()['entries'], 2)
+
+    def test_bad(self):
+        """
+        Should raise on malformed header
+        """
+        self.assertRaises(
+            exceptions.HeaderError,
+            self.negotiator.negotiate,
+            'text')
+        self.assertEqual(self.negotiator.stats()['entries'], 0)
+
+    def test_offers(self):
+        """
+        Should accept offers as str
+        """
+        negotiator = negotiation.MediaTypeNegotiator([
+            'application/json',
+            'text/plain; charset=utf-8'])
+        self.assertEqual(
+            negotiator.negotiate('text/plain'),
+            (('text', 'plain'), hlh.ParamsCI([('charset', 'utf-8')])))
+        self.assertEqual(negotiator.offers()[0][0], ('application', 'json'))
+
+
+class LanguageMatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = negotiation.LanguageMatcher([
+            'en',
+            'en-GB',
+            'de-Latn-DE',
+            'zh-Hant-CN',
+            'fr'])
+
+    def test_lookup(self):
+        """
+        Should truncate the ranges until a locale is found
+        """
+        for raw_accept_language, locale in (
+                ('en-GB', 'en-GB'),
+                ('en-us', 'en'),
+                ('en-gb-oxendict, de;q=0.5', 'en-GB'),
+                ('zh-hant-cn-x-private1-private2', 'zh-Hant-CN'),
+                ('zh-hant, fr;q=0.1', 'fr'),
+                ('de;q=0.1, de-latn-de;q=0.5', 'de-Latn-DE'),
+                ('es, fr', 'fr')):
+            self.assertEqual(
+                self.matcher.negotiate(raw_accept_language), locale)
+
+    def test_lookup_default(self):
+        """
+        Should return the default when no locale is found
+        """
+        self.assertIsNone(self.matcher.negotiate('es'))
+        self.assertIsNone(self.matcher.negotiate('*'))
+        self.assertIsNone(self.matcher.negotiate('en;q=0'))
+        self.assertEqual(self.matcher.negotiate(None), 'en')
+
+        matcher = negotiation.LanguageMatcher(['en', 'fr'], default='fr')
+        self.assertEqual(matcher.negotiate('es'), 'fr')
+        self.assertEqual(matcher.negotiate(None), 'fr')
+
+    def test_filter(self):
+        """
+        Should return the matching locales by priority
+        """
+        self.assertEqual(
+            self.matcher.filter('fr, en;q=0.5'),
+            ('fr', 'en', 'en-GB'))
+        self.assertEqual(
+            self.matcher.filter('de-de, en;q=0.5'),
+            ('en', 'en-GB'))
+        self.assertEqual(
+            self.matcher.filter('en-gb, *;q=0.1'),
+            ('en-GB', 'en', 'de-Latn-DE', 'zh-Hant-CN', 'fr'))
+        self.assertEqual(self.matcher.filter('es'), ())
+        self.assertEqual(
+            self.matcher.filter(None),
+            self.matcher.locales())
+
+    def test_filter_extended(self):
+        """
+        Should skip the sub-tags not in the range
+        """
+        self.assertEqual(
+            self.matcher.filter('de-de, en;q=0.5', extended=True),
+            ('de-Latn-DE', 'en', 'en-GB'))
+        self.assertEqual(
+            self.matcher.filter('zh-cn', extended=True),
+            ('zh-Hant-CN', ))
+        self.assertEqual(
+            self.matcher.filter('de-de', extended=False),
+            ())
+
+    def test_filter_not_acceptable(self):
+        """
+        Should filter out the locales of zero weight ranges
+        """
+        self.assertEqual(
+            self.matcher.filter('en, en-gb;q=0'),
+            ('en', ))
+        self.assertEqual(
+            self.matcher.filter('en-gb, en;q=0'),
+            ('en-GB', ))
+        self.assertEqual(
+            self.matcher.filter('*, fr;q=0'),
+            ('en', 'en-GB', 'de-Latn-DE', 'zh-Hant-CN'))
+
+    def test_memoize(self):
+        """
+        Should memoize the results by raw value
+        """
+        self.matcher.negotiate('en-us')
+        self.matcher.negotiate('en-us')
+        self.assertEqual(self.matcher.stats()['hits'], 1)
+        self.assertIs(
+            self.matcher.filter('en-us, fr'),
+            self.matcher.filter('en-us, fr'))
+
+
+class EncodingNegotiatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.negotiator = negotiation.EncodingNegotiator([
+            hlh.Encodings.br,
+            hlh.Encodings.gzip])
+
+    def test_negotiate(self):
+        """
+        Should return the offer with the highest weight
+        """
+        for raw_accept_encoding, coding in (
+                ('gzip, deflate, br', 'br'),
+                ('GZIP', 'gzip'),
+                ('br;q=0.5, gzip', 'gzip'),
+                ('x-gzip', 'gzip'),
+                ('*', 'br'),
+                ('gzip;q=0.1, *;q=0.5', 'br'),
+                ('identity;q=1, gzip;q=0.5', 'identity'),
+                ('deflate', 'identity'),
+                ('', 'identity')):
+            self.assertEqual(
+                self.negotiator.negotiate(raw_accept_encoding), coding)
+
+    def test_not_acceptable(self):
+        """
+        Should return None when identity is excluded
+        """
+        for raw_accept_encoding in (
+                'identity;q=0',
+                '*;q=0',
+                'deflate, identity;q=0',
+                'br;q=0, gzip;q=0, *;q=0'):
+            self.assertIsNone(
+                self.negotiator.negotiate(raw_accept_encoding))
+
+        self.assertEqual(
+            self.negotiator.negotiate('*;q=0, identity'),
+            'identity')
+        self.assertEqual(
+            self.negotiator.negotiate('br;q=0, *'),
+            'gzip')
+
+    def test_missing(self):
+        """
+        Should return identity when the header is missing
+        """
+        self.assertEqual(self.negotiator.negotiate(None), 'identity')
+
+    def test_offers(self):
+        """
+        Should add identity as the last offer
+        """
+        self.assertEqual(
+            self.negotiator.offers(),
+            ('br', 'gzip', 'identity'))
+        self.assertEqual(
+            negotiation.EncodingNegotiator(['identity', 'gzip']).offers(),
+            ('identity', 'gzip'))
+
+    def test_header(self):
+        """
+        Should take the header and memoize by raw value
+        """
+        self.assertEqual(
+            self.negotiator.negotiate(hlh.AcceptEncoding([
+                (hlh.Encodings.gzip, None)])),
+            'gzip')
+        self.negotiator.negotiate(hlh.AcceptEncoding(
+            raw_values_collection=['gzip']))
+        self.negotiator.negotiate(hlh.AcceptEncoding(
+            raw_values_collection=['gzip']))
+        self.assertEqual(self.negotiator.stats()['hits'], 1)
+
+
+class CharsetNegotiatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.negotiator = negotiation.CharsetNegotiator([
+            hlh.Charsets.utf_8,
+            hlh.Charsets.iso_8859_1])
+
+    def test_lookup(self):
+        """
+        Should return the codec of IANA names and aliases
+        """
+        for charset in (
+                'UTF-8',
+                'utf8',
+                'unicode-1-1-utf-8',
+                'csUTF8'):
+            self.assertEqual(
+                negotiation.charsets.lookup(charset).name, 'utf-8')
+
+        self.assertEqual(
+            negotiation.charsets.lookup('ISO_8859-1:1987').name,
+            'iso8859-1')
+        self.assertIsNone(negotiation.charsets.lookup('foo'))
+
+    def test_negotiate(self):
+        """
+        Should return the codec of the best offer
+        """
+        for raw_accept_charset, charset in (
+                ('utf-8', 'UTF-8'),
+                ('utf8', 'UTF-8'),
+                ('unicode-1-1-utf-8', 'UTF-8'),
+                ('latin1, utf8;q=0.5', 'ISO-8859-1'),
+                ('iso-8859-5, *;q=0.1', 'UTF-8'),
+                ('utf-8;q=0, *', 'ISO-8859-1')):
+            codec = self.negotiator.negotiate(raw_accept_charset)
+            self.assertEqual(self.negotiator.charset_of(codec), charset)
+
+        self.assertIs(
+            self.negotiator.negotiate('latin1'),
+            self.negotiator.negotiate('ISO-8859-1'))
+
+    def test_not_acceptable(self):
+        """
+        Should return None when no offer is acceptable
+        """
+        for raw_accept_charset in (
+                'iso-8859-5',
+                'foo',
+                '*;q=0'):
+            self.assertIsNone(
+                self.negotiator.negotiate(raw_accept_charset))
+
+    def test_missing(self):
+        """
+        Should return the first offer when the header is missing
+        """
+        self.assertEqual(self.negotiator.negotiate(None).name, 'utf-8')
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import exceptions
+from http_lazy_headers.shared.utils import lru_cache
+from http_lazy_headers.utils import override_settings
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_evict_entries(self):
+        """
+        Should evict the least recently used entry
+        """
+        cache = lru_cache.LRUCache(max_entries=2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        self.assertEqual(cache.get('foo'), 1)
+        cache.set('baz', 3)
+        self.assertIsNone(cache.get('bar'))
+        self.assertEqual(cache.get('foo'), 1)
+        self.assertEqual(cache.get('baz'), 3)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_evict_size(self):
+        """
+        Should evict entries until the size fits
+        """
+        cache = lru_cache.LRUCache(max_entries=None, max_size=10)
+        cache.set('foo', 1, size=4)
+        cache.set('bar', 2, size=4)
+        cache.set('baz', 3, size=4)
+        self.assertNotIn('foo', cache)
+        self.assertEqual(cache.size(), 8)
+        cache.set('qux', 4, size=11)
+        self.assertNotIn('qux', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_resize(self):
+        """
+        Should change only the bounds given and evict
+        """
+        cache = lru_cache.LRUCache(max_entries=2)
+        cache.resize(max_size=100)
+        self.assertEqual(cache.max_entries, 2)
+        self.assertEqual(cache.max_size, 100)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.set('baz', 3)
+        self.assertEqual(len(cache), 2)
+        cache.resize(max_entries=1)
+        self.assertEqual(cache.max_size, 100)
+        self.assertEqual(len(cache), 1)
+        self.assertIn('baz', cache)
+        self.assertEqual(cache.evictions, 2)
+        cache.resize(max_entries=None)
+        cache.set('qux', 4, size=60)
+        cache.get('baz')
+        cache.resize(max_size=50)
+        self.assertIsNone(cache.max_entries)
+        self.assertNotIn('qux', cache)
+        self.assertIn('baz', cache)
+
+    def test_stats(self):
+        """
+        Should count hits and misses
+        """
+        cache = lru_cache.LRUCache()
+        cache.get('foo')
+        cache.set('foo', 1)
+        cache.get('foo')
+        self.assertEqual(
+            cache.stats(),
+            {'hits': 1,
+             'misses': 1,
+             'evictions': 0,
+             'entries': 1,
+             'size': 1})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = hlh.parse_cache
+        self.cache.clear()
+        self.cache.enable(hlh.Accept, hlh.Custom)
+
+    def tearDown(self):
+        self.cache.disable(hlh.Accept, hlh.Custom)
+        self.cache.clear()
+
+    def test_hit(self):
+        """
+        Should skip parsing of cached raw values
+        """
+        values = hlh.Accept(
+            raw_values_collection=['text/html']).values()
+        self.assertEqual(self.cache.misses, 1)
+        self.assertIs(
+            hlh.Accept(
+                raw_values_collection=['text/html']).values(),
+            values)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_disabled(self):
+        """
+        Should not cache disabled headers
+        """
+        hlh.Host(raw_values_collection=['example.com']).values()
+        hlh.Host(raw_values_collection=['example.com']).values()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        self.cache.disable(hlh.Accept)
+        hlh.Accept(raw_values_collection=['text/html']).values()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_name(self):
+        """
+        Should not share custom headers values
+        """
+        hlh.Custom('foo', raw_values_collection=['bar']).values()
+        hlh.Custom('baz', raw_values_collection=['bar']).values()
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_errors(self):
+        """
+        Should not cache bad values
+        """
+        self.assertRaises(
+            exceptions.HeaderError,
+            hlh.Accept(raw_values_collection=['text']).values)
+        self.assertRaises(
+            exceptions.HeaderError,
+            hlh.Accept(raw_values_collection=['text']).values)
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_dates_mode(self):
+        """
+        Should not share dates between dates modes
+        """
+        self.cache.enable(hlh.Date)
+        self.addCleanup(self.cache.disable, hlh.Date)
+        raw_date = 'Sat, 03 Sep 2016 01:02:03 GMT'
+        self.assertIsInstance(
+            hlh.Date(raw_values_collection=[raw_date]).values()[0],
+            datetime.datetime)
+
+        @override_settings(DATES_AS_EPOCH=True)
+        def epoch_values():
+            return hlh.Date(raw_values_collection=[raw_date]).values()
+
+        self.assertEqual(epoch_values(), (1472864523, ))
+
+        self.assertIsInstance(
+            hlh.Date(raw_values_collection=[raw_date]).values()[0],
+            datetime.datetime)
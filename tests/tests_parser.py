@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import asgi
+from http_lazy_headers import parser
+from http_lazy_headers import wsgi
+
+
+class GetFieldTest(unittest.TestCase):
+
+    def test_get_field(self):
+        """
+        Should return the field for any casing
+        """
+        for name in (
+                'content-type',
+                'Content-Type',
+                'CONTENT-TYPE',
+                'content-Type',
+                b'content-type',
+                b'Content-type'):
+            self.assertIs(parser.get_field(name), hlh.ContentType)
+
+        self.assertIs(
+            parser.get_field('WWW-Authenticate'), hlh.WWWAuthenticate)
+        self.assertIs(parser.get_field('TE'), hlh.TE)
+        self.assertIsNone(parser.get_field('x-foo'))
+
+
+class ToHeadersTest(unittest.TestCase):
+
+    def test_to_headers(self):
+        """
+        Should create the header fields
+        """
+        headers = parser.to_headers([
+            ('Accept', 'text/html'),
+            ('Content-Length', '100')])
+        self.assertEqual(len(headers), 2)
+        self.assertEqual(
+            headers[hlh.ContentLength([1])].values(), (100, ))
+        self.assertEqual(
+            [type(h) for h in headers],
+            [hlh.Accept, hlh.ContentLength])
+
+    def test_merge(self):
+        """
+        Should merge repeated headers
+        """
+        headers = parser.to_headers([
+            ('Allow', 'GET'),
+            ('Custom', 'foo'),
+            ('allow', 'HEAD, POST'),
+            ('CUSTOM', 'bar')])
+        self.assertEqual(len(headers), 2)
+        self.assertEqual(
+            headers[hlh.Allow(['GET'])].values(),
+            ('GET', 'HEAD', 'POST'))
+        self.assertEqual(
+            str(headers[hlh.Custom('custom', ['x'])]),
+            'custom: foo, bar')
+
+    def test_bytes(self):
+        """
+        Should take bytes names and values
+        """
+        headers = parser.to_headers([
+            (b'Content-Length', b'100'),
+            (b'X-Foo', b'bar')])
+        self.assertEqual(
+            headers[hlh.ContentLength([1])].values(), (100, ))
+        self.assertEqual(
+            headers[hlh.Custom('x-foo', ['x'])].values(), ('bar', ))
+
+
+class WSGITest(unittest.TestCase):
+
+    def test_from_wsgi(self):
+        """
+        Should create headers from WSGI headers
+        """
+        headers = wsgi.from_wsgi([
+            ('Content-Length', '100'),
+            ('Accept', 'text/html')])
+        self.assertEqual(
+            wsgi.to_wsgi(headers),
+            [('content-length', '100'),
+             ('accept', 'text/html')])
+
+    def test_from_environ(self):
+        """
+        Should create headers from a WSGI environ
+        """
+        headers = wsgi.from_environ({
+            'REQUEST_METHOD': 'GET',
+            'CONTENT_TYPE': '',
+            'CONTENT_LENGTH': '100',
+            'HTTP_ACCEPT_LANGUAGE': 'en',
+            'HTTP_X_FOO': 'bar',
+            'wsgi.version': (1, 0)})
+        self.assertEqual(
+            [type(h) for h in headers],
+            [hlh.ContentLength, hlh.AcceptLanguage, hlh.Custom])
+        self.assertEqual(
+            wsgi.to_wsgi(headers),
+            [('content-length', '100'),
+             ('accept-language', 'en'),
+             ('x-foo', 'bar')])
+
+    def test_from_environ_http_content(self):
+        """
+        Should ignore the HTTP_ prefixed content keys
+        """
+        headers = wsgi.from_environ({
+            'CONTENT_TYPE': 'text/plain',
+            'CONTENT_LENGTH': '100',
+            'HTTP_CONTENT_TYPE': 'text/html',
+            'HTTP_CONTENT_LENGTH': '200'})
+        self.assertEqual(len(headers), 2)
+        self.assertEqual(headers.get(hlh.ContentLength).values(), (100, ))
+        self.assertEqual(
+            headers.get(hlh.ContentType).values_str(), 'text/plain')
+        headers = wsgi.from_environ({
+            'CONTENT_TYPE': '',
+            'CONTENT_LENGTH': '',
+            'HTTP_CONTENT_LENGTH': '200'})
+        self.assertEqual(len(headers), 0)
+
+
+class HeaderSchemaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = parser.HeaderSchema(
+            [hlh.Accept, hlh.ContentLength],
+            customs=['x-foo'])
+        self.raw_headers = [
+            ('Accept', 'text/html'),
+            ('User-Agent', 'foo/1.0'),
+            ('X-Foo', 'bar'),
+            ('X-Bar', 'baz'),
+            ('content-length', '100')]
+
+    def test_get_field(self):
+        """
+        Should return the fields in the schema only
+        """
+        self.assertIs(self.schema.get_field('Accept'), hlh.Accept)
+        self.assertIs(self.schema.get_field(b'ACCEPT'), hlh.Accept)
+        self.assertIs(self.schema.get_field('x-Foo'), hlh.Custom)
+        self.assertIsNone(self.schema.get_field('user-agent'))
+        self.assertIsNone(self.schema.get_field('x-bar'))
+        self.assertIn(hlh.Accept, self.schema)
+
+    def test_to_headers(self):
+        """
+        Should pass through the headers outside the schema
+        """
+        headers = parser.to_headers(self.raw_headers, schema=self.schema)
+        self.assertEqual(
+            [type(h) for h in headers],
+            [hlh.Accept, hlh.Custom, hlh.ContentLength])
+        self.assertEqual(
+            headers.passthrough(),
+            (('User-Agent', 'foo/1.0'), ('X-Bar', 'baz')))
+        self.assertEqual(parser.to_headers([]).passthrough(), ())
+
+    def test_drop(self):
+        """
+        Should drop the headers outside the schema
+        """
+        schema = parser.HeaderSchema([hlh.Accept], passthrough=False)
+        headers = parser.to_headers(self.raw_headers, schema=schema)
+        self.assertEqual([type(h) for h in headers], [hlh.Accept])
+        self.assertEqual(headers.passthrough(), ())
+
+    def test_from_environ(self):
+        """
+        Should pass through the environ headers outside the schema
+        """
+        headers = wsgi.from_environ({
+            'CONTENT_LENGTH': '100',
+            'CONTENT_TYPE': 'text/plain',
+            'HTTP_X_FOO': 'bar',
+            'HTTP_X_BAR': 'baz'}, schema=self.schema)
+        self.assertEqual(
+            [type(h) for h in headers],
+            [hlh.ContentLength, hlh.Custom])
+        self.assertEqual(
+            headers.passthrough(),
+            (('content-type', 'text/plain'), ('x-bar', 'baz')))
+
+    def test_from_asgi(self):
+        """
+        Should create headers from ASGI headers
+        """
+        headers = asgi.from_scope({
+            'type': 'http',
+            'headers': [
+                (b'accept', b'text/html'),
+                (b'user-agent', b'foo/1.0')]}, schema=self.schema)
+        self.assertEqual([type(h) for h in headers], [hlh.Accept])
+        self.assertEqual(
+            headers.passthrough(), ((b'user-agent', b'foo/1.0'), ))
+        self.assertEqual(
+            asgi.to_asgi(headers), [(b'accept', b'text/html')])
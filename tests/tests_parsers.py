@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from http_lazy_headers import exceptions
+from http_lazy_headers.shared.utils import parsers
+
+
+class FromRawTest(unittest.TestCase):
+
+    def test_split(self):
+        """
+        Should split plain values
+        """
+        self.assertEqual(
+            list(parsers.from_raw('foo, bar ,baz', max_values=10)),
+            ['foo', 'bar', 'baz'])
+        self.assertEqual(
+            list(parsers.from_raw('', max_values=10)), [''])
+        self.assertEqual(
+            list(parsers.from_raw(',', max_values=10)), ['', ''])
+
+    def test_quoted_string(self):
+        """
+        Should not split quoted-strings
+        """
+        self.assertEqual(
+            list(parsers.from_raw(
+                'foo="a, b", bar, baz="x\\", y"', max_values=10)),
+            ['foo="a, b"', 'bar', 'baz="x\\", y"'])
+
+    def test_comment(self):
+        """
+        Should not split nested comments
+        """
+        self.assertEqual(
+            list(parsers.from_raw(
+                'foo (a (b c) \\( d) bar', max_values=10, separator=' ')),
+            ['foo', '(a (b c) \\( d)', 'bar'])
+
+    def test_bytes(self):
+        """
+        Should split bytes into bytes
+        """
+        self.assertEqual(
+            list(parsers.from_raw(b'foo, "a, b"', max_values=10)),
+            [b'foo', b'"a, b"'])
+        self.assertEqual(
+            list(parsers.from_raw(b'foo, bar', max_values=10)),
+            [b'foo', b'bar'])
+
+    def test_max_values(self):
+        """
+        Should raise on too many values
+        """
+        self.assertEqual(
+            list(parsers.from_raw('a,b,', max_values=2)),
+            ['a', 'b', ''])
+        self.assertRaises(
+            exceptions.BadRequest,
+            lambda: list(parsers.from_raw('a,b,c', max_values=2)))
+        self.assertRaises(
+            exceptions.BadRequest,
+            lambda: list(parsers.from_raw('"a",b,c', max_values=2)))
+
+
+class ScanTest(unittest.TestCase):
+
+    def test_offsets(self):
+        """
+        Should return the values offsets
+        """
+        self.assertEqual(
+            parsers.scan('foo, "bar, baz" ,qux', max_values=10),
+            [(0, 3), (5, 15), (17, 20)])
+        self.assertEqual(
+            parsers.scan(b' (a, b) ', max_values=10),
+            [(1, 7)])
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+
+from http_lazy_headers import exceptions
+from http_lazy_headers import parser
+from http_lazy_headers import preconditions
+from http_lazy_headers.shared.common import dates
+from http_lazy_headers.utils import override_settings
+
+
+_LAST_MODIFIED = datetime.datetime(2016, 9, 3, 1, 2, 3)
+_ETAG = ('xyzzy', False)
+
+
+def _evaluate(raw_headers, method='GET', **kwargs):
+    kwargs.setdefault('etag', _ETAG)
+    kwargs.setdefault('last_modified', _LAST_MODIFIED)
+    return preconditions.evaluate_preconditions(
+        parser.to_headers(raw_headers),
+        method=method,
+        **kwargs)
+
+
+class EvaluatePreconditionsTest(unittest.TestCase):
+
+    def test_no_conditions(self):
+        """
+        Should proceed when there are no conditions
+        """
+        self.assertIsNone(_evaluate([]))
+
+    def test_if_match(self):
+        """
+        Should fail when no e-tag matches strongly
+        """
+        self.assertIsNone(_evaluate([('If-Match', '"foo", "xyzzy"')]))
+        self.assertIsNone(_evaluate([('If-Match', '*')]))
+        self.assertEqual(
+            _evaluate([('If-Match', '"foo"')], method='PUT'),
+            preconditions.PRECONDITION_FAILED)
+        self.assertEqual(
+            _evaluate([('If-Match', 'W/"xyzzy"')]),
+            preconditions.PRECONDITION_FAILED)
+        self.assertEqual(
+            _evaluate([('If-Match', '"xyzzy"')], etag=('xyzzy', True)),
+            preconditions.PRECONDITION_FAILED)
+        self.assertEqual(
+            _evaluate([('If-Match', '"xyzzy"')], etag=None),
+            preconditions.PRECONDITION_FAILED)
+        self.assertEqual(
+            _evaluate([('If-Match', '*')], exists=False),
+            preconditions.PRECONDITION_FAILED)
+
+    def test_if_unmodified_since(self):
+        """
+        Should fail when modified since the date
+        """
+        self.assertIsNone(_evaluate([
+            ('If-Unmodified-Since', 'Sat, 03 Sep 2016 01:02:03 GMT')]))
+        self.assertEqual(
+            _evaluate([
+                ('If-Unmodified-Since', 'Sat, 03 Sep 2016 01:02:02 GMT')]),
+            preconditions.PRECONDITION_FAILED)
+        self.assertIsNone(_evaluate([('If-Unmodified-Since', 'foo')]))
+        self.assertIsNone(_evaluate(
+            [('If-Unmodified-Since', 'Sat, 03 Sep 2016 01:02:02 GMT')],
+            last_modified=None))
+
+    def test_if_match_precedence(self):
+        """
+        Should ignore If-Unmodified-Since when there is If-Match
+        """
+        self.assertIsNone(_evaluate([
+            ('If-Match', '"xyzzy"'),
+            ('If-Unmodified-Since', 'Sat, 03 Sep 2016 01:02:02 GMT')]))
+
+    def test_if_none_match(self):
+        """
+        Should not modify when an e-tag matches weakly
+        """
+        self.assertEqual(
+            _evaluate([('If-None-Match', 'W/"xyzzy"')]),
+            preconditions.NOT_MODIFIED)
+        self.assertEqual(
+            _evaluate([('If-None-Match', '"xyzzy"')], method='HEAD'),
+            preconditions.NOT_MODIFIED)
+        self.assertEqual(
+            _evaluate([('If-None-Match', '*')], method='PUT'),
+            preconditions.PRECONDITION_FAILED)
+        self.assertIsNone(_evaluate([('If-None-Match', '"foo"')]))
+        self.assertIsNone(
+            _evaluate([('If-None-Match', '*')], exists=False))
+
+    def test_if_modified_since(self):
+        """
+        Should not modify when not modified since the date
+        """
+        self.assertEqual(
+            _evaluate([
+                ('If-Modified-Since', 'Sat, 03 Sep 2016 01:02:03 GMT')]),
+            preconditions.NOT_MODIFIED)
+        self.assertIsNone(_evaluate([
+            ('If-Modified-Since', 'Sat, 03 Sep 2016 01:02:02 GMT')]))
+        self.assertIsNone(_evaluate(
+            [('If-Modified-Since', 'Sat, 03 Sep 2016 01:02:03 GMT')],
+            method='POST'))
+        self.assertIsNone(_evaluate([('If-Modified-Since', 'foo')]))
+
+    def test_if_none_match_precedence(self):
+        """
+        Should ignore If-Modified-Since when there is If-None-Match
+        """
+        self.assertIsNone(_evaluate([
+            ('If-None-Match', '"foo"'),
+            ('If-Modified-Since', 'Sat, 03 Sep 2016 01:02:03 GMT')]))
+
+    def test_first_failing(self):
+        """
+        Should stop at the first failing header
+        """
+        headers = parser.to_headers([
+            ('If-Match', '"foo"'),
+            ('If-None-Match', 'bad')])
+        self.assertEqual(
+            preconditions.evaluate_preconditions(headers, etag=_ETAG),
+            preconditions.PRECONDITION_FAILED)
+        self.assertRaises(
+            exceptions.HeaderError,
+            preconditions.evaluate_preconditions,
+            parser.to_headers([('If-None-Match', 'bad')]),
+            etag=_ETAG)
+
+    @override_settings(DATES_AS_EPOCH=True)
+    def test_epoch(self):
+        """
+        Should compare dates in epoch mode
+        """
+        self.assertEqual(
+            _evaluate([
+                ('If-Modified-Since', 'Sat, 03 Sep 2016 01:02:03 GMT')]),
+            preconditions.NOT_MODIFIED)
+        self.assertIsNone(_evaluate(
+            [('If-Modified-Since', 'Sat, 03 Sep 2016 01:02:02 GMT')],
+            last_modified=dates.to_epoch(_LAST_MODIFIED)))
+
+
+class IsRangeFreshTest(unittest.TestCase):
+
+    def test_is_range_fresh(self):
+        """
+        Should match the e-tag or exact date
+        """
+        for raw_if_range, is_fresh in (
+                ('"xyzzy"', True),
+                ('"foo"', False),
+                ('W/"xyzzy"', False),
+                ('Sat, 03 Sep 2016 01:02:03 GMT', True),
+                ('Sat, 03 Sep 2016 01:02:02 GMT', False),
+                ('foo', False)):
+            self.assertEqual(
+                preconditions.is_range_fresh(
+                    parser.to_headers([('If-Range', raw_if_range)]),
+                    etag=_ETAG,
+                    last_modified=_LAST_MODIFIED),
+                is_fresh)
+
+    def test_no_if_range(self):
+        """
+        Should be fresh when there is no If-Range
+        """
+        self.assertTrue(preconditions.is_range_fresh(
+            parser.to_headers([])))
+        self.assertFalse(preconditions.is_range_fresh(
+            parser.to_headers([('If-Range', '"xyzzy"')])))
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import static
+from http_lazy_headers.fields import cache_control
+from http_lazy_headers.utils import override_settings
+
+
+def _write(path, data):
+    with open(path, 'wb') as fh:
+        fh.write(data)
+
+
+class StaticIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.root, 'css'))
+        os.mkdir(os.path.join(self.root, '.git'))
+        _write(os.path.join(self.root, 'index.html'), b'<html></html>')
+        _write(os.path.join(self.root, 'css', 'app.css'), b'body {}')
+        _write(os.path.join(self.root, 'data.foo'), b'foo')
+        _write(os.path.join(self.root, '.git', 'config'), b'')
+        os.utime(
+            os.path.join(self.root, 'index.html'),
+            ns=(1472864523000000000, 1472864523000000000))
+        self.index = static.StaticIndex(
+            self.root,
+            cache_control=hlh.CacheControl([
+                cache_control.cache_control(max_age=60)]),
+            charset='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_keys(self):
+        """
+        Should index every file but the hidden ones
+        """
+        self.assertEqual(
+            set(self.index.keys()),
+            {'/index.html', '/css/app.css', '/data.foo'})
+        self.assertIn('/index.html', self.index)
+        self.assertIsNone(self.index.get('/.git/config'))
+
+    def test_symlinks(self):
+        """
+        Should follow symlinks but not loops
+        """
+        os.symlink(self.root, os.path.join(self.root, 'css', 'loop'))
+        os.symlink(
+            os.path.join(self.root, 'css'),
+            os.path.join(self.root, 'styles'))
+        self.index.refresh()
+        self.assertEqual(
+            set(self.index.keys()),
+            {'/index.html',
+             '/css/app.css',
+             '/styles/app.css',
+             '/data.foo'})
+
+    def test_headers(self):
+        """
+        Should serialize the headers of every file
+        """
+        static_file = self.index.get('/index.html')
+        self.assertEqual(
+            static_file.headers.to_bytes(),
+            b'content-type: text/html; charset=utf-8\r\n'
+            b'content-length: 13\r\n'
+            b'last-modified: Sat, 03 Sep 2016 01:02:03 GMT\r\n'
+            b'etag: "' + '{:x}-d'.format(
+                1472864523000000000).encode('ascii') + b'"\r\n'
+            b'accept-ranges: bytes\r\n'
+            b'cache-control: max-age=60\r\n'
+            b'\r\n')
+        self.assertEqual(
+            static_file.path,
+            os.path.join(self.root, 'index.html'))
+        self.assertFalse(static_file.etag[1])
+
+    def test_content_type(self):
+        """
+        Should guess the content type from the extension
+        """
+        self.assertEqual(
+            self.index.get('/css/app.css').headers[hlh.ContentType]
+            .values()[0][0],
+            ('text', 'css'))
+        self.assertEqual(
+            self.index.get('/data.foo').headers[hlh.ContentType]
+            .values()[0][0],
+            ('application', 'octet-stream'))
+
+        index = static.StaticIndex(
+            self.root, content_types={'.foo': 'application/x-foo'})
+        self.assertEqual(
+            str(index.get('/data.foo').headers[hlh.ContentType]),
+            'content-type: application/x-foo')
+
+    def test_refresh(self):
+        """
+        Should rebuild the modified files only
+        """
+        index_html = self.index.get('/index.html')
+        self.assertEqual(self.index.refresh(), set())
+        self.assertIs(self.index.get('/index.html'), index_html)
+
+        _write(os.path.join(self.root, 'index.html'), b'<html>!</html>')
+        _write(os.path.join(self.root, 'new.txt'), b'new')
+        os.remove(os.path.join(self.root, 'data.foo'))
+
+        self.assertEqual(
+            self.index.refresh(),
+            {'/index.html', '/new.txt', '/data.foo'})
+        self.assertNotEqual(
+            self.index.get('/index.html').etag,
+            index_html.etag)
+        self.assertEqual(self.index.get('/index.html').size, 14)
+        self.assertIn('/new.txt', self.index)
+        self.assertNotIn('/data.foo', self.index)
+
+    @override_settings(DATES_AS_EPOCH=True)
+    def test_epoch(self):
+        """
+        Should follow the dates mode
+        """
+        index = static.StaticIndex(self.root)
+        self.assertEqual(
+            index.get('/index.html').last_modified,
+            1472864523)
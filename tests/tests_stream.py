@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import exceptions
+from http_lazy_headers import parser
+from http_lazy_headers import stream
+from http_lazy_headers import wsgi
+from http_lazy_headers.utils import override_settings
+
+
+_BLOCK = (
+    b'Host: example.com\r\n'
+    b'Accept:text/html \r\n'
+    b'X-Foo: bar\r\n'
+    b'accept: application/json\r\n'
+    b'\r\n'
+    b'body')
+
+_ACCEPT = hlh.Accept(raw_values_collection=['*/*'])
+
+
+class HeadersParserTest(unittest.TestCase):
+
+    def assertBlock(self, headers):
+        self.assertEqual(
+            wsgi.to_wsgi(headers),
+            [('host', 'example.com'),
+             ('accept', 'text/html, application/json'),
+             ('x-foo', 'bar')])
+
+    def test_feed(self):
+        """
+        Should parse the whole block
+        """
+        headers_parser = stream.HeadersParser()
+        self.assertBlock(headers_parser.feed(_BLOCK))
+        self.assertTrue(headers_parser.is_done())
+        self.assertEqual(headers_parser.rest(), b'body')
+
+    def test_feed_chunks(self):
+        """
+        Should parse the block fed in any chunk sizes
+        """
+        for size in range(1, 8):
+            headers_parser = stream.HeadersParser()
+            chunks = [
+                _BLOCK[i:i + size]
+                for i in range(0, len(_BLOCK), size)]
+            results = [
+                headers_parser.feed(chunk)
+                for chunk in chunks
+                if not headers_parser.is_done()]
+            self.assertTrue(all(r is None for r in results[:-1]))
+            self.assertBlock(results[-1])
+            self.assertTrue(b'body'.startswith(headers_parser.rest()))
+
+    def test_bare_lf(self):
+        """
+        Should allow bare LF line endings
+        """
+        headers_parser = stream.HeadersParser()
+        headers = headers_parser.feed(b'Age: 10\nX-Foo: bar\n\n')
+        self.assertEqual(
+            [type(h) for h in headers],
+            [hlh.Age, hlh.Custom])
+
+    def test_empty(self):
+        """
+        Should allow an empty block
+        """
+        headers_parser = stream.HeadersParser()
+        self.assertEqual(len(headers_parser.feed(b'\r\n')), 0)
+
+    def test_bad_lines(self):
+        """
+        Should reject malformed lines
+        """
+        for block in (
+                b'Host: example.com\r\n  foo\r\n\r\n',
+                b'Host : example.com\r\n\r\n',
+                b'Host example.com\r\n\r\n',
+                b': example.com\r\n\r\n'):
+            headers_parser = stream.HeadersParser()
+            self.assertRaises(
+                exceptions.BadRequest,
+                headers_parser.feed,
+                block)
+
+    @override_settings(HEADER_MAX_LEN=10)
+    def test_line_too_long(self):
+        """
+        Should reject long lines before they end
+        """
+        headers_parser = stream.HeadersParser()
+        self.assertIsNone(headers_parser.feed(b'Age: 10\r\n'))
+
+        with self.assertRaises(exceptions.HeaderError) as cm:
+            headers_parser.feed(b'X-Foo: barbaz')
+
+        self.assertEqual(cm.exception.status, 431)
+
+    @override_settings(HEADERS_MAX_LEN=20)
+    def test_block_too_long(self):
+        """
+        Should reject long blocks
+        """
+        headers_parser = stream.HeadersParser()
+        self.assertIsNone(headers_parser.feed(b'Age: 10\r\n'))
+
+        with self.assertRaises(exceptions.HeaderError) as cm:
+            headers_parser.feed(b'Age: 10\r\nAge: 10\r\n')
+
+        self.assertEqual(cm.exception.status, 431)
+
+
+class BufferedHeadersTest(unittest.TestCase):
+
+    def setUp(self):
+        headers_parser = stream.HeadersParser()
+        self.headers = headers_parser.feed(_BLOCK)
+
+    def test_lookup(self):
+        """
+        Should create only the headers looked up
+        """
+        self.assertIsInstance(self.headers, stream.BufferedHeaders)
+        self.assertEqual(
+            str(self.headers[_ACCEPT]),
+            'accept: text/html, application/json')
+        self.assertEqual(
+            self.headers.get(hlh.Custom('X-Foo', ['x'])).values(),
+            ('bar', ))
+        self.assertIs(self.headers[hlh.Accept], self.headers[_ACCEPT])
+        self.assertIs(self.headers['host'], self.headers[hlh.Host])
+        self.assertNotIn(hlh.Age, self.headers)
+        self.assertNotIn('x-bar', self.headers)
+        self.assertIsNone(self.headers.get(hlh.Age([1])))
+        self.assertEqual(len(self.headers._headers), 3)
+        self.assertIs(
+            self.headers[_ACCEPT],
+            self.headers[_ACCEPT])
+
+    def test_iter(self):
+        """
+        Should create every header in order
+        """
+        accept = self.headers[_ACCEPT]
+        self.assertTrue(self.headers)
+        self.assertEqual(len(self.headers), 3)
+        self.assertEqual(
+            [type(h) for h in self.headers],
+            [hlh.Host, hlh.Accept, hlh.Custom])
+        self.assertIs(list(self.headers)[1], accept)
+
+    def test_bad_name(self):
+        """
+        Should reject bad names once created
+        """
+        headers_parser = stream.HeadersParser()
+        headers = headers_parser.feed(b'Age: 1\r\nX@Foo: bar\r\n\r\n')
+        self.assertEqual(headers[hlh.Age([1])].values(), (1, ))
+        self.assertRaises(exceptions.BadRequest, list, headers)
+
+    def test_schema(self):
+        """
+        Should create the headers in the schema only
+        """
+        headers_parser = stream.HeadersParser(
+            schema=parser.HeaderSchema([hlh.Accept, hlh.Age]))
+        headers = headers_parser.feed(_BLOCK)
+        self.assertIsNone(headers.get(hlh.Host))
+        self.assertIsNone(headers.get('x-foo'))
+        self.assertIsNotNone(headers.get('accept'))
+        self.assertEqual([type(h) for h in headers], [hlh.Accept])
+        self.assertEqual(
+            headers.passthrough(),
+            ((b'Host', b'example.com'), (b'X-Foo', b'bar')))
+
+    def test_non_letter_names(self):
+        """
+        Should find names starting with a non-letter
+        """
+        headers_parser = stream.HeadersParser()
+        headers = headers_parser.feed(
+            b'_Foo: bar\r\n1-Bar: baz\r\n\r\n')
+        self.assertIn('_foo', headers)
+        self.assertEqual(headers.get('_foo').values(), ('bar', ))
+        self.assertEqual(headers.get('1-bar').values(), ('baz', ))
+        self.assertIsNone(headers.get('_bar'))
+
+    def test_bad_keys(self):
+        """
+        Should miss empty and non-ascii names
+        """
+        self.assertIsNone(self.headers.get(''))
+        self.assertNotIn('', self.headers)
+        self.assertIsNone(self.headers.get('ñ'))
+        self.assertNotIn('ñ', self.headers)
+
+    def test_bool_schema(self):
+        """
+        Should be false when no header is in the schema
+        """
+        headers_parser = stream.HeadersParser(
+            schema=parser.HeaderSchema([hlh.Age]))
+        headers = headers_parser.feed(_BLOCK)
+        self.assertEqual(len(headers), 0)
+        self.assertFalse(headers)
+        headers_parser = stream.HeadersParser(
+            schema=parser.HeaderSchema([hlh.Accept]))
+        self.assertTrue(headers_parser.feed(_BLOCK))
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import http_lazy_headers as hlh
+from http_lazy_headers import exceptions
+from http_lazy_headers import views
+from http_lazy_headers import wsgi
+
+
+class RequestHeadersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.headers = views.RequestHeaders(wsgi.from_environ({
+            'CONTENT_LENGTH': '100',
+            'HTTP_FROM': 'foo@example.com',
+            'HTTP_IF_NONE_MATCH': '"abc"',
+            'HTTP_X_FOO': 'bar'}))
+
+    def test_properties(self):
+        """
+        Should return the parsed values
+        """
+        self.assertEqual(self.headers.content_length, (100, ))
+        self.assertEqual(self.headers.from_, ('foo@example.com', ))
+        self.assertEqual(
+            self.headers.if_none_match, (('abc', False), ))
+        self.assertIsNone(self.headers.accept)
+        self.assertEqual(self.headers.custom('x-foo'), ('bar', ))
+        self.assertIsNone(self.headers.custom('x-bar'))
+
+    def test_lazy(self):
+        """
+        Should parse on first access only
+        """
+        self.assertIs(
+            self.headers.content_length,
+            self.headers.content_length)
+        self.assertEqual(self.headers._content_length, (100, ))
+        self.assertRaises(AttributeError, getattr, self.headers, '_host')
+        self.assertIsNone(self.headers.host)
+        self.assertIsNone(self.headers._host)
+
+    def test_slots(self):
+        """
+        Should not have a dict
+        """
+        self.assertFalse(hasattr(self.headers, '__dict__'))
+
+    def test_error(self):
+        """
+        Should raise on bad values
+        """
+        headers = views.RequestHeaders(
+            wsgi.from_environ({'CONTENT_LENGTH': 'foo'}))
+        self.assertRaises(
+            exceptions.HeaderError,
+            getattr, headers, 'content_length')
+
+
+class MakeViewTest(unittest.TestCase):
+
+    def test_make_view(self):
+        """
+        Should create a view for the given fields
+        """
+        view = views.make_view('View', [hlh.Age, hlh.WWWAuthenticate])
+        self.assertEqual(
+            view.__slots__, ('_age', '_www_authenticate'))
+        headers = view(wsgi.from_environ({'HTTP_AGE': '10'}))
+        self.assertEqual(headers.age, (10, ))
+        self.assertIsNone(headers.www_authenticate)
+        self.assertFalse(hasattr(headers, 'accept'))